@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import argparse
 import concurrent.futures
-import json
 import logging
 import os
 import random
@@ -10,6 +9,7 @@ import sys
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, List, Optional, Set, Tuple
 
+from . import json_utils
 from .config import (
     ALIGN_RECIPES_WITH_SITES,
     ALIGN_SITES_BASELINE_FILE,
@@ -88,23 +88,27 @@ def process_retry_queue(
     pending = list(storage.retry_queue.items())
     logger.info(f"🔁 Processing Retry Queue: {len(pending)} URL(s)")
 
+    retry_urls = []
     for url, meta in pending:
-        url_key = canonicalize_url(url) or url
-        attempts = int(meta.get("attempts", 0))
+        attempts = meta.attempts
         if attempts >= MAX_RETRY_ATTEMPTS:
             logger.warning(f"   ❌ Giving up after {attempts} attempts: {url}")
+            url_key = canonicalize_url(url) or url
             storage.remove_retry(url_key)
             storage.add_reject(url_key)
             continue
+        retry_urls.append(url)
 
-        rate_limiter.wait_if_needed(url)
-        is_recipe, _, verify_error, verify_transient = verifier.verify_recipe(url)
+    # Queued URLs span many sites, so their pages are fetched concurrently;
+    # the rate limiter still spaces out requests to the same domain.
+    verified = verifier.verify_recipes_batch(retry_urls, before_fetch=rate_limiter.wait_if_needed)
+    for url, (is_recipe, _, verify_error, verify_transient) in verified:
+        url_key = canonicalize_url(url) or url
 
         if not is_recipe:
             if verify_transient:
                 storage.add_retry(url_key, verify_error or "Transient verification failure", increment=True)
-                queue_entry = storage.retry_queue.get(url_key, {})
-                attempts_now = int(queue_entry.get("attempts", 0))
+                attempts_now = storage.retry_attempts(url_key)
                 if attempts_now >= MAX_RETRY_ATTEMPTS:
                     logger.warning(f"   ❌ Max retries reached [verify], rejecting: {url}")
                     storage.remove_retry(url_key)
@@ -123,8 +127,7 @@ def process_retry_queue(
 
         if import_transient:
             storage.add_retry(url_key, import_error or "Transient import failure", increment=True)
-            queue_entry = storage.retry_queue.get(url_key, {})
-            attempts_now = int(queue_entry.get("attempts", 0))
+            attempts_now = storage.retry_attempts(url_key)
             if attempts_now >= MAX_RETRY_ATTEMPTS:
                 logger.warning(f"   ❌ Max retries reached [import], rejecting: {url}")
                 storage.remove_retry(url_key)
@@ -154,8 +157,7 @@ def load_sites_from_source(source_path: Optional[str] = None) -> List[str]:
     if source_path:
         if os.path.exists(source_path):
             try:
-                with open(source_path, "r", encoding="utf-8") as handle:
-                    data = json.load(handle)
+                data = json_utils.loads(Path(source_path).read_bytes())
                 return _parse_sites_json(data)
             except Exception as exc:
                 logger.error(f"Failed to load CLI sites file: {exc}")
@@ -168,8 +170,7 @@ def load_sites_from_source(source_path: Optional[str] = None) -> List[str]:
 
         if os.path.exists(sites_env):
             try:
-                with open(sites_env, "r", encoding="utf-8") as handle:
-                    data = json.load(handle)
+                data = json_utils.loads(Path(sites_env).read_bytes())
                 return _parse_sites_json(data)
             except Exception as exc:
                 logger.error(f"Failed to load sites file from SITES={sites_env}: {exc}")
@@ -179,8 +180,7 @@ def load_sites_from_source(source_path: Optional[str] = None) -> List[str]:
 
     if os.path.exists("sites.json"):
         try:
-            with open("sites.json", "r", encoding="utf-8") as handle:
-                data = json.load(handle)
+            data = json_utils.loads(Path("sites.json").read_bytes())
             return _parse_sites_json(data)
         except Exception as exc:
             logger.warning(f"Failed to load sites.json: {exc}")
@@ -356,6 +356,7 @@ def run(args: argparse.Namespace) -> int:
     crawler = SitemapCrawler(session, storage)
     verifier = RecipeVerifier(session)
     importer = ImportManager(session, storage, rate_limiter, dry_run_mode)
+    importer.warm_up()
 
     process_retry_queue(storage, verifier, importer, rate_limiter)
     def handle_import_result(
@@ -375,10 +376,9 @@ def run(args: argparse.Namespace) -> int:
         if import_transient:
             storage.add_retry(url_key, import_error or "Transient import failure", increment=True)
             if not TQDM_AVAILABLE:
-                queue_entry = storage.retry_queue.get(url_key, {})
                 logger.warning(
                     f"   ↻ Transient import failure queued for retry "
-                    f"({queue_entry.get('attempts', 0)}/{MAX_RETRY_ATTEMPTS}): {url}"
+                    f"({storage.retry_attempts(url_key)}/{MAX_RETRY_ATTEMPTS}): {url}"
                 )
         else:
             storage.add_reject(url_key)
@@ -511,10 +511,9 @@ def run(args: argparse.Namespace) -> int:
                     if is_transient:
                         storage.add_retry(url_key, error or "Transient verification failure", increment=True)
                         if not TQDM_AVAILABLE:
-                            queue_entry = storage.retry_queue.get(url_key, {})
                             logger.warning(
                                 f"   ↻ Transient verification failure queued for retry "
-                                f"({queue_entry.get('attempts', 0)}/{MAX_RETRY_ATTEMPTS}): {url}"
+                                f"({storage.retry_attempts(url_key)}/{MAX_RETRY_ATTEMPTS}): {url}"
                             )
                     else:
                         if not TQDM_AVAILABLE:
@@ -537,10 +536,14 @@ def run(args: argparse.Namespace) -> int:
                 )
 
             storage.flush_all()
+            rate_limiter.save()
 
     finally:
         if import_executor is not None:
             import_executor.shutdown(wait=False, cancel_futures=True)
+        # Fold the imported/rejects journals back into their JSON snapshots
+        # so other tools (the cleaner) read a complete file between cycles.
+        storage.flush_all(compact=True)
 
     if not killer.kill_now:
         print_summary(storage)
@@ -1,15 +1,19 @@
 import concurrent.futures
-import json
+import contextlib
+import functools
+import itertools
 import logging
 import os
 import re
 import sys
+import threading
 import time
+from collections import defaultdict
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Set, Tuple
-from urllib.parse import urlparse
+from typing import Any, DefaultDict, Dict, List, Literal, Optional, Set, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .config import (
     CLEANER_DEDUPE_BY_SOURCE,
@@ -19,19 +23,27 @@ from .config import (
     LANGUAGE_DETECTION_STRICT,
     LANGUAGE_FILTER_ENABLED,
     LANGUAGE_MIN_CONFIDENCE,
-    LISTICLE_REGEX,
     LISTICLE_TITLE_REGEX,
     MEALIE_API_TOKEN,
     MEALIE_ENABLED,
     MEALIE_IMPORT_TIMEOUT,
     MEALIE_URL,
     NON_RECIPE_DIGEST_REGEX,
-    NUMBERED_COLLECTION_REGEX,
     TARGET_LANGUAGE,
 )
-from .language import detect_language_from_recipe_payload
+from . import json_utils
+from .language import detect_language_from_recipe_payload, is_obvious_english_payload, warm_language_detector
 from .logging_utils import configure_logging
-from .url_utils import canonicalize_url, has_numeric_suffix, numeric_suffix_value, strip_numeric_suffix
+from .paging_utils import iter_prefetched
+from .regex_utils import RE2_AVAILABLE, compile_gate
+from .url_utils import canonicalize_url, has_numeric_suffix, numeric_suffix_value, strip_numeric_suffix, url_slug
+
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 DRY_RUN = os.getenv("DRY_RUN", "true").lower() == "true"
 MAX_WORKERS = int(os.getenv("MAX_WORKERS", 2))
@@ -40,6 +52,11 @@ CLEANER_API_TIMEOUT = max(5, int(os.getenv("CLEANER_API_TIMEOUT", str(MEALIE_IMP
 CLEANER_API_RETRIES = max(1, int(os.getenv("CLEANER_API_RETRIES", "3")))
 CLEANER_RECIPES_PER_PAGE = max(50, int(os.getenv("CLEANER_RECIPES_PER_PAGE", "250")))
 CLEANER_PAGE_RETRY_DELAY = max(0.0, float(os.getenv("CLEANER_PAGE_RETRY_DELAY", "1.5")))
+CLEANER_PAGE_PREFETCH = max(1, int(os.getenv("CLEANER_PAGE_PREFETCH", "4")))
+CLEANER_QUERY_FILTER = os.getenv("CLEANER_QUERY_FILTER", "").strip()
+CLASSIFY_CACHE_SIZE = max(0, int(os.getenv("CLEANER_CLASSIFY_CACHE_SIZE", "65536")))
+BULK_DELETE_BATCH_SIZE = 100
+RECIPE_RESOURCE_PREFIX = f"{MEALIE_URL}/api/recipes/"
 REJECT_FILE = DATA_DIR / "rejects.json"
 VERIFIED_FILE = DATA_DIR / "verified.json"
 
@@ -76,6 +93,52 @@ HIGH_RISK_KEYWORDS = [
     "detox water",
     "lose weight",
 ]
+# One alternation pass replaces a substring scan per keyword; the rank map keeps
+# the reported keyword stable (earliest list entry wins, as before). The
+# lookahead tries every start position, so overlapping keywords ("store" and
+# "review" in "storeview") are all seen; at each position the alternation
+# yields the earliest-listed keyword that starts there.
+HIGH_RISK_REGEX = re.compile("(?=(" + "|".join(re.escape(keyword) for keyword in HIGH_RISK_KEYWORDS) + "))")
+HIGH_RISK_KEYWORD_RANK = {keyword: index for index, keyword in enumerate(HIGH_RISK_KEYWORDS)}
+# LISTICLE_TITLE_REGEX's ".*" between a number and a noun backtracks
+# quadratically on long names that contain both in the wrong order. With RE2
+# installed a linear-time scan screens the text first; compile_gate keeps
+# \d Unicode-aware there, so non-ASCII digits still reach the full check.
+LISTICLE_GATE_RE = compile_gate(LISTICLE_TITLE_REGEX.pattern) if RE2_AVAILABLE else None
+
+
+def _build_high_risk_automaton() -> Any:
+    automaton = ahocorasick.Automaton()
+    for keyword in HIGH_RISK_KEYWORDS:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+# With pyahocorasick installed, one automaton pass tells whether any keyword
+# occurs at all. It only gates the regex: the automaton also reports
+# overlapping hits that findall skips, which could change the reported one.
+HIGH_RISK_AUTOMATON = _build_high_risk_automaton() if AHOCORASICK_AVAILABLE else None
+
+# Every LISTICLE_TITLE_REGEX match ends in one of these nouns; a plain
+# substring test rules out most real recipe names before the regex runs.
+LISTICLE_NOUNS = (
+    "recipes",
+    "meals",
+    "dishes",
+    "ideas",
+    "desserts",
+    "appetizers",
+    "snacks",
+    "soups",
+    "salads",
+    "sides",
+    "cocktails",
+    "drinks",
+)
+
+UTILITY_URL_MARKERS = ("privacy-policy", "contact", "about-us", "login", "cart")
+UTILITY_URL_RE = re.compile("|".join(re.escape(marker) for marker in UTILITY_URL_MARKERS))
 
 INSTRUCTION_PLACEHOLDERS = (
     "could not detect instructions",
@@ -84,29 +147,95 @@ INSTRUCTION_PLACEHOLDERS = (
     "instruction unavailable",
     "no instructions",
 )
+INSTRUCTION_PLACEHOLDER_RE = re.compile("|".join(re.escape(marker) for marker in INSTRUCTION_PLACEHOLDERS))
+# "recipe for", "how to" and "cook"/"make" prefixes, stripped in that order
+# by one anchored match instead of three successive substitutions.
+NAME_PREFIX_RE = re.compile(r"^(?:recipe for\s+)?(?:how to\s+)?(?:(?:cook|make)\s+)?", re.IGNORECASE)
+RECIPE_SUFFIX_RE = re.compile(r"\b(recipe)\b$", re.IGNORECASE)
+# Joins slug and name so unanchored patterns scan both in one pass: "." cannot
+# cross the newlines and "\s*" cannot cross the NUL, so matches stay in one text.
+COMBINED_TEXT_SEPARATOR = "\n\x00\n"
+
+# List-payload fields any cleaner phase reads (identity, source URL, integrity
+# and language checks). Everything else Mealie returns is dropped per page.
+RECIPE_LIST_FIELDS = (
+    "id",
+    "recipeId",
+    "slug",
+    "name",
+    "orgURL",
+    "originalURL",
+    "source",
+    "description",
+    "subtitle",
+    "recipeYield",
+    "recipeIngredient",
+    "recipeInstructions",
+    "language",
+    "recipeLanguage",
+    "inLanguage",
+    "orgLanguage",
+    "originalLanguage",
+)
 
 logger = logging.getLogger("cleaner")
+
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    # Keep-alive pool sized for the Phase 2 workers plus page prefetch. Retries
+    # stay explicit in the callers because Mealie reports missing recipes as
+    # HTTP 500 NoResultFound, which must not be retried blindly.
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=max(10, MAX_WORKERS * 4, CLEANER_PAGE_PREFETCH), max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["Authorization"] = f"Bearer {MEALIE_API_TOKEN}"
+    # Mealie gzips large JSON responses; pin the negotiation explicitly (it also
+    # picks up br/zstd when those urllib3 decoders are installed).
+    session.headers["Accept-Encoding"] = requests.utils.DEFAULT_ACCEPT_ENCODING
+    return session
+
+
+SESSION = _build_session()
+# Phase 2 workers delete recipes themselves, so shared state sets are mutated concurrently.
+_state_lock = threading.Lock()
 IntegrityResult = Tuple[str, str, str, Optional[str]]
+# (slug, name, reason, source url, recipe id)
+PendingDelete = Tuple[str, str, str, Optional[str], Optional[str]]
+# (slug, old_name, new_name, recipe_id)
+PendingRename = Tuple[str, str, str, Optional[str]]
+# (slug, name, source_url, recipe_id) as read from a Mealie recipe payload.
+RecipeFields = Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]
 CleanerAction = Literal["keep", "rename", "delete"]
 
 
 def _as_optional_str(value: object) -> Optional[str]:
-    if isinstance(value, str) and value.strip():
-        return value.strip()
+    if isinstance(value, str):
+        return value.strip() or None
     return None
 
 
-def _as_optional_recipe_id(value: object) -> Optional[str]:
-    if isinstance(value, str):
-        cleaned = value.strip()
-        return cleaned or None
-    if isinstance(value, int):
-        return str(value)
+def _extract_recipe_id(recipe: Dict[str, Any]) -> Optional[str]:
+    for key in ("id", "recipeId"):
+        value = recipe.get(key)
+        if isinstance(value, str):
+            value = value.strip()
+            if value:
+                return value
+        elif isinstance(value, int):
+            return str(value)
     return None
 
 
-def _extract_recipe_id(recipe: Dict[str, Any]) -> Optional[str]:
-    return _as_optional_recipe_id(recipe.get("id")) or _as_optional_recipe_id(recipe.get("recipeId"))
+def _recipe_fields(recipe: Dict[str, Any]) -> RecipeFields:
+    # One pass over the keys every phase needs; each value is stripped once.
+    get = recipe.get
+    return (
+        _as_optional_str(get("slug")),
+        _as_optional_str(get("name")),
+        _as_optional_str(get("orgURL")) or _as_optional_str(get("originalURL")) or _as_optional_str(get("source")),
+        _extract_recipe_id(recipe),
+    )
 
 
 def _recipe_identity(recipe: Dict[str, Any]) -> str:
@@ -119,32 +248,28 @@ def _recipe_identity(recipe: Dict[str, Any]) -> str:
     return f"obj:{id(recipe)}"
 
 
-def _build_recipe_resource_urls(slug: Optional[str], recipe_id: Optional[str]) -> List[str]:
-    urls: List[str] = []
-    seen: Set[str] = set()
-
-    for identifier in (recipe_id, slug):
-        if not identifier:
-            continue
-        if identifier in seen:
-            continue
-        seen.add(identifier)
-        urls.append(f"{MEALIE_URL}/api/recipes/{identifier}")
-
-    return urls
+def _build_recipe_resource_urls(slug: Optional[str], recipe_id: Optional[str]) -> Tuple[str, ...]:
+    if recipe_id and slug and recipe_id != slug:
+        return (RECIPE_RESOURCE_PREFIX + recipe_id, RECIPE_RESOURCE_PREFIX + slug)
+    identifier = recipe_id or slug
+    return (RECIPE_RESOURCE_PREFIX + identifier,) if identifier else ()
 
 
 def _is_no_result_error(status_code: int, body: str) -> bool:
-    if status_code not in [404, 500]:
+    if status_code not in [404, 500] or not body:
         return False
-    lowered = (body or "").lower()
+    # Mealie's payload spells the exception name exactly; only other shapes
+    # pay for lowercasing a copy of the body.
+    if "NoResultFound" in body:
+        return True
+    lowered = body.lower()
     return "noresultfound" in lowered or "no result found" in lowered
 
 
 def load_json_set(filename: Path) -> Set[str]:
     if filename.exists():
         try:
-            return set(json.loads(filename.read_text(encoding="utf-8")))
+            return set(json_utils.loads(filename.read_bytes()))
         except Exception:
             return set()
     return set()
@@ -152,79 +277,103 @@ def load_json_set(filename: Path) -> Set[str]:
 
 def save_json_set(filename: Path, data_set: Set[str]) -> None:
     filename.parent.mkdir(parents=True, exist_ok=True)
-    filename.write_text(json.dumps(list(data_set)), encoding="utf-8")
+    json_utils.write_atomic(filename, json_utils.dumps(list(data_set)))
+
+
+def _slim_recipe(item: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: item[key] for key in RECIPE_LIST_FIELDS if key in item}
+
+
+PageResult = Tuple[Optional[Dict[str, Any]], Optional[str]]
+
+
+def _fetch_recipe_page(page: int) -> PageResult:
+    request_error: Optional[str] = None
+
+    for attempt in range(1, CLEANER_API_RETRIES + 1):
+        params: Dict[str, Any] = {"page": page, "perPage": CLEANER_RECIPES_PER_PAGE}
+        if CLEANER_QUERY_FILTER:
+            params["queryFilter"] = CLEANER_QUERY_FILTER
+        try:
+            response = SESSION.get(
+                f"{MEALIE_URL}/api/recipes",
+                params=params,
+                timeout=CLEANER_API_TIMEOUT,
+            )
+        except Exception as exc:
+            request_error = str(exc)
+            if attempt < CLEANER_API_RETRIES:
+                logger.warning(
+                    f"Error fetching Mealie page {page} "
+                    f"(attempt {attempt}/{CLEANER_API_RETRIES}): {exc}"
+                )
+                time.sleep(CLEANER_PAGE_RETRY_DELAY)
+                continue
+            break
+
+        if response.status_code != 200:
+            request_error = f"HTTP {response.status_code}"
+            if response.status_code >= 500 and attempt < CLEANER_API_RETRIES:
+                logger.warning(
+                    f"Transient error fetching Mealie page {page} "
+                    f"(attempt {attempt}/{CLEANER_API_RETRIES}): {request_error}"
+                )
+                time.sleep(CLEANER_PAGE_RETRY_DELAY)
+                continue
+            break
+
+        raw_payload = json_utils.loads(response.content)
+        if not isinstance(raw_payload, dict):
+            request_error = "Invalid JSON payload"
+            break
+
+        return raw_payload, None
+
+    return None, request_error
 
 
 def get_mealie_recipes() -> List[Dict[str, Any]]:
     if not MEALIE_ENABLED:
         return []
 
-    headers = {"Authorization": f"Bearer {MEALIE_API_TOKEN}"}
     recipes: List[Dict[str, Any]] = []
     page = 1
     terminated_due_error = False
     logger.info(f"Scanning Mealie library at {MEALIE_URL}...")
-    while True:
-        payload: Optional[Dict[str, Any]] = None
-        request_error: Optional[str] = None
-
-        for attempt in range(1, CLEANER_API_RETRIES + 1):
-            try:
-                response = requests.get(
-                    f"{MEALIE_URL}/api/recipes?page={page}&perPage={CLEANER_RECIPES_PER_PAGE}",
-                    headers=headers,
-                    timeout=CLEANER_API_TIMEOUT,
-                )
-            except Exception as exc:
-                request_error = str(exc)
-                if attempt < CLEANER_API_RETRIES:
-                    logger.warning(
-                        f"Error fetching Mealie page {page} "
-                        f"(attempt {attempt}/{CLEANER_API_RETRIES}): {exc}"
-                    )
-                    time.sleep(CLEANER_PAGE_RETRY_DELAY)
-                    continue
+    if CLEANER_QUERY_FILTER:
+        logger.info(f"Restricting scan with Mealie queryFilter: {CLEANER_QUERY_FILTER}")
+
+    # Once the first page reports total_pages, the next CLEANER_PAGE_PREFETCH
+    # pages are fetched in the background while results are consumed in order;
+    # stopping early cancels the fetches still queued.
+    first_page = _fetch_recipe_page(1)
+    total_pages = first_page[0].get("total_pages") if first_page[0] is not None else None
+    if isinstance(total_pages, int) and total_pages > 0:
+        later_pages = iter_prefetched(_fetch_recipe_page, range(2, total_pages + 1), CLEANER_PAGE_PREFETCH)
+    else:
+        later_pages = (_fetch_recipe_page(page) for page in itertools.count(2))
+
+    with contextlib.closing(later_pages) as pages:
+        for page, (payload, request_error) in enumerate(itertools.chain((first_page,), pages), start=1):
+            if payload is None:
+                if request_error:
+                    logger.error(f"Error fetching Mealie recipes page {page}: {request_error}")
+                    terminated_due_error = True
                 break
 
-            if response.status_code != 200:
-                request_error = f"HTTP {response.status_code}"
-                if response.status_code >= 500 and attempt < CLEANER_API_RETRIES:
-                    logger.warning(
-                        f"Transient error fetching Mealie page {page} "
-                        f"(attempt {attempt}/{CLEANER_API_RETRIES}): {request_error}"
-                    )
-                    time.sleep(CLEANER_PAGE_RETRY_DELAY)
-                    continue
+            raw_items = payload.get("items", [])
+            if not isinstance(raw_items, list):
+                terminated_due_error = True
+                logger.error(f"Malformed Mealie payload for page {page}: 'items' is not a list")
                 break
 
-            raw_payload = response.json()
-            if not isinstance(raw_payload, dict):
-                request_error = "Invalid JSON payload"
+            items = [_slim_recipe(item) for item in raw_items if isinstance(item, dict)]
+            if not items:
                 break
 
-            payload = raw_payload
-            break
-
-        if payload is None:
-            if request_error:
-                logger.error(f"Error fetching Mealie recipes page {page}: {request_error}")
-                terminated_due_error = True
-            break
-
-        raw_items = payload.get("items", [])
-        if not isinstance(raw_items, list):
-            terminated_due_error = True
-            logger.error(f"Malformed Mealie payload for page {page}: 'items' is not a list")
-            break
-
-        items = [item for item in raw_items if isinstance(item, dict)]
-        if not items:
-            break
-
-        recipes.extend(items)
-        page += 1
-        if page % 5 == 0:
-            logger.debug(f"Fetched page {page - 1}...")
+            recipes.extend(items)
+            if (page + 1) % 5 == 0 and logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Fetched page {page}...")
 
     if terminated_due_error:
         logger.warning(
@@ -248,7 +397,6 @@ def delete_mealie_recipe(
         logger.info(f" [DRY RUN] Would delete from Mealie: '{name}' (Reason: {reason})")
         return
 
-    headers = {"Authorization": f"Bearer {MEALIE_API_TOKEN}"}
     logger.info(f"🗑️ Deleting from Mealie: '{name}' (Reason: {reason})")
     targets = _build_recipe_resource_urls(slug, recipe_id)
     deleted = False
@@ -256,7 +404,7 @@ def delete_mealie_recipe(
     for target in targets:
         for attempt in range(CLEANER_API_RETRIES):
             try:
-                response = requests.delete(target, headers=headers, timeout=CLEANER_API_TIMEOUT)
+                response = SESSION.delete(target, timeout=CLEANER_API_TIMEOUT)
                 if response.status_code == 200:
                     deleted = True
                     break
@@ -272,12 +420,66 @@ def delete_mealie_recipe(
     if not deleted:
         logger.warning(f"Delete failed for '{name}' ({slug})")
 
-    if url:
-        rejects.add(url)
-    if slug in verified:
-        verified.remove(slug)
+    _record_deleted(slug, url, rejects, verified)
+
+
+def _record_deleted(slug: str, url: Optional[str], rejects: Set[str], verified: Set[str]) -> None:
+    with _state_lock:
+        if url:
+            rejects.add(url)
+        if slug in verified:
+            verified.remove(slug)
+
+
+def _bulk_delete(slugs: List[str]) -> Tuple[bool, bool]:
+    """Return (deleted, endpoint_supported) for one Mealie bulk-delete call."""
+    try:
+        response = SESSION.post(
+            f"{MEALIE_URL}/api/recipes/bulk-actions/delete",
+            # Encoded by json_utils rather than requests' stdlib json= path.
+            data=json_utils.dumps({"recipes": slugs}),
+            headers={"Content-Type": "application/json"},
+            timeout=CLEANER_API_TIMEOUT,
+        )
+    except Exception as exc:
+        logger.warning(f"Bulk delete request failed: {exc}")
+        return False, True
+
+    if response.status_code == 200:
+        return True, True
+    if response.status_code in [404, 405, 422]:
+        logger.info(f"Bulk delete endpoint unavailable (HTTP {response.status_code}); deleting one by one.")
+        return False, False
+    logger.warning(f"Bulk delete failed: HTTP {response.status_code}; deleting batch one by one.")
+    return False, True
+
+
+def delete_mealie_recipes(
+    pending: List[PendingDelete],
+    rejects: Set[str],
+    verified: Set[str],
+) -> None:
+    if DRY_RUN:
+        for slug, name, reason, url, recipe_id in pending:
+            delete_mealie_recipe(slug, name, reason, rejects, verified, url, recipe_id=recipe_id)
+        return
+
+    bulk_supported = True
+    for start in range(0, len(pending), BULK_DELETE_BATCH_SIZE):
+        batch = pending[start : start + BULK_DELETE_BATCH_SIZE]
+        if bulk_supported:
+            deleted, bulk_supported = _bulk_delete([slug for slug, *_ in batch])
+            if deleted:
+                for slug, name, reason, url, _recipe_id in batch:
+                    logger.info(f"🗑️ Deleted from Mealie: '{name}' (Reason: {reason})")
+                    _record_deleted(slug, url, rejects, verified)
+                continue
+
+        for slug, name, reason, url, recipe_id in batch:
+            delete_mealie_recipe(slug, name, reason, rejects, verified, url, recipe_id=recipe_id)
 
 
+@functools.lru_cache(maxsize=CLASSIFY_CACHE_SIZE)
 def _slug_fallback(url: Optional[str], slug: Optional[str]) -> str:
     slug_text = (slug or "").strip().lower()
     if slug_text:
@@ -285,7 +487,7 @@ def _slug_fallback(url: Optional[str], slug: Optional[str]) -> str:
 
     if url:
         try:
-            return urlparse(url).path.strip("/").split("/")[-1].lower()
+            return url_slug(url)
         except Exception:
             return ""
 
@@ -300,13 +502,19 @@ def _recipe_source_url(recipe: Dict[str, Any]) -> Optional[str]:
     )
 
 
-def _dedupe_keeper_sort_key(recipe: Dict[str, Any]) -> Tuple[int, int, int, int]:
-    name = _as_optional_str(recipe.get("name")) or ""
-    stripped_name = strip_numeric_suffix(name)
+@functools.lru_cache(maxsize=CLASSIFY_CACHE_SIZE)
+def _dedupe_name_sort_key(name: str) -> Tuple[int, int, int]:
     return (
         1 if has_numeric_suffix(name) else 0,
         numeric_suffix_value(name),
-        len(stripped_name),
+        len(strip_numeric_suffix(name)),
+    )
+
+
+def _dedupe_keeper_sort_key(recipe: Dict[str, Any]) -> Tuple[int, int, int, int]:
+    name = _as_optional_str(recipe.get("name")) or ""
+    return (
+        *_dedupe_name_sort_key(name),
         len(_as_optional_str(recipe.get("slug")) or ""),
     )
 
@@ -316,60 +524,62 @@ def dedupe_duplicate_source_recipes(
     rejects: Set[str],
     verified: Set[str],
 ) -> Tuple[List[Dict[str, Any]], int, int]:
-    groups: Dict[str, List[Dict[str, Any]]] = {}
-    for recipe in recipes:
-        source_url = _recipe_source_url(recipe)
-        canonical_source = canonicalize_url(source_url)
-        if not canonical_source:
-            continue
-        groups.setdefault(canonical_source, []).append(recipe)
+    identities = [_recipe_identity(recipe) for recipe in recipes]
+    groups: DefaultDict[str, List[Tuple[str, Dict[str, Any]]]] = defaultdict(list)
+    for identity, recipe in zip(identities, recipes):
+        canonical_source = canonicalize_url(_recipe_source_url(recipe))
+        if canonical_source:
+            groups[canonical_source].append((identity, recipe))
 
     duplicate_groups = {source: group for source, group in groups.items() if len(group) > 1}
     if not duplicate_groups:
         return recipes, 0, 0
 
     to_remove: Set[str] = set()
-    deleted_count = 0
+    pending: List[PendingDelete] = []
     for canonical_source, group in duplicate_groups.items():
-        sorted_group = sorted(group, key=_dedupe_keeper_sort_key)
-        keeper = sorted_group[0]
+        # min() returns the first minimal entry, the same keeper a stable sort puts first.
+        _, keeper = min(group, key=lambda entry: _dedupe_keeper_sort_key(entry[1]))
         keeper_name = _as_optional_str(keeper.get("name")) or "Unknown"
         logger.info(
             f"🔁 Duplicate source detected ({len(group)}): keeping '{keeper_name}' from {canonical_source}"
         )
 
-        for duplicate in sorted_group[1:]:
+        reason = f"Duplicate source URL: {canonical_source}"
+        for identity, duplicate in group:
+            if duplicate is keeper:
+                continue
             duplicate_slug = _as_optional_str(duplicate.get("slug"))
-            duplicate_name = _as_optional_str(duplicate.get("name")) or "Unknown"
-            duplicate_id = _extract_recipe_id(duplicate)
-            duplicate_url = _recipe_source_url(duplicate)
             if not duplicate_slug:
                 continue
-
-            delete_mealie_recipe(
-                duplicate_slug,
-                duplicate_name,
-                f"Duplicate source URL: {canonical_source}",
-                rejects,
-                verified,
-                duplicate_url,
-                recipe_id=duplicate_id,
+            duplicate_name = _as_optional_str(duplicate.get("name")) or "Unknown"
+            pending.append(
+                (duplicate_slug, duplicate_name, reason, _recipe_source_url(duplicate), _extract_recipe_id(duplicate))
             )
-            to_remove.add(_recipe_identity(duplicate))
-            deleted_count += 1
+            to_remove.add(identity)
+
+    deleted_count = len(pending)
+    if pending:
+        delete_mealie_recipes(pending, rejects, verified)
 
-    filtered = [recipe for recipe in recipes if _recipe_identity(recipe) not in to_remove]
+    if not to_remove:
+        return recipes, len(duplicate_groups), deleted_count
+
+    filtered = [recipe for recipe, identity in zip(recipes, identities) if identity not in to_remove]
     return filtered, len(duplicate_groups), deleted_count
 
 
+def _separators_to_spaces(text: str) -> str:
+    # Equivalent to re.sub(r"[-_]+", " ", text).strip(): dropping the empty
+    # pieces collapses separator runs, and str.split is far cheaper than re.sub.
+    return " ".join(filter(None, text.replace("_", "-").split("-"))).strip()
+
+
+@functools.lru_cache(maxsize=CLASSIFY_CACHE_SIZE)
 def normalize_recipe_name(candidate: str) -> str:
-    text = re.sub(r"[-_]+", " ", candidate or "").strip()
-    text = re.sub(r"\s+", " ", text)
-    text = re.sub(r"^(recipe for)\s+", "", text, flags=re.IGNORECASE)
-    text = re.sub(r"^(how to)\s+", "", text, flags=re.IGNORECASE)
-    text = re.sub(r"^(cook|make)\s+", "", text, flags=re.IGNORECASE)
-    text = re.sub(r"\b(recipe)\b$", "", text, flags=re.IGNORECASE).strip()
-    text = re.sub(r"\s+", " ", text)
+    text = " ".join(_separators_to_spaces(candidate or "").split())
+    text = text[NAME_PREFIX_RE.match(text).end() :]
+    text = " ".join(RECIPE_SUFFIX_RE.sub("", text).split())
     return text.title()
 
 
@@ -378,29 +588,44 @@ def suggest_salvage_name(name: str, slug: Optional[str]) -> Optional[str]:
     if not original:
         return None
 
+    original_l = original.lower()
     cleaned_from_name = normalize_recipe_name(original)
-    if cleaned_from_name and cleaned_from_name.lower() != original.lower():
+    if cleaned_from_name and cleaned_from_name.lower() != original_l:
         return cleaned_from_name
 
     # Only infer rename from slug when the title itself is explicitly a how-to.
-    if not HOW_TO_COOK_REGEX.search(original.lower()):
+    if not HOW_TO_COOK_REGEX.search(original_l):
         return None
 
     slug_text = _slug_fallback(None, slug)
     if slug_text:
         cleaned_from_slug = normalize_recipe_name(slug_text)
-        if cleaned_from_slug and cleaned_from_slug.lower() != original.lower():
+        if cleaned_from_slug and cleaned_from_slug.lower() != original_l:
             return cleaned_from_slug
 
     return None
 
 
+def _high_risk_keyword(*texts: str) -> Optional[str]:
+    if HIGH_RISK_AUTOMATON is not None and not any(
+        next(HIGH_RISK_AUTOMATON.iter(text), None) for text in texts
+    ):
+        return None
+    found = {match for text in texts for match in HIGH_RISK_REGEX.findall(text)}
+    if not found:
+        return None
+    return min(found, key=HIGH_RISK_KEYWORD_RANK.__getitem__)
+
+
+@functools.lru_cache(maxsize=CLASSIFY_CACHE_SIZE)
 def classify_recipe_action(name: str, url: Optional[str], slug: Optional[str] = None) -> Tuple[CleanerAction, str, Optional[str]]:
     name_l = (name or "").lower()
     slug_text = _slug_fallback(url, slug)
-    normalized_slug = re.sub(r"[-_]+", " ", slug_text).strip()
-    slug_has_how_to = bool(HOW_TO_COOK_REGEX.search(normalized_slug))
-    name_has_how_to = bool(HOW_TO_COOK_REGEX.search(name_l))
+    normalized_slug = _separators_to_spaces(slug_text)
+    # HOW_TO_COOK_REGEX is anchored on "how" and both texts are lowercase,
+    # so a prefix test settles the common case without a regex call.
+    slug_has_how_to = normalized_slug.startswith("how") and bool(HOW_TO_COOK_REGEX.search(normalized_slug))
+    name_has_how_to = name_l.startswith("how") and bool(HOW_TO_COOK_REGEX.search(name_l))
 
     if slug_has_how_to or name_has_how_to:
         if CLEANER_RENAME_SALVAGE:
@@ -411,24 +636,25 @@ def classify_recipe_action(name: str, url: Optional[str], slug: Optional[str] =
             return "keep", "How-to slug only with clean recipe title", None
         return "delete", "How-to article", None
 
-    if NON_RECIPE_DIGEST_REGEX.search(normalized_slug) or NON_RECIPE_DIGEST_REGEX.search(name_l):
+    combined = f"{normalized_slug}{COMBINED_TEXT_SEPARATOR}{name_l}"
+    if NON_RECIPE_DIGEST_REGEX.search(combined):
         return "delete", "Digest/non-recipe post", None
 
-    for keyword in HIGH_RISK_KEYWORDS:
-        if keyword in normalized_slug or keyword in name_l:
-            return "delete", f"High-risk keyword: {keyword}", None
+    keyword = _high_risk_keyword(combined)
+    if keyword:
+        return "delete", f"High-risk keyword: {keyword}", None
 
+    # LISTICLE_REGEX and NUMBERED_COLLECTION_REGEX only match text that
+    # LISTICLE_TITLE_REGEX also matches, and "." never crosses the separator,
+    # so one scan of the combined text covers all three patterns.
     if (
-        LISTICLE_REGEX.search(normalized_slug)
-        or NUMBERED_COLLECTION_REGEX.search(normalized_slug)
-        or LISTICLE_REGEX.search(name_l)
-        or NUMBERED_COLLECTION_REGEX.search(name_l)
-        or LISTICLE_TITLE_REGEX.search(normalized_slug)
-        or LISTICLE_TITLE_REGEX.search(name_l)
+        any(noun in combined for noun in LISTICLE_NOUNS)
+        and (LISTICLE_GATE_RE is None or LISTICLE_GATE_RE.search(combined))
+        and LISTICLE_TITLE_REGEX.search(combined)
     ):
         return "delete", "Listicle/roundup", None
 
-    if url and any(x in url.lower() for x in ["privacy-policy", "contact", "about-us", "login", "cart"]):
+    if url and UTILITY_URL_RE.search(url.lower()):
         return "delete", "Utility/non-recipe page", None
 
     return "keep", "", None
@@ -439,6 +665,52 @@ def is_junk_content(name: str, url: Optional[str], slug: Optional[str] = None) -
     return action == "delete"
 
 
+def plan_surgical_filter(
+    tasks: List[Dict[str, Any]],
+) -> Tuple[List[Dict[str, Any]], List[PendingDelete], List[PendingRename]]:
+    # Pure classification pass: no Mealie calls happen here, so the whole
+    # library is triaged in one tight loop before any network work starts.
+    clean_tasks: List[Dict[str, Any]] = []
+    pending_deletes: List[PendingDelete] = []
+    pending_renames: List[PendingRename] = []
+    for recipe in tasks:
+        slug, name, url, recipe_id = _recipe_fields(recipe)
+        name = name or "Unknown"
+        if not slug:
+            logger.debug(f"Skipping recipe with missing slug: {name}")
+            continue
+
+        action, reason, new_name = classify_recipe_action(name, url, slug)
+        if action == "delete":
+            pending_deletes.append((slug, name, reason or "JUNK CONTENT", url, recipe_id))
+            continue
+
+        if action == "rename" and new_name:
+            pending_renames.append((slug, name, new_name, recipe_id))
+
+        clean_tasks.append(recipe)
+
+    return clean_tasks, pending_deletes, pending_renames
+
+
+def apply_surgical_filter(
+    pending_deletes: List[PendingDelete],
+    pending_renames: List[PendingRename],
+    rejects: Set[str],
+    verified: Set[str],
+) -> Tuple[int, int]:
+    delete_mealie_recipes(pending_deletes, rejects, verified)
+
+    renamed = 0
+    rename_failed = 0
+    for slug, old_name, new_name, recipe_id in pending_renames:
+        if rename_mealie_recipe(slug, old_name, new_name, recipe_id=recipe_id):
+            renamed += 1
+        else:
+            rename_failed += 1
+    return renamed, rename_failed
+
+
 def rename_mealie_recipe(slug: str, old_name: str, new_name: str, recipe_id: Optional[str] = None) -> bool:
     if not new_name or old_name.strip().lower() == new_name.strip().lower():
         return True
@@ -447,7 +719,6 @@ def rename_mealie_recipe(slug: str, old_name: str, new_name: str, recipe_id: Opt
         logger.info(f" [DRY RUN] Would rename in Mealie: '{old_name}' -> '{new_name}'")
         return True
 
-    headers = {"Authorization": f"Bearer {MEALIE_API_TOKEN}"}
     payload = {"name": new_name}
     targets = _build_recipe_resource_urls(slug, recipe_id)
     last_error: Optional[str] = None
@@ -457,9 +728,9 @@ def rename_mealie_recipe(slug: str, old_name: str, new_name: str, recipe_id: Opt
             for attempt in range(CLEANER_API_RETRIES):
                 try:
                     if method == "patch":
-                        response = requests.patch(target, headers=headers, json=payload, timeout=CLEANER_API_TIMEOUT)
+                        response = SESSION.patch(target, json=payload, timeout=CLEANER_API_TIMEOUT)
                     else:
-                        response = requests.put(target, headers=headers, json=payload, timeout=CLEANER_API_TIMEOUT)
+                        response = SESSION.put(target, json=payload, timeout=CLEANER_API_TIMEOUT)
 
                     if response.status_code in [200, 201]:
                         logger.info(f"✏️ Renamed in Mealie: '{old_name}' -> '{new_name}'")
@@ -482,13 +753,18 @@ def rename_mealie_recipe(slug: str, old_name: str, new_name: str, recipe_id: Opt
     return False
 
 
-def validate_instructions(inst: Any) -> bool:
-    def _has_valid_instruction_text(text: str) -> bool:
-        normalized = re.sub(r"\s+", " ", text).strip().lower()
-        if not normalized:
-            return False
-        return not any(marker in normalized for marker in INSTRUCTION_PLACEHOLDERS)
+def _has_valid_instruction_text(text: str) -> bool:
+    # Every placeholder contains "instruction", so text without it only
+    # needs the emptiness check, not the whitespace-collapsed copy.
+    if "instruction" not in text.lower():
+        return bool(text) and not text.isspace()
+    normalized = " ".join(text.split()).lower()
+    if not normalized:
+        return False
+    return INSTRUCTION_PLACEHOLDER_RE.search(normalized) is None
 
+
+def validate_instructions(inst: Any) -> bool:
     if not inst:
         return False
 
@@ -496,8 +772,17 @@ def validate_instructions(inst: Any) -> bool:
         return _has_valid_instruction_text(inst)
 
     if isinstance(inst, list):
+        # Mealie steps are dicts with a "text" string; that shape is checked
+        # inline, and anything else takes the general path.
         for step in inst:
-            if validate_instructions(step):
+            if type(step) is dict:
+                text = step.get("text")
+                if type(text) is str and _has_valid_instruction_text(text):
+                    return True
+                nested = step.get("itemListElement")
+                if nested is not None and validate_instructions(nested):
+                    return True
+            elif validate_instructions(step):
                 return True
         return False
 
@@ -516,6 +801,10 @@ def validate_instructions(inst: Any) -> bool:
 def language_issue_for_payload(payload: dict[str, Any]) -> Optional[str]:
     if not LANGUAGE_FILTER_ENABLED or not CLEANER_REMOVE_NON_TARGET_LANGUAGE or not TARGET_LANGUAGE:
         return None
+    # Most libraries target English and hold mostly English recipes; those
+    # are settled by a regex count instead of a detector run.
+    if TARGET_LANGUAGE == "en" and is_obvious_english_payload(payload):
+        return None
 
     detected_language, _source, _confidence = detect_language_from_recipe_payload(
         payload,
@@ -537,40 +826,40 @@ def _should_skip_verified(slug: str, verified: Set[str]) -> bool:
     return slug in verified
 
 
+def _fetch_recipe_detail(slug: str, recipe_id: Optional[str]) -> Dict[str, Any]:
+    for target in _build_recipe_resource_urls(slug, recipe_id):
+        for attempt in range(CLEANER_API_RETRIES):
+            response = SESSION.get(target, timeout=CLEANER_API_TIMEOUT)
+            if response.status_code == 200:
+                raw_payload = json_utils.loads(response.content)
+                if isinstance(raw_payload, dict) and raw_payload:
+                    return raw_payload
+                break
+            if response.status_code in [404, 405] or _is_no_result_error(response.status_code, response.text):
+                break
+            if attempt + 1 < CLEANER_API_RETRIES:
+                time.sleep(1)
+    return {}
+
+
 def check_integrity(recipe: Dict[str, Any], verified: Set[str]) -> Optional[IntegrityResult]:
-    slug = _as_optional_str(recipe.get("slug"))
+    slug, name, url, recipe_id = _recipe_fields(recipe)
     if not slug:
         return None
 
-    recipe_id = _extract_recipe_id(recipe)
-
     if _should_skip_verified(slug, verified):
         return None
 
-    name = _as_optional_str(recipe.get("name")) or "Unknown"
-    url = (
-        _as_optional_str(recipe.get("orgURL"))
-        or _as_optional_str(recipe.get("originalURL"))
-        or _as_optional_str(recipe.get("source"))
-    )
+    name = name or "Unknown"
 
     try:
-        headers = {"Authorization": f"Bearer {MEALIE_API_TOKEN}"}
-        payload: Dict[str, Any] = {}
-        for target in _build_recipe_resource_urls(slug, recipe_id):
-            for attempt in range(CLEANER_API_RETRIES):
-                response = requests.get(target, headers=headers, timeout=CLEANER_API_TIMEOUT)
-                if response.status_code == 200:
-                    raw_payload = response.json()
-                    if isinstance(raw_payload, dict):
-                        payload = raw_payload
-                    break
-                if response.status_code in [404, 405] or _is_no_result_error(response.status_code, response.text):
-                    break
-                if attempt + 1 < CLEANER_API_RETRIES:
-                    time.sleep(1)
-            if payload:
-                break
+        # When the list payload already carries instructions it holds the full
+        # recipe, so both checks run on it without a per-recipe detail fetch.
+        # Empty values are not trusted: summary payloads may carry empty defaults.
+        if recipe.get("recipeInstructions"):
+            payload = recipe
+        else:
+            payload = _fetch_recipe_detail(slug, recipe_id)
 
         inst = payload.get("recipeInstructions")
 
@@ -586,9 +875,98 @@ def check_integrity(recipe: Dict[str, Any], verified: Set[str]) -> Optional[Inte
         return None
 
 
+def _integrity_and_act(
+    recipe: Dict[str, Any],
+    rejects: Set[str],
+    verified: Set[str],
+) -> Optional[IntegrityResult]:
+    result = check_integrity(recipe, verified)
+    if not result:
+        return None
+
+    slug, marker, reason, url = result
+    if marker == "VERIFIED":
+        with _state_lock:
+            verified.add(slug)
+    else:
+        delete_mealie_recipe(
+            slug,
+            marker,
+            reason,
+            rejects,
+            verified,
+            url,
+            recipe_id=_extract_recipe_id(recipe),
+        )
+    return result
+
+
+def run_integrity_scan(
+    clean_tasks: List[Dict[str, Any]],
+    rejects: Set[str],
+    verified: Set[str],
+) -> Tuple[int, int]:
+    verified_count = 0
+    deleted_count = 0
+    completed = 0
+    total = len(clean_tasks)
+    # Checked once so the hot completion loop never formats a discarded message.
+    log_progress = logger.isEnabledFor(logging.DEBUG)
+    # Keep a bounded window of queued checks so MAX_WORKERS can be raised for
+    # large libraries without allocating one future per recipe up front.
+    max_in_flight = MAX_WORKERS * 4
+
+    def collect(done: Set["concurrent.futures.Future[Optional[IntegrityResult]]"]) -> None:
+        nonlocal verified_count, deleted_count, completed
+        for future in done:
+            result = future.result()
+            if result:
+                if result[1] == "VERIFIED":
+                    verified_count += 1
+                else:
+                    deleted_count += 1
+
+            if log_progress and completed % 10 == 0:
+                logger.debug(f"Progress: {completed}/{total}")
+            completed += 1
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        pending: Set["concurrent.futures.Future[Optional[IntegrityResult]]"] = set()
+        for recipe in clean_tasks:
+            # Already verified recipes are dropped here rather than in a worker,
+            # so a mostly verified library does not queue one no-op per recipe.
+            slug = _as_optional_str(recipe.get("slug"))
+            if not slug or _should_skip_verified(slug, verified):
+                completed += 1
+                continue
+            pending.add(executor.submit(_integrity_and_act, recipe, rejects, verified))
+            if len(pending) >= max_in_flight:
+                done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                collect(done)
+
+        while pending:
+            done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            collect(done)
+
+    return verified_count, deleted_count
+
+
+def clear_classification_caches() -> None:
+    # Classification reads module-level settings; drop memoized results so a
+    # long-lived process never reuses decisions made under older settings.
+    classify_recipe_action.cache_clear()
+    normalize_recipe_name.cache_clear()
+    _slug_fallback.cache_clear()
+    _dedupe_name_sort_key.cache_clear()
+
+
 def run_cleaner() -> int:
+    clear_classification_caches()
     rejects = load_json_set(REJECT_FILE)
     verified = load_json_set(VERIFIED_FILE)
+    # Snapshots let the final save skip rewriting state files nothing touched.
+    loaded_rejects = frozenset(rejects)
+    loaded_verified = frozenset(verified)
 
     logger.info("=" * 40)
     logger.info("MASTER CLEANER STARTED")
@@ -609,83 +987,51 @@ def run_cleaner() -> int:
         logger.info(f"Duplicate source groups: {duplicate_groups}, removed: {duplicate_deletes}")
 
     logger.info("--- Phase 1: Surgical Filter Scan ---")
-    clean_tasks: List[Dict[str, Any]] = []
-    phase1_deleted = 0
-    phase1_rename_succeeded = 0
-    phase1_rename_failed = 0
-    for recipe in tasks:
-        name = _as_optional_str(recipe.get("name")) or "Unknown"
-        url = (
-            _as_optional_str(recipe.get("orgURL"))
-            or _as_optional_str(recipe.get("originalURL"))
-            or _as_optional_str(recipe.get("source"))
+    clean_tasks, pending_deletes, pending_renames = plan_surgical_filter(tasks)
+    logger.info(
+        "Phase 1 plan: "
+        f"delete={len(pending_deletes)}, "
+        f"rename={len(pending_renames)}, "
+        f"passed_to_phase2={len(clean_tasks)}"
+    )
+
+    # Phase 1 deletes never overlap Phase 2, but renamed recipes are also
+    # passed to Phase 2 and a rename can change their Mealie slug. Only the
+    # untouched recipes are scanned while the Phase 1 API calls run in the
+    # background; renamed ones are scanned once those calls have finished.
+    renamed_slugs = {slug for slug, *_ in pending_renames}
+    concurrent_tasks: List[Dict[str, Any]] = []
+    renamed_tasks: List[Dict[str, Any]] = []
+    for recipe in clean_tasks:
+        if _as_optional_str(recipe.get("slug")) in renamed_slugs:
+            renamed_tasks.append(recipe)
+        else:
+            concurrent_tasks.append(recipe)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as phase1_executor:
+        phase1_future = phase1_executor.submit(
+            apply_surgical_filter, pending_deletes, pending_renames, rejects, verified
         )
-        slug = _as_optional_str(recipe.get("slug"))
-        recipe_id = _extract_recipe_id(recipe)
 
-        if not slug:
-            logger.debug(f"Skipping recipe with missing slug: {name}")
-            continue
+        logger.info(f"--- Phase 2: Deep Integrity Scan (Checking {len(clean_tasks)} recipes) ---")
+        if clean_tasks and LANGUAGE_FILTER_ENABLED and CLEANER_REMOVE_NON_TARGET_LANGUAGE and TARGET_LANGUAGE:
+            warm_language_detector()
+        phase2_verified, phase2_deleted = run_integrity_scan(concurrent_tasks, rejects, verified)
 
-        action, reason, new_name = classify_recipe_action(name, url, slug)
-        if action == "delete":
-            phase1_deleted += 1
-            delete_mealie_recipe(
-                slug,
-                name,
-                reason or "JUNK CONTENT",
-                rejects,
-                verified,
-                url,
-                recipe_id=recipe_id,
-            )
-            continue
-
-        if action == "rename" and new_name:
-            if rename_mealie_recipe(slug, name, new_name, recipe_id=recipe_id):
-                phase1_rename_succeeded += 1
-            else:
-                phase1_rename_failed += 1
+        phase1_rename_succeeded, phase1_rename_failed = phase1_future.result()
 
-        clean_tasks.append(recipe)
+    if renamed_tasks:
+        renamed_verified, renamed_deleted = run_integrity_scan(renamed_tasks, rejects, verified)
+        phase2_verified += renamed_verified
+        phase2_deleted += renamed_deleted
 
     logger.info(
         "Phase 1 summary: "
-        f"deleted={phase1_deleted}, "
+        f"deleted={len(pending_deletes)}, "
         f"renamed={phase1_rename_succeeded}, "
         f"rename_failed={phase1_rename_failed}, "
         f"passed_to_phase2={len(clean_tasks)}"
     )
-
-    logger.info(f"--- Phase 2: Deep Integrity Scan (Checking {len(clean_tasks)} recipes) ---")
-    phase2_deleted = 0
-    phase2_verified = 0
-    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        futures = [executor.submit(check_integrity, recipe, verified) for recipe in clean_tasks]
-        future_recipe_id = {future: _extract_recipe_id(recipe) for future, recipe in zip(futures, clean_tasks)}
-
-        for index, future in enumerate(concurrent.futures.as_completed(futures)):
-            result = future.result()
-            if result:
-                slug, marker, reason, url = result
-                if marker == "VERIFIED":
-                    phase2_verified += 1
-                    verified.add(slug)
-                else:
-                    phase2_deleted += 1
-                    delete_mealie_recipe(
-                        slug,
-                        marker,
-                        reason,
-                        rejects,
-                        verified,
-                        url,
-                        recipe_id=future_recipe_id.get(future),
-                    )
-
-            if index % 10 == 0:
-                logger.debug(f"Progress: {index}/{len(clean_tasks)}")
-
     logger.info(
         "Phase 2 summary: "
         f"verified={phase2_verified}, "
@@ -693,9 +1039,14 @@ def run_cleaner() -> int:
     )
 
     if not DRY_RUN:
-        save_json_set(REJECT_FILE, rejects)
-        save_json_set(VERIFIED_FILE, verified)
-        logger.info("State saved.")
+        state_changed = False
+        if rejects != loaded_rejects:
+            save_json_set(REJECT_FILE, rejects)
+            state_changed = True
+        if verified != loaded_verified:
+            save_json_set(VERIFIED_FILE, verified)
+            state_changed = True
+        logger.info("State saved." if state_changed else "State unchanged; no files rewritten.")
     else:
         logger.info("Dry Run: No state files updated.")
 
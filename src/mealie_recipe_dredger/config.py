@@ -1,14 +1,17 @@
-import json
 import os
 import re
 from pathlib import Path
 from typing import List
 
-from dotenv import load_dotenv
-
+from . import json_utils
 from .version import __version__
 
-load_dotenv()
+# Exported-env deployments (containers, library callers) can skip the .env
+# lookup and the python-dotenv import entirely.
+if os.getenv("LOAD_DOTENV", "true").lower() == "true":
+    from dotenv import load_dotenv
+
+    load_dotenv()
 
 ROOT_DIR = Path(__file__).resolve().parents[2]
 DATA_DIR = Path(os.getenv("DATA_DIR", "data"))
@@ -30,6 +33,8 @@ CACHE_EXPIRY_DAYS = int(os.getenv("CACHE_EXPIRY_DAYS", 7))
 MAX_RETRY_ATTEMPTS = int(os.getenv("MAX_RETRY_ATTEMPTS", 3))
 IMPORT_PRECHECK_DUPLICATES = os.getenv("IMPORT_PRECHECK_DUPLICATES", "true").lower() == "true"
 IMPORT_WORKERS = max(1, int(os.getenv("IMPORT_WORKERS", 2)))
+VERIFY_WORKERS = max(1, int(os.getenv("VERIFY_WORKERS", 4)))
+VERIFY_MAX_BYTES = max(65536, int(os.getenv("VERIFY_MAX_BYTES", 2 * 1024 * 1024)))
 SITE_IMPORT_FAILURE_THRESHOLD = max(0, int(os.getenv("SITE_IMPORT_FAILURE_THRESHOLD", 3)))
 
 ALIGN_RECIPES_WITH_SITES = os.getenv("ALIGN_RECIPES_WITH_SITES", "false").lower() == "true"
@@ -53,6 +58,9 @@ TARGET_LANGUAGE = _normalize_language(os.getenv("TARGET_LANGUAGE", "en"))
 LANGUAGE_FILTER_ENABLED = os.getenv("LANGUAGE_FILTER_ENABLED", "true").lower() == "true"
 LANGUAGE_DETECTION_STRICT = os.getenv("LANGUAGE_DETECTION_STRICT", "true").lower() == "true"
 LANGUAGE_MIN_CONFIDENCE = float(os.getenv("LANGUAGE_MIN_CONFIDENCE", 0.70))
+LANGUAGE_COMPACT_PROFILES = os.getenv("LANGUAGE_COMPACT_PROFILES", "false").lower() == "true"
+LANGUAGE_DETECTOR = os.getenv("LANGUAGE_DETECTOR", "auto").strip().lower()
+LANGUAGE_FASTTEXT_MODEL = os.getenv("LANGUAGE_FASTTEXT_MODEL", "").strip()
 CLEANER_REMOVE_NON_TARGET_LANGUAGE = os.getenv("CLEANER_REMOVE_NON_TARGET_LANGUAGE", "true").lower() == "true"
 CLEANER_DEDUPE_BY_SOURCE = os.getenv("CLEANER_DEDUPE_BY_SOURCE", "true").lower() == "true"
 
@@ -61,6 +69,8 @@ IMPORTED_FILE = DATA_DIR / "imported.json"
 RETRY_FILE = DATA_DIR / "retry_queue.json"
 STATS_FILE = DATA_DIR / "stats.json"
 SITEMAP_CACHE_FILE = DATA_DIR / "sitemap_cache.json"
+MEALIE_ENDPOINT_CACHE_FILE = DATA_DIR / "mealie_endpoints.json"
+CRAWL_DELAY_CACHE_FILE = DATA_DIR / "crawl_delays.json"
 
 TRANSIENT_HTTP_CODES = {408, 425, 429, 500, 502, 503, 504, 520, 521, 522, 523, 524}
 
@@ -151,13 +161,13 @@ def _parse_sites_data(data) -> List[str]:
 def _load_default_sites() -> List[str]:
     sites_file = ROOT_DIR / "sites.json"
     try:
-        data = json.loads(sites_file.read_text(encoding="utf-8"))
+        data = json_utils.loads(sites_file.read_bytes())
         parsed = _parse_sites_data(data)
         if parsed:
             return parsed
     except OSError:
         pass
-    except json.JSONDecodeError:
+    except json_utils.JSONDecodeError:
         pass
 
     return [
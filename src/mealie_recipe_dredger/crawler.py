@@ -1,17 +1,23 @@
+import concurrent.futures
 import logging
-from typing import Any, List, Optional, Protocol
-from bs4 import BeautifulSoup
+from typing import IO, Any, Iterator, List, Optional, Protocol, Tuple
+
+from lxml import etree
 
 from .models import RecipeCandidate
 
 logger = logging.getLogger("dredger")
 
+# Elements _parse_sitemap reacts to, in any (or no) namespace.
+SITEMAP_EVENT_TAGS = ("{*}loc", "{*}url", "{*}sitemap")
+
 
 class ResponseLike(Protocol):
     status_code: int
     url: str
     text: str
     content: bytes
+    raw: Any
 
     def close(self) -> None: ...
 
@@ -34,6 +40,52 @@ class StorageLike(Protocol):
     def cache_sitemap(self, site_url: str, sitemap_url: str, urls: List[str], /) -> None: ...
 
 
+def _local_name(tag: object) -> str:
+    if not isinstance(tag, str):
+        return ""
+    return tag.rpartition("}")[2]
+
+
+def _parse_sitemap(source: IO[bytes]) -> Tuple[bool, List[str], List[str]]:
+    # Returns (is_index, sub_sitemap_locs, page_locs). Only <loc> elements that
+    # are direct children of <sitemap>/<url> count, so nested entries such as
+    # <image:loc> are ignored. Finished entries are cleared while parsing so
+    # memory stays flat on large sitemaps.
+    is_index = False
+    sub_maps: List[str] = []
+    page_urls: List[str] = []
+
+    try:
+        # The tag filter keeps <lastmod>, <priority>, <image:*> and the like
+        # from surfacing as Python events at all; they are still freed when
+        # their <url> entry is cleared.
+        for _, elem in etree.iterparse(
+            source, events=("end",), tag=SITEMAP_EVENT_TAGS, recover=True, huge_tree=False
+        ):
+            name = _local_name(elem.tag)
+            if name == "loc":
+                parent = elem.getparent()
+                parent_name = _local_name(parent.tag) if parent is not None else ""
+                text = (elem.text or "").strip()
+                if text and parent_name == "sitemap":
+                    sub_maps.append(text)
+                elif text and parent_name == "url":
+                    page_urls.append(text)
+            elif name in ("sitemap", "url"):
+                if name == "sitemap":
+                    is_index = True
+                elem.clear()
+                parent = elem.getparent()
+                if parent is not None:
+                    while elem.getprevious() is not None:
+                        del parent[0]
+    except etree.XMLSyntaxError:
+        # Empty or hopelessly broken documents keep whatever parsed cleanly.
+        pass
+
+    return is_index, sub_maps, page_urls
+
+
 class SitemapCrawler:
     def __init__(self, session: SessionLike, storage: StorageLike):
         self.session = session
@@ -57,64 +109,68 @@ class SitemapCrawler:
             f"{base_url}/recipe-sitemap.xml",
         ]
 
-        for url in candidates:
-            try:
-                response = self.session.head(url, timeout=5, allow_redirects=True)
-                if response.status_code == 200:
-                    return response.url
-                if response.status_code in [405, 501]:
-                    fallback = self.session.get(url, timeout=5, allow_redirects=True, stream=True)
-                    fallback.close()
-                    if fallback.status_code == 200:
-                        return fallback.url
-            except Exception:
-                pass
+        # Probe every candidate at once, then take the first hit in priority
+        # order, so discovery costs one round trip instead of up to five.
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(candidates))
+        try:
+            futures = [executor.submit(self._probe_sitemap_candidate, url) for url in candidates]
+            for future in futures:
+                found = future.result()
+                if found:
+                    return found
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return None
 
+    def _probe_sitemap_candidate(self, url: str) -> Optional[str]:
+        try:
+            response = self.session.head(url, timeout=5, allow_redirects=True)
+            if response.status_code == 200:
+                return response.url
+            if response.status_code in [405, 501]:
+                fallback = self.session.get(url, timeout=5, allow_redirects=True, stream=True)
+                fallback.close()
+                if fallback.status_code == 200:
+                    return fallback.url
+        except Exception:
+            pass
         return None
 
-    def fetch_sitemap_urls(self, url: str, depth: int = 0) -> List[str]:
+    def fetch_sitemap_urls(self, url: str, depth: int = 0) -> Iterator[str]:
         if depth > 2:
-            return []
+            return
 
         try:
-            response = self.session.get(url, timeout=10)
-            if response.status_code != 200:
-                return []
-
-            soup = BeautifulSoup(response.content, "xml")
-            all_urls: List[str] = []
-
-            if soup.find("sitemap"):
-                sub_maps = []
-                for sitemap_tag in soup.find_all("sitemap"):
-                    loc_tag = sitemap_tag.find("loc", recursive=False)
-                    if loc_tag and loc_tag.text:
-                        sub_maps.append(loc_tag.text.strip())
-
-                targets = [s for s in sub_maps if "post" in s or "recipe" in s]
-                if not targets:
-                    targets = sub_maps
-
-                for sub_map in targets[:3]:
-                    all_urls.extend(self.fetch_sitemap_urls(sub_map, depth + 1))
-                return all_urls
-
-            if soup.find("url"):
-                urls = []
-                for url_tag in soup.find_all("url"):
-                    loc_tag = url_tag.find("loc", recursive=False)
-                    if not loc_tag or not loc_tag.text:
-                        continue
-                    loc = loc_tag.text.strip()
-                    if loc.startswith("http://") or loc.startswith("https://"):
-                        urls.append(loc)
-                return urls
-
-            return []
+            # Stream the body straight into the parser so large sitemap
+            # indexes are never held in memory as one bytes object.
+            response = self.session.get(url, timeout=10, stream=True)
+            try:
+                if response.status_code != 200:
+                    return
 
+                response.raw.decode_content = True
+                is_index, sub_maps, page_urls = _parse_sitemap(response.raw)
+            finally:
+                response.close()
         except Exception as exc:
             logger.warning(f"Sitemap parse error {url}: {exc}")
-            return []
+            return
+
+        if is_index:
+            targets = [s for s in sub_maps if "post" in s or "recipe" in s]
+            if not targets:
+                targets = sub_maps
+
+            # Child sitemaps are yielded through rather than concatenated at
+            # every level; get_urls_for_site materializes the result once.
+            for sub_map in targets[:3]:
+                yield from self.fetch_sitemap_urls(sub_map, depth + 1)
+            return
+
+        for loc in page_urls:
+            if loc.startswith("http://") or loc.startswith("https://"):
+                yield loc
 
     def get_urls_for_site(self, site_url: str, force_refresh: bool = False) -> List[RecipeCandidate]:
         if not force_refresh:
@@ -126,6 +182,6 @@ class SitemapCrawler:
         if not sitemap_url:
             return []
 
-        urls = self.fetch_sitemap_urls(sitemap_url)
+        urls = list(self.fetch_sitemap_urls(sitemap_url))
         self.storage.cache_sitemap(site_url, sitemap_url, urls)
         return [RecipeCandidate(url=url) for url in urls]
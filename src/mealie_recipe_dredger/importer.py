@@ -1,3 +1,5 @@
+import contextlib
+import itertools
 import logging
 import threading
 from typing import Any, Dict, List, Optional, Set, Tuple
@@ -5,18 +7,24 @@ from typing import Any, Dict, List, Optional, Set, Tuple
 import requests
 from requests.adapters import HTTPAdapter
 
+from . import json_utils
 from .config import (
     IMPORT_PRECHECK_DUPLICATES,
+    IMPORT_WORKERS,
     MEALIE_API_TOKEN,
     MEALIE_ENABLED,
     MEALIE_IMPORT_TIMEOUT,
     MEALIE_URL,
     TRANSIENT_HTTP_CODES,
 )
+from .paging_utils import iter_prefetched
 from .runtime import RateLimiter
 from .storage import StorageManager
 from .url_utils import canonicalize_url
 
+# Recipe-list pages fetched at once while building the duplicate precheck index.
+SOURCE_INDEX_PAGE_WORKERS = 4
+
 logger = logging.getLogger("dredger")
 
 
@@ -30,11 +38,15 @@ class ImportManager:
     ):
         self.session = session
         self.import_session = requests.Session()
-        self.import_session.headers.update(dict(self.session.headers))
+        self.import_session.headers.update(self.session.headers)
+        self.import_session.headers["Authorization"] = f"Bearer {MEALIE_API_TOKEN}"
         # Import requests should not be retried by urllib3 adapters; timeout
         # handling is managed explicitly by this class and retry_queue logic.
-        self.import_session.mount("http://", HTTPAdapter(max_retries=0))
-        self.import_session.mount("https://", HTTPAdapter(max_retries=0))
+        # All traffic goes to one Mealie host, so a single keep-alive pool sized
+        # for the import workers is enough.
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(10, IMPORT_WORKERS), max_retries=0)
+        self.import_session.mount("http://", adapter)
+        self.import_session.mount("https://", adapter)
         self.storage = storage
         self.rate_limiter = rate_limiter
         self.dry_run = dry_run
@@ -42,11 +54,17 @@ class ImportManager:
             "/api/recipes/create/url",
             "/api/recipes/create-url",
         ]
-        self._mealie_import_path: Optional[str] = None
-        self._known_source_urls: Set[str] = set()
+        # Endpoint discovered on a previous run, so cold starts skip the probe.
+        self._mealie_import_path: Optional[str] = storage.get_cached_import_path(MEALIE_URL)
+        self._import_targets = self._ordered_import_targets()
+        # hash() of each canonical source URL rather than the URL itself: an
+        # int per recipe instead of a ~100-byte string for large libraries.
+        # A 64-bit collision would only skip one import as a duplicate.
+        self._known_source_hashes: Set[int] = set()
         self._source_index_loaded = False
         self._source_index_failed = False
         self._source_lock = threading.Lock()
+        self._warm_up_thread: Optional[threading.Thread] = None
 
     def _compact_error_body(self, text: str) -> str:
         body = text.strip().replace("\n", " ")
@@ -60,6 +78,22 @@ class ImportManager:
         # Retrying these is usually wasted time.
         return "unknown error" in lowered or "noresultfound" in lowered or "no result found" in lowered
 
+    def _ordered_import_targets(self) -> Tuple[Tuple[str, str], ...]:
+        # (path, full URL) pairs with the learned endpoint first, rebuilt only
+        # when the endpoint changes rather than on every import.
+        paths = list(self._mealie_endpoint_candidates)
+        if self._mealie_import_path in paths:
+            paths.remove(self._mealie_import_path)
+            paths.insert(0, self._mealie_import_path)
+        return tuple((path, f"{MEALIE_URL}{path}") for path in paths)
+
+    def _remember_import_path(self, path: str) -> None:
+        if self._mealie_import_path != path:
+            self._mealie_import_path = path
+            self._import_targets = self._ordered_import_targets()
+            self.storage.cache_import_path(MEALIE_URL, path)
+            logger.info(f"   [Mealie] Using import endpoint: {path}")
+
     def _extract_source_url(self, recipe: Dict[str, Any]) -> str:
         for key in ["orgURL", "originalURL", "source"]:
             value = recipe.get(key)
@@ -67,110 +101,133 @@ class ImportManager:
                 return value.strip()
         return ""
 
-    def _load_existing_sources(self, headers: Dict[str, str]) -> None:
+    def _fetch_source_page(self, page: int) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        # Returns (payload, None) or (None, reason); the caller logs the
+        # reason once, however many prefetched pages failed alongside it.
+        response = self.import_session.get(
+            f"{MEALIE_URL}/api/recipes",
+            params={"page": page, "perPage": 1000},
+            timeout=MEALIE_IMPORT_TIMEOUT,
+        )
+        if response.status_code != 200:
+            return None, f"recipe list HTTP {response.status_code}"
+
+        payload = json_utils.loads(response.content)
+        if not isinstance(payload, dict):
+            return None, "recipe list payload is not an object"
+        return payload, None
+
+    def _index_source_page(self, payload: Dict[str, Any], source_hashes: Set[int]) -> bool:
+        # Returns False on an empty page, which ends the listing.
+        items = payload.get("items", [])
+        if not isinstance(items, list) or not items:
+            return False
+
+        # Index entries are mostly unique, so they bypass the
+        # canonicalize_url cache rather than flushing it.
+        extracted = (self._extract_source_url(item) for item in items if isinstance(item, dict))
+        source_hashes.update(map(hash, filter(None, map(canonicalize_url.__wrapped__, extracted))))
+        return True
+
+    def _load_existing_sources(self) -> None:
         if self._source_index_loaded or self._source_index_failed:
             return
 
-        source_urls: Set[str] = set()
-        page = 1
+        source_hashes: Set[int] = set()
         try:
-            while True:
-                response = self.import_session.get(
-                    f"{MEALIE_URL}/api/recipes",
-                    headers=headers,
-                    params={"page": page, "perPage": 1000},
-                    timeout=MEALIE_IMPORT_TIMEOUT,
+            first_page = self._fetch_source_page(1)
+            payload = first_page[0]
+            total_pages = payload.get("total_pages") if payload is not None else None
+            # Mealie reports total_pages; the remaining pages are then fetched
+            # a few at a time (consumed in order) instead of one round trip at
+            # a time, and the trailing empty-page request is never made. A
+            # failed or empty page cancels the fetches still queued.
+            if isinstance(total_pages, int):
+                later_pages = iter_prefetched(
+                    self._fetch_source_page, range(2, total_pages + 1), SOURCE_INDEX_PAGE_WORKERS
                 )
-                if response.status_code != 200:
-                    logger.warning(f"   [Mealie] Duplicate precheck disabled: recipe list HTTP {response.status_code}")
-                    self._source_index_failed = True
-                    return
-
-                payload = response.json()
-                if not isinstance(payload, dict):
-                    self._source_index_failed = True
-                    return
-
-                items = payload.get("items", [])
-                if not isinstance(items, list) or not items:
-                    break
-
-                for item in items:
-                    if not isinstance(item, dict):
-                        continue
-                    source_url = self._extract_source_url(item)
-                    canonical_source = canonicalize_url(source_url)
-                    if canonical_source:
-                        source_urls.add(canonical_source)
-
-                page += 1
-
-            self._known_source_urls = source_urls
+            else:
+                later_pages = (self._fetch_source_page(page) for page in itertools.count(2))
+            with contextlib.closing(later_pages) as pages:
+                for page_payload, error in itertools.chain((first_page,), pages):
+                    if page_payload is None:
+                        logger.warning(f"   [Mealie] Duplicate precheck disabled: {error}")
+                        self._source_index_failed = True
+                        return
+                    if not self._index_source_page(page_payload, source_hashes):
+                        break
+
+            self._known_source_hashes = source_hashes
             self._source_index_loaded = True
-            logger.info(f"   [Mealie] Duplicate precheck source index loaded: {len(source_urls)} entries")
+            logger.info(f"   [Mealie] Duplicate precheck source index loaded: {len(source_hashes)} entries")
         except Exception as exc:
             logger.warning(f"   [Mealie] Duplicate precheck unavailable: {exc}")
             self._source_index_failed = True
 
-    def _precheck_duplicate_source(self, url: str, headers: Dict[str, str]) -> bool:
+    def warm_up(self) -> None:
+        # Open the Mealie keep-alive connection (and, with the precheck on,
+        # load the source index) in the background while the first site is
+        # crawled, so the first import does not pay for it.
+        if self.dry_run or not MEALIE_ENABLED or self._warm_up_thread is not None:
+            return
+        self._warm_up_thread = threading.Thread(target=self._warm_up, name="mealie-warm-up", daemon=True)
+        self._warm_up_thread.start()
+
+    def _warm_up(self) -> None:
+        if IMPORT_PRECHECK_DUPLICATES:
+            with self._source_lock:
+                self._load_existing_sources()
+            return
+        try:
+            self.import_session.get(f"{MEALIE_URL}/api/app/about", timeout=5).close()
+        except requests.exceptions.RequestException:
+            pass
+
+    def _precheck_duplicate_source(self, url: str) -> bool:
         if not IMPORT_PRECHECK_DUPLICATES:
             return False
 
         with self._source_lock:
-            self._load_existing_sources(headers)
+            self._load_existing_sources()
             if self._source_index_failed:
                 return False
 
             canonical_source = canonicalize_url(url)
-            if canonical_source and canonical_source in self._known_source_urls:
+            if canonical_source and hash(canonical_source) in self._known_source_hashes:
                 logger.info(f"   ⚠️ [Mealie] Duplicate source URL detected, skipping import: {url}")
                 return True
         return False
 
+    def _record_success(self, path: str, url: str, duplicate: bool) -> None:
+        self._remember_import_path(path)
+        canonical_source = canonicalize_url(url)
+        if canonical_source:
+            with self._source_lock:
+                self._known_source_hashes.add(hash(canonical_source))
+        if duplicate:
+            logger.info(f"   ⚠️ [Mealie] Duplicate: {url}")
+        else:
+            logger.info(f"   ✅ [Mealie] Imported: {url}")
+
     def import_to_mealie(self, url: str) -> Tuple[bool, Optional[str], bool]:
         if self.dry_run:
             logger.info(f"   [DRY RUN] Would import to Mealie: {url}")
             return True, None, False
 
-        headers = {"Authorization": f"Bearer {MEALIE_API_TOKEN}"}
         try:
-            if self._precheck_duplicate_source(url, headers):
+            if self._precheck_duplicate_source(url):
                 return True, None, False
 
-            candidate_paths = list(self._mealie_endpoint_candidates)
-            if self._mealie_import_path in candidate_paths:
-                candidate_paths.remove(self._mealie_import_path)
-                candidate_paths.insert(0, self._mealie_import_path)
-
             endpoint_error = None
-            for path in candidate_paths:
+            for path, target in self._import_targets:
                 response = self.import_session.post(
-                    f"{MEALIE_URL}{path}",
-                    headers=headers,
+                    target,
                     json={"url": url},
                     timeout=MEALIE_IMPORT_TIMEOUT,
                 )
 
-                if response.status_code in [200, 201, 202]:
-                    if self._mealie_import_path != path:
-                        self._mealie_import_path = path
-                        logger.info(f"   [Mealie] Using import endpoint: {path}")
-                    canonical_source = canonicalize_url(url)
-                    if canonical_source:
-                        with self._source_lock:
-                            self._known_source_urls.add(canonical_source)
-                    logger.info(f"   ✅ [Mealie] Imported: {url}")
-                    return True, None, False
-
-                if response.status_code == 409:
-                    if self._mealie_import_path != path:
-                        self._mealie_import_path = path
-                        logger.info(f"   [Mealie] Using import endpoint: {path}")
-                    canonical_source = canonicalize_url(url)
-                    if canonical_source:
-                        with self._source_lock:
-                            self._known_source_urls.add(canonical_source)
-                    logger.info(f"   ⚠️ [Mealie] Duplicate: {url}")
+                if response.status_code in [200, 201, 202, 409]:
+                    self._record_success(path, url, duplicate=response.status_code == 409)
                     return True, None, False
 
                 if response.status_code in [404, 405]:
@@ -0,0 +1,46 @@
+import dataclasses
+import json
+import os
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+# catching the stdlib exception type regardless of which backend is active.
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    if ORJSON_AVAILABLE:
+        # orjson rejects str subclasses such as bs4's NavigableString/Script.
+        if isinstance(data, str) and type(data) is not str:
+            data = str(data)
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _default(value: Any) -> Any:
+    # Mirrors orjson, which serializes dataclass instances natively.
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(value: Any, indent: bool = False) -> bytes:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(value, indent=2 if indent else None, ensure_ascii=False, default=_default).encode("utf-8")
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    # Write a sibling temp file and rename it over the target, so a crash
+    # mid-write leaves the previous file intact instead of a torn one.
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
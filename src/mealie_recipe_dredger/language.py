@@ -1,20 +1,158 @@
-import json
+from __future__ import annotations
+
+import functools
+import os
 import re
-from typing import Any, Iterable, Optional, Tuple
+import threading
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional, Tuple, Union
+
+from langdetect import DetectorFactory, LangDetectException
+from langdetect.detector import Detector
+from langdetect.detector_factory import PROFILES_DIRECTORY
+from langdetect.utils.ngram import NGram
+
+from . import json_utils
+from .config import LANGUAGE_COMPACT_PROFILES, LANGUAGE_DETECTOR, LANGUAGE_FASTTEXT_MODEL, TARGET_LANGUAGE
+
+try:
+    from lingua import IsoCode639_1, LanguageDetectorBuilder
+
+    LINGUA_AVAILABLE = True
+except ImportError:
+    LINGUA_AVAILABLE = False
 
-from bs4 import BeautifulSoup
-from langdetect import DetectorFactory, LangDetectException, detect_langs
+try:
+    import fasttext
+
+    FASTTEXT_AVAILABLE = True
+except ImportError:
+    FASTTEXT_AVAILABLE = False
+
+if TYPE_CHECKING:
+    # bs4 is only imported when raw HTML has to be parsed here; keeping it out
+    # of the runtime imports lets the cleaner use payload detection without
+    # loading the HTML stack.
+    from bs4 import BeautifulSoup
 
 # Make detection deterministic between runs.
 DetectorFactory.seed = 0
 
-WHITESPACE_RE = re.compile(r"\s+")
+
+# High-coverage languages kept alongside TARGET_LANGUAGE when compact profiles
+# are enabled (opt-in). Languages outside this set are scored against the
+# nearest loaded profile: they may be reported as a related language (Dutch
+# or Swedish as "de") or fall below the confidence threshold and go undecided.
+COVERAGE_LANGUAGES = frozenset(
+    ["ar", "bn", "de", "en", "es", "fr", "hi", "id", "it", "ja", "ko", "pt", "ru", "zh"]
+)
+
+# Text beyond this many characters never reaches the detector.
+MAX_DETECTION_CHARS = 12000
+
+# Soup filters built once instead of on every page.
+CONTENT_LANGUAGE_RE = re.compile(r"content-language", re.IGNORECASE)
+LANGUAGE_NAME_RE = re.compile(r"language", re.IGNORECASE)
+OG_LOCALE_RE = re.compile(r"og:locale", re.IGNORECASE)
+DESCRIPTION_RE = re.compile(r"description", re.IGNORECASE)
+# <meta> attribute checks in priority order; like bs4's regex attribute
+# filters they match with re.search.
+DECLARED_LANGUAGE_META = (
+    ("http-equiv", CONTENT_LANGUAGE_RE),
+    ("name", LANGUAGE_NAME_RE),
+    ("property", OG_LOCALE_RE),
+)
+LD_JSON_TYPE_RE = re.compile(r"ld\+json")
+# Heavy JSON-LD node types that never carry the page's inLanguage, compared
+# after _jsonld_type_name. Blocks made up only of these are not walked; any
+# other type (Recipe, ItemPage, HowTo, ...) may declare the language.
+JSONLD_SKIP_TYPES = frozenset(
+    (
+        "aggregateoffer",
+        "aggregaterating",
+        "breadcrumblist",
+        "imageobject",
+        "listitem",
+        "offer",
+        "organization",
+        "person",
+        "searchaction",
+        "sitenavigationelement",
+        "videoobject",
+    )
+)
+TEXT_TAG_NAMES = frozenset(("h1", "h2", "p"))
+TEXT_TAG_LIMIT = 35
+SPACE_RUN_RE = re.compile(" {2,}")
+ASCII_LETTER_RE = re.compile(r"[A-Za-z]")
+PAYLOAD_LANGUAGE_KEYS = ("language", "recipeLanguage", "inLanguage", "orgLanguage", "originalLanguage")
+# Payloads sampled individually by detect_languages_from_payloads.
+BATCH_SAMPLE_SIZE = 5
+PAYLOAD_TEXT_KEYS = ("name", "description", "subtitle", "recipeYield")
+INGREDIENT_TEXT_KEYS = ("title", "note", "food", "text")
+STEP_TEXT_KEYS = ("text", "title", "name")
+FASTTEXT_LABEL_PREFIX = "__label__"
+# Function words distinctive to English (no "a", "in", "to" or "for", which
+# other Latin-script languages share). Enough distinct hits in an ASCII
+# sample mark a payload as plainly English without running the detector.
+ENGLISH_MARKER_RE = re.compile(r"\b(?:the|and|with|then|until|into|your|from)\b", re.IGNORECASE)
+ENGLISH_MARKER_MIN = 3
+ENGLISH_SAMPLE_CHARS = 600
+# Scripts written by exactly one detectable language, as (language, ranges,
+# required ranges). Han text only counts as Japanese alongside kana.
+# Devanagari, Arabic, Cyrillic and Bengali are shared by several languages and
+# are left to the detector.
+SCRIPT_LANGUAGES = (
+    ("el", "Ͱ-Ͽἀ-῿", None),
+    ("he", "֐-׿", None),
+    ("pa", "਀-੿", None),
+    ("gu", "઀-૿", None),
+    ("ta", "஀-௿", None),
+    ("te", "ఀ-౿", None),
+    ("kn", "ಀ-೿", None),
+    ("ml", "ഀ-ൿ", None),
+    ("th", "฀-๿", None),
+    ("ko", "ᄀ-ᇿ㄰-㆏가-힯", None),
+    ("ja", "぀-ヿ一-鿿", "぀-ヿ"),
+)
+LETTER_RE = re.compile(r"[^\W\d_]")
+
+
+def _build_script_table() -> Tuple[bytes, Tuple[Tuple[str, "re.Pattern[str]", Optional["re.Pattern[str]"]], ...]]:
+    # One byte per 128-code-point BMP block naming the SCRIPT_LANGUAGES entry
+    # (1-based) the block belongs to. Blocks only nominate a candidate; the
+    # exact ranges are confirmed by the entry's regexes.
+    table = bytearray(0x10000 >> 7)
+    checks = []
+    for tag, (language, ranges, required) in enumerate(SCRIPT_LANGUAGES, start=1):
+        for start, end in zip(ranges[0::3], ranges[2::3]):
+            for block in range(ord(start) >> 7, (ord(end) >> 7) + 1):
+                table[block] = tag
+        only_script = re.compile(rf"[\W\d_{ranges}]*")
+        checks.append((language, only_script, re.compile(f"[{required}]") if required else None))
+    return bytes(table), tuple(checks)
+
+
+_SCRIPT_OF_BLOCK, _SCRIPT_CHECKS = _build_script_table()
+
+
+_detector_factory: Optional[DetectorFactory] = None
+_lingua_detector: Any = None
+_fasttext_model: Any = None
+_fasttext_failed = False
+_detector_local = threading.local()
+_detector_factory_lock = threading.Lock()
 
 
 def normalize_language_code(value: object) -> Optional[str]:
     if not isinstance(value, str):
         return None
+    return _normalize_language_string(value)
 
+
+# Pages and payloads repeat a handful of tags ("en-US", "en_GB", ...), so the
+# string normalization is memoized; non-string values never reach the cache.
+@functools.lru_cache(maxsize=512)
+def _normalize_language_string(value: str) -> Optional[str]:
     cleaned = value.strip().lower().replace("_", "-")
     if not cleaned or cleaned == "x-default":
         return None
@@ -25,6 +163,125 @@ def normalize_language_code(value: object) -> Optional[str]:
     return primary
 
 
+def _compact_languages() -> set[str]:
+    wanted = set(COVERAGE_LANGUAGES)
+    if TARGET_LANGUAGE:
+        wanted.add(TARGET_LANGUAGE)
+    return wanted
+
+
+def _selected_profile_files() -> list[str]:
+    filenames = sorted(name for name in os.listdir(PROFILES_DIRECTORY) if not name.startswith("."))
+    if not LANGUAGE_COMPACT_PROFILES:
+        return filenames
+
+    wanted = _compact_languages()
+    return [name for name in filenames if normalize_language_code(name) in wanted]
+
+
+def _use_fasttext() -> bool:
+    # fastText needs a language-ID model on disk (lid.176.ftz); "auto" picks
+    # it over lingua/langdetect only when LANGUAGE_FASTTEXT_MODEL is set and
+    # the model loaded.
+    return (
+        FASTTEXT_AVAILABLE
+        and bool(LANGUAGE_FASTTEXT_MODEL)
+        and not _fasttext_failed
+        and LANGUAGE_DETECTOR in ("auto", "fasttext")
+    )
+
+
+def _use_lingua() -> bool:
+    # "auto" prefers the native lingua backend when it is installed; anything
+    # else (or a missing package) keeps langdetect.
+    return LINGUA_AVAILABLE and LANGUAGE_DETECTOR in ("auto", "lingua")
+
+
+def _get_detector_factory() -> DetectorFactory:
+    global _detector_factory
+    if _detector_factory is not None:
+        return _detector_factory
+
+    with _detector_factory_lock:
+        if _detector_factory is None:
+            profiles = []
+            for name in _selected_profile_files():
+                with open(os.path.join(PROFILES_DIRECTORY, name), "r", encoding="utf-8") as handle:
+                    profiles.append(handle.read())
+            factory = DetectorFactory()
+            factory.load_json_profile(profiles)
+            _detector_factory = factory
+    return _detector_factory
+
+
+def _get_lingua_detector() -> Any:
+    global _lingua_detector
+    if _lingua_detector is not None:
+        return _lingua_detector
+
+    with _detector_factory_lock:
+        if _lingua_detector is None:
+            if LANGUAGE_COMPACT_PROFILES:
+                codes = [getattr(IsoCode639_1, code.upper(), None) for code in sorted(_compact_languages())]
+                builder = LanguageDetectorBuilder.from_iso_codes_639_1(*filter(None, codes))
+            else:
+                builder = LanguageDetectorBuilder.from_all_languages()
+            _lingua_detector = builder.with_preloaded_language_models().build()
+    return _lingua_detector
+
+
+def _get_fasttext_model() -> Any:
+    global _fasttext_model, _fasttext_failed
+    if _fasttext_model is not None:
+        return _fasttext_model
+
+    with _detector_factory_lock:
+        if _fasttext_model is None:
+            try:
+                _fasttext_model = fasttext.load_model(LANGUAGE_FASTTEXT_MODEL)
+            except Exception:
+                # A missing or unreadable model falls back to the other
+                # backends for the rest of the run instead of failing per call.
+                _fasttext_failed = True
+                raise
+    return _fasttext_model
+
+
+def _get_detector() -> Detector:
+    # One Detector per thread, reset between calls. Detection reseeds its RNG
+    # from the factory seed on every run, so reuse keeps results identical.
+    detector = getattr(_detector_local, "detector", None)
+    if detector is None:
+        detector = _get_detector_factory().create()
+        _detector_local.detector = detector
+    detector.text = ""
+    detector.langprob = None
+    return detector
+
+
+def _append_detector_text(detector: Detector, text: str) -> None:
+    # Same cleanup as Detector.append(), whose per-character loop collapses
+    # runs of spaces after truncation, done with one regex pass instead.
+    text = Detector.URL_RE.sub(" ", text)
+    text = Detector.MAIL_RE.sub(" ", text)
+    text = NGram.normalize_vi(text)
+    detector.text += SPACE_RUN_RE.sub(" ", text[: detector.max_text_length])
+
+
+def warm_language_detector() -> None:
+    """Load detector profiles up front so worker threads share one ready factory."""
+    if _use_fasttext():
+        try:
+            _get_fasttext_model()
+            return
+        except Exception:
+            pass
+    if _use_lingua():
+        _get_lingua_detector()
+    else:
+        _get_detector_factory()
+
+
 def _coerce_text(value: object) -> str:
     if isinstance(value, str):
         return value
@@ -33,20 +290,74 @@ def _coerce_text(value: object) -> str:
     return str(value)
 
 
-def _iter_strings(values: Iterable[object]) -> Iterable[str]:
+def _collapse_whitespace(text: str) -> str:
+    # Same result as re.sub(r"\s+", " ", text).strip() in a single C-level pass.
+    return " ".join(text.split())
+
+
+def _collapse_whitespace_prefix(text: str, limit: int) -> str:
+    # Equals _collapse_whitespace(text)[:limit] without normalizing the whole
+    # input: collapsing a prefix always yields a prefix of the full result, so
+    # a head that still fills the limit after collapsing is enough.
+    head = text[: limit * 2]
+    collapsed = _collapse_whitespace(head)
+    if len(collapsed) < limit and len(head) < len(text):
+        collapsed = _collapse_whitespace(text)
+    return collapsed[:limit]
+
+
+def _iter_strings(values: Iterable[object]) -> Iterator[str]:
+    # Yields each value whitespace-collapsed (which also strips it), skipping
+    # values that end up empty. _coerce_text/_collapse_whitespace are inlined:
+    # this runs for every ingredient and step field, and None (a missing
+    # field) is by far the most common non-string value.
     for value in values:
-        text = _coerce_text(value).strip()
+        if not isinstance(value, str):
+            if value is None:
+                continue
+            value = str(value)
+        text = " ".join(value.split())
         if text:
             yield text
 
 
 def detect_language_from_text(text: str, min_confidence: float = 0.70) -> Tuple[Optional[str], float]:
-    normalized_text = WHITESPACE_RE.sub(" ", _coerce_text(text)).strip()
+    normalized_text = _collapse_whitespace_prefix(_coerce_text(text), MAX_DETECTION_CHARS)
     if not normalized_text:
         return None, 0.0
+    # ASCII without letters ("12", "1/2 - 250") has no n-gram features, so
+    # the detector could only fail on it.
+    if normalized_text.isascii() and ASCII_LETTER_RE.search(normalized_text) is None:
+        return None, 0.0
+
+    language, confidence = _detect_top_language(normalized_text)
+    if not language:
+        return None, confidence
+    if confidence < min_confidence:
+        return None, confidence
+    return language, confidence
+
+
+# Seeded detection is deterministic, and imports from one site repeat the
+# same boilerplate text, so results are memoized on the bounded input text.
+@functools.lru_cache(maxsize=256)
+def _detect_top_language(text: str) -> Tuple[Optional[str], float]:
+    if not text.isascii():
+        script_language = _script_language(text)
+        if script_language:
+            return script_language, 1.0
+    if _use_fasttext():
+        try:
+            return _detect_top_language_fasttext(text)
+        except Exception:
+            pass
+    if _use_lingua():
+        return _detect_top_language_lingua(text)
 
     try:
-        detections = detect_langs(normalized_text[:12000])
+        detector = _get_detector()
+        _append_detector_text(detector, text)
+        detections = detector.get_probabilities()
     except LangDetectException:
         return None, 0.0
     except Exception:
@@ -56,102 +367,210 @@ def detect_language_from_text(text: str, min_confidence: float = 0.70) -> Tuple[
         return None, 0.0
 
     top_detection = detections[0]
-    language = normalize_language_code(top_detection.lang)
-    confidence = float(top_detection.prob)
-    if not language:
-        return None, confidence
-    if confidence < min_confidence:
-        return None, confidence
-    return language, confidence
+    return normalize_language_code(top_detection.lang), float(top_detection.prob)
+
+
+def _script_language(text: str) -> Optional[str]:
+    # Text whose letters all come from a single-language script needs no
+    # statistical detection: the first letter picks a candidate script from
+    # the block table, then one regex pass confirms no other letters appear.
+    match = LETTER_RE.search(text)
+    if match is None:
+        return None
+    codepoint = ord(match.group())
+    if codepoint >= 0x10000:
+        return None
+    tag = _SCRIPT_OF_BLOCK[codepoint >> 7]
+    if not tag:
+        return None
+    language, only_script, required = _SCRIPT_CHECKS[tag - 1]
+    if only_script.fullmatch(text) is None:
+        return None
+    if required is not None and required.search(text) is None:
+        return None
+    return language
+
+
+def _detect_top_language_fasttext(text: str) -> Tuple[Optional[str], float]:
+    # Input is already whitespace-collapsed, so it carries no newlines
+    # (which fastText's predict rejects).
+    labels, probabilities = _get_fasttext_model().predict(text, k=1)
+    if not labels:
+        return None, 0.0
+
+    label = labels[0]
+    if label.startswith(FASTTEXT_LABEL_PREFIX):
+        label = label[len(FASTTEXT_LABEL_PREFIX) :]
+    # Softmax outputs can exceed 1.0 by a rounding error.
+    return normalize_language_code(label), min(float(probabilities[0]), 1.0)
+
+
+def _detect_top_language_lingua(text: str) -> Tuple[Optional[str], float]:
+    try:
+        values = _get_lingua_detector().compute_language_confidence_values(text)
+    except Exception:
+        return None, 0.0
+
+    if not values:
+        return None, 0.0
+
+    top_value = values[0]
+    return normalize_language_code(top_value.language.iso_code_639_1.name), float(top_value.value)
 
 
-def _extract_declared_language_from_jsonld(soup: BeautifulSoup) -> Optional[str]:
-    def find_in_language(payload: Any) -> Optional[str]:
-        if isinstance(payload, dict):
-            if "inLanguage" in payload:
-                value = payload["inLanguage"]
-                if isinstance(value, list):
-                    for item in value:
-                        normalized = normalize_language_code(item)
-                        if normalized:
-                            return normalized
-                else:
-                    normalized = normalize_language_code(value)
+def _find_in_language(payload: Any) -> Optional[str]:
+    # Explicit-stack walk in the same depth-first, document order the old
+    # recursive version used, without a Python frame per JSON node. Only
+    # containers are pushed, so scalar leaves never round-trip the stack.
+    if not isinstance(payload, (dict, list)):
+        return None
+    stack = [payload]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        node = pop()
+        if isinstance(node, dict):
+            if "inLanguage" in node:
+                value = node["inLanguage"]
+                for item in value if isinstance(value, list) else (value,):
+                    normalized = normalize_language_code(item)
                     if normalized:
                         return normalized
+            children = reversed(node.values())
+        else:
+            children = reversed(node)
+        for child in children:
+            if isinstance(child, (dict, list)):
+                push(child)
+    return None
 
-            for nested in payload.values():
-                found = find_in_language(nested)
-                if found:
-                    return found
 
-        if isinstance(payload, list):
-            for nested in payload:
-                found = find_in_language(nested)
-                if found:
-                    return found
+def _matches(value: object, pattern: re.Pattern[str]) -> bool:
+    return isinstance(value, str) and pattern.search(value) is not None
 
-        return None
 
-    for script in soup.find_all("script", type=lambda v: isinstance(v, str) and "ld+json" in v):
+def _jsonld_type_name(value: str) -> str:
+    # "http://schema.org/Recipe", "schema:Recipe" and "recipe" all give "recipe".
+    return value.rsplit("/", 1)[-1].rsplit(":", 1)[-1].strip().casefold()
+
+
+def _may_declare_language(data: Any) -> bool:
+    # Checks the top-level nodes and any @graph members; untyped nodes are
+    # kept since nothing can be said about them without walking.
+    for node in data if isinstance(data, list) else (data,):
+        if not isinstance(node, dict):
+            continue
+        graph = node.get("@graph")
+        members = graph if isinstance(graph, list) else ()
+        for item in (node, *members):
+            if not isinstance(item, dict):
+                continue
+            if item is node and members and "@type" not in item:
+                continue
+            types = item.get("@type")
+            if types is None:
+                return True
+            for value in types if isinstance(types, list) else (types,):
+                if isinstance(value, str) and _jsonld_type_name(value) not in JSONLD_SKIP_TYPES:
+                    return True
+    return False
+
+
+def _extract_declared_language_from_jsonld(scripts: Iterable[Any]) -> Optional[str]:
+    for script in scripts:
         raw = script.string or script.get_text()
         if not raw:
             continue
         try:
-            data = json.loads(raw)
+            data = json_utils.loads(raw)
         except Exception:
             continue
-        found = find_in_language(data)
+        if not _may_declare_language(data):
+            continue
+        found = _find_in_language(data)
         if found:
             return found
     return None
 
 
-def _extract_declared_language_from_soup(soup: BeautifulSoup) -> Optional[str]:
+# Returns (declared language, text sample); the text sample is only built
+# when the page declares no language.
+def _scan_soup(soup: BeautifulSoup) -> Tuple[Optional[str], str]:
     html_tag = soup.find("html")
     if html_tag:
-        lang_attr = html_tag.attrs.get("lang")
-        normalized = normalize_language_code(lang_attr)
+        normalized = normalize_language_code(html_tag.attrs.get("lang"))
         if normalized:
-            return normalized
-
-    for selector in [
-        {"name": "meta", "attrs": {"http-equiv": re.compile(r"content-language", re.IGNORECASE)}},
-        {"name": "meta", "attrs": {"name": re.compile(r"language", re.IGNORECASE)}},
-        {"name": "meta", "attrs": {"property": re.compile(r"og:locale", re.IGNORECASE)}},
-    ]:
-        tag = soup.find(selector["name"], attrs=selector["attrs"])
-        if tag:
+            return normalized, ""
+
+    # One pass collects what used to take a find() per meta selector, a
+    # find_all() for JSON-LD scripts and separate title/description/text
+    # lookups. Each slot keeps the first match, as find() did.
+    language_metas: list[Any] = [None] * len(DECLARED_LANGUAGE_META)
+    scripts = []
+    title = None
+    description = None
+    text_tags = []
+    # Follows the next_element chain directly: the same document order as
+    # soup.descendants without resuming a generator per node. Strings have no
+    # name and fall through every branch.
+    node = soup.contents[0] if soup.contents else None
+    while node is not None:
+        name = node.name
+        if name == "meta":
+            attrs = node.attrs
+            for index, (attr, pattern) in enumerate(DECLARED_LANGUAGE_META):
+                if language_metas[index] is None and _matches(attrs.get(attr), pattern):
+                    language_metas[index] = node
+            if description is None and _matches(attrs.get("name"), DESCRIPTION_RE):
+                description = node
+        elif name == "script":
+            if _matches(node.attrs.get("type"), LD_JSON_TYPE_RE):
+                scripts.append(node)
+        elif name == "title":
+            if title is None:
+                title = node
+        elif name in TEXT_TAG_NAMES and len(text_tags) < TEXT_TAG_LIMIT:
+            text_tags.append(node)
+        node = node.next_element
+
+    for tag in language_metas:
+        if tag is not None:
             normalized = normalize_language_code(tag.attrs.get("content"))
             if normalized:
-                return normalized
-
-    return _extract_declared_language_from_jsonld(soup)
+                return normalized, ""
 
+    declared = _extract_declared_language_from_jsonld(scripts)
+    if declared:
+        return declared, ""
 
-def _extract_text_from_soup(soup: BeautifulSoup) -> str:
     parts = []
-    if soup.title and soup.title.string:
-        parts.append(soup.title.string)
-
-    description = soup.find("meta", attrs={"name": re.compile(r"description", re.IGNORECASE)})
-    if description and description.attrs.get("content"):
+    if title is not None and title.string:
+        parts.append(title.string)
+    if description is not None and description.attrs.get("content"):
         parts.append(_coerce_text(description.attrs.get("content")))
+    texts = (tag.get_text(" ", strip=True) for tag in text_tags)
+    parts.extend(text for text in texts if text)
+
+    return None, _collapse_whitespace(" ".join(parts))
 
-    for tag in soup.find_all(["h1", "h2", "p"], limit=35):
-        text = tag.get_text(" ", strip=True)
-        if text:
-            parts.append(text)
 
-    return WHITESPACE_RE.sub(" ", " ".join(parts)).strip()
+def build_soup(html: Union[str, bytes]) -> BeautifulSoup:
+    # Soups passed to this module are expected to come from the lxml tree
+    # builder (see verifier.make_soup); html.parser is several times slower.
+    from bs4 import BeautifulSoup
+
+    return BeautifulSoup(html, "lxml")
 
 
 def detect_language_from_html(
-    soup: BeautifulSoup,
+    soup: Union[BeautifulSoup, str, bytes],
     response_text: str = "",
     min_confidence: float = 0.70,
 ) -> Tuple[Optional[str], str, float]:
-    declared = _extract_declared_language_from_soup(soup)
+    if isinstance(soup, (str, bytes)):
+        soup = build_soup(soup)
+
+    declared, page_text = _scan_soup(soup)
     if declared:
         return declared, "declared", 1.0
 
@@ -159,8 +578,8 @@ def detect_language_from_html(
         filter(
             None,
             [
-                _extract_text_from_soup(soup),
-                _coerce_text(response_text)[:12000],
+                page_text,
+                _coerce_text(response_text)[:MAX_DETECTION_CHARS],
             ],
         )
     )
@@ -171,11 +590,34 @@ def detect_language_from_html(
     return None, "unknown", confidence
 
 
-def detect_language_from_recipe_payload(
-    payload: dict[str, Any],
-    min_confidence: float = 0.70,
-) -> Tuple[Optional[str], str, float]:
-    for key in ["language", "recipeLanguage", "inLanguage", "orgLanguage", "originalLanguage"]:
+def _iter_payload_text(payload: dict[str, Any]) -> Iterator[str]:
+    yield from _iter_strings(payload.get(key) for key in PAYLOAD_TEXT_KEYS)
+
+    ingredients = payload.get("recipeIngredient")
+    if isinstance(ingredients, list):
+        for ingredient in ingredients[:120]:
+            if isinstance(ingredient, dict):
+                yield from _iter_strings(ingredient.get(key) for key in INGREDIENT_TEXT_KEYS)
+            else:
+                yield from _iter_strings((ingredient,))
+
+    yield from _iter_instruction_text(payload)
+
+
+def _iter_instruction_text(payload: dict[str, Any]) -> Iterator[str]:
+    instructions = payload.get("recipeInstructions")
+    if isinstance(instructions, list):
+        for step in instructions[:180]:
+            if isinstance(step, dict):
+                yield from _iter_strings(step.get(key) for key in STEP_TEXT_KEYS)
+            else:
+                yield from _iter_strings((step,))
+    elif instructions:
+        yield from _iter_strings((instructions,))
+
+
+def _declared_payload_language(payload: dict[str, Any]) -> Optional[Tuple[str, str, float]]:
+    for key in PAYLOAD_LANGUAGE_KEYS:
         value = payload.get(key)
         if isinstance(value, list):
             for item in value:
@@ -186,49 +628,89 @@ def detect_language_from_recipe_payload(
             normalized = normalize_language_code(value)
             if normalized:
                 return normalized, f"field:{key}", 1.0
+    return None
 
-    text_chunks = []
-    text_chunks.extend(
-        _iter_strings(
-            [
-                payload.get("name"),
-                payload.get("description"),
-                payload.get("subtitle"),
-                payload.get("recipeYield"),
-            ]
-        )
+
+def is_obvious_english_payload(payload: dict[str, Any]) -> bool:
+    # Payloads with a declared language always go through the full path.
+    if _declared_payload_language(payload):
+        return False
+
+    # An English title and ingredients over translated steps is a common
+    # scrape result, so the steps are sampled on their own as well.
+    return _is_english_sample(_iter_payload_text(payload)) and (
+        not payload.get("recipeInstructions") or _is_english_sample(_iter_instruction_text(payload))
     )
 
-    ingredients = payload.get("recipeIngredient")
-    if isinstance(ingredients, list):
-        for ingredient in ingredients[:120]:
-            if isinstance(ingredient, dict):
-                text_chunks.extend(
-                    _iter_strings(
-                        [
-                            ingredient.get("title"),
-                            ingredient.get("note"),
-                            ingredient.get("food"),
-                            ingredient.get("text"),
-                        ]
-                    )
-                )
-            else:
-                text_chunks.extend(_iter_strings([ingredient]))
 
-    instructions = payload.get("recipeInstructions")
-    if isinstance(instructions, list):
-        for step in instructions[:180]:
-            if isinstance(step, dict):
-                text_chunks.extend(_iter_strings([step.get("text"), step.get("title"), step.get("name")]))
-            else:
-                text_chunks.extend(_iter_strings([step]))
-    elif instructions:
-        text_chunks.extend(_iter_strings([instructions]))
+def _is_english_sample(chunks: Iterable[str]) -> bool:
+    text_chunks = []
+    collected = 0
+    for chunk in chunks:
+        text_chunks.append(chunk)
+        collected += len(chunk) + 1
+        if collected > ENGLISH_SAMPLE_CHARS:
+            break
 
-    merged_text = WHITESPACE_RE.sub(" ", " ".join(text_chunks)).strip()
-    detected, confidence = detect_language_from_text(merged_text, min_confidence=min_confidence)
+    sample = " ".join(text_chunks)
+    if not sample.isascii():
+        return False
+    markers = {match.lower() for match in ENGLISH_MARKER_RE.findall(sample)}
+    return len(markers) >= ENGLISH_MARKER_MIN
+
+
+def detect_language_from_recipe_payload(
+    payload: dict[str, Any],
+    min_confidence: float = 0.70,
+) -> Tuple[Optional[str], str, float]:
+    declared = _declared_payload_language(payload)
+    if declared:
+        return declared
+
+    # Detection only reads the first MAX_DETECTION_CHARS normalized chars, so
+    # stop pulling ingredients/steps once that much text has been collected.
+    text_chunks = []
+    collected = 0
+    for chunk in _iter_payload_text(payload):
+        text_chunks.append(chunk)
+        collected += len(chunk) + 1
+        if collected > MAX_DETECTION_CHARS:
+            break
+
+    detected, confidence = detect_language_from_text(" ".join(text_chunks), min_confidence=min_confidence)
     if detected:
         return detected, "text", confidence
 
     return None, "unknown", confidence
+
+
+def detect_languages_from_payloads(
+    payloads: list[dict[str, Any]],
+    min_confidence: float = 0.70,
+    sample_size: int = BATCH_SAMPLE_SIZE,
+) -> list[Tuple[Optional[str], str, float]]:
+    # Fast path for payloads expected to share one language (e.g. one site).
+    # Declared fields still win per payload. Of the rest, sample_size spread
+    # across the batch are detected; if they all agree, that language is used
+    # for the others with source "batch", otherwise each is detected alone.
+    results: list[Optional[Tuple[Optional[str], str, float]]] = [_declared_payload_language(p) for p in payloads]
+    pending = [index for index, result in enumerate(results) if result is None]
+    if len(pending) <= sample_size:
+        return [result or detect_language_from_recipe_payload(payloads[index], min_confidence) for index, result in enumerate(results)]
+
+    step = len(pending) / sample_size
+    sampled = {pending[int(slot * step)] for slot in range(sample_size)}
+    for index in sampled:
+        results[index] = detect_language_from_recipe_payload(payloads[index], min_confidence)
+
+    languages = {results[index][0] for index in sampled}
+    language = next(iter(languages))
+    if len(languages) == 1 and language:
+        confidence = min(results[index][2] for index in sampled)
+        batch_result = (language, "batch", confidence)
+        return [result or batch_result for result in results]
+
+    return [
+        result or detect_language_from_recipe_payload(payloads[index], min_confidence)
+        for index, result in enumerate(results)
+    ]
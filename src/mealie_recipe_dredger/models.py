@@ -1,8 +1,13 @@
+import sys
 from dataclasses import asdict, dataclass
 from typing import Optional
 
+# dataclass(slots=True) needs Python 3.10; on 3.9 the classes keep a __dict__.
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+# Built for every sitemap URL, so instances are slotted and immutable.
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class RecipeCandidate:
     url: str
     priority: int = 0
@@ -14,6 +19,29 @@ class RecipeCandidate:
         return self.url == other.url if isinstance(other, RecipeCandidate) else self.url == other
 
 
+# One per retry-queue URL; slotted instead of a three-key dict per entry.
+# json_utils serializes it to the same {"reason", "attempts",
+# "last_attempt"} object the retry file has always held.
+@dataclass(**DATACLASS_SLOTS)
+class RetryEntry:
+    reason: str = ""
+    attempts: int = 0
+    last_attempt: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, value: dict) -> "RetryEntry":
+        try:
+            attempts = int(value.get("attempts", 0))
+        except (TypeError, ValueError):
+            attempts = 0
+        last_attempt = value.get("last_attempt")
+        return cls(
+            reason=str(value.get("reason") or ""),
+            attempts=attempts,
+            last_attempt=last_attempt if isinstance(last_attempt, str) else None,
+        )
+
+
 @dataclass
 class SiteStats:
     site_url: str
@@ -0,0 +1,28 @@
+import concurrent.futures
+import itertools
+from collections import deque
+from typing import Callable, Deque, Generator, Iterable, TypeVar
+
+T = TypeVar("T")
+
+
+def iter_prefetched(fetch: Callable[[int], T], pages: Iterable[int], window: int) -> Generator[T, None, None]:
+    # Yields fetch(page) for each page in order with at most `window` fetches
+    # in flight. When the caller stops early (failed or empty page, an
+    # exception, closing the generator) queued fetches are cancelled, so only
+    # the ones already running are waited for, not the rest of the listing.
+    # Close the generator explicitly (contextlib.closing) after a break.
+    page_iter = iter(pages)
+    window = max(1, window)
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=window)
+    pending: Deque["concurrent.futures.Future[T]"] = deque()
+    try:
+        pending.extend(executor.submit(fetch, page) for page in itertools.islice(page_iter, window))
+        while pending:
+            result = pending.popleft().result()
+            pending.extend(executor.submit(fetch, page) for page in itertools.islice(page_iter, 1))
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
@@ -0,0 +1,72 @@
+import re
+from typing import Any, Optional
+
+try:
+    import re2
+
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+
+# Python's \s on str patterns matches exactly the characters for which
+# str.isspace() is true; RE2's \s is ASCII-only, so the set is spelled out.
+# Hardcoded because scanning every code point at import is slow; a test keeps
+# it in sync with str.isspace().
+UNICODE_WHITESPACE_RE2 = (
+    r"\x{9}-\x{d}\x{1c}-\x{20}\x{85}\x{a0}\x{1680}\x{2000}-\x{200a}"
+    r"\x{2028}-\x{2029}\x{202f}\x{205f}\x{3000}"
+)
+# Escapes whose RE2 meaning differs from Python's Unicode one and that have
+# no simple rewrite; patterns using them stay on `re`.
+UNSUPPORTED_RE2_ESCAPES = frozenset("wWSDB")
+
+
+def _to_re2_superset(pattern: str) -> Optional[str]:
+    # Rewrites a Python pattern into an RE2 pattern matching at least the
+    # same strings: \s and \d get their Unicode classes, and \b (ASCII-only
+    # in RE2) is dropped, which can only add matches. Returns None when the
+    # pattern uses an escape that cannot be carried over this way.
+    out = []
+    in_class = False
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == "\\" and index + 1 < len(pattern):
+            escaped = pattern[index + 1]
+            index += 2
+            if escaped in UNSUPPORTED_RE2_ESCAPES:
+                return None
+            if escaped == "s":
+                out.append(UNICODE_WHITESPACE_RE2 if in_class else f"[{UNICODE_WHITESPACE_RE2}]")
+            elif escaped == "d":
+                out.append("\\p{Nd}")
+            elif escaped == "b":
+                if in_class:
+                    return None
+            else:
+                out.append(char + escaped)
+            continue
+        if char == "[" and not in_class:
+            in_class = True
+        elif char == "]" and in_class:
+            in_class = False
+        out.append(char)
+        index += 1
+    return "".join(out)
+
+
+def compile_gate(pattern: str) -> Any:
+    # RE2 matches in linear time, so scraped slugs, titles and recipe names
+    # cannot trigger catastrophic backtracking. The RE2 form matches a
+    # superset of the `re` pattern, so callers use the result as a gate and
+    # confirm hits with the original `re` pattern. Patterns that cannot be
+    # rewritten, or that RE2 rejects, stay on `re`.
+    if RE2_AVAILABLE:
+        re2_pattern = _to_re2_superset(pattern)
+        if re2_pattern is not None:
+            try:
+                return re2.compile("(?i)" + re2_pattern)
+            except re2.error:
+                pass
+    return re.compile(pattern, re.IGNORECASE)
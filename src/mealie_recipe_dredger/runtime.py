@@ -1,18 +1,26 @@
 import logging
 import random
+import re
 import signal
+import threading
 import time
-from typing import Dict
+from pathlib import Path
+from typing import Dict, Optional
 from urllib.parse import urlparse
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
-from .config import DEFAULT_CRAWL_DELAY, RESPECT_ROBOTS_TXT
+from . import json_utils
+from .config import CRAWL_DELAY_CACHE_FILE, DEFAULT_CRAWL_DELAY, RESPECT_ROBOTS_TXT
 
 logger = logging.getLogger("dredger")
 
+CRAWL_DELAY_RE = re.compile(rb"^[ \t]*crawl-delay[ \t]*:[ \t]*([0-9.]+)", re.IGNORECASE | re.MULTILINE)
+# robots.txt crawl delays are persisted between runs and refetched after a day.
+CRAWL_DELAY_TTL_SECONDS = 24 * 60 * 60
+
 
 class GracefulKiller:
     """Catches Docker stop signals to allow safe shutdown."""
@@ -42,10 +50,56 @@ def get_session() -> requests.Session:
 
 
 class RateLimiter:
-    def __init__(self):
+    def __init__(self, cache_file: Optional[Path] = CRAWL_DELAY_CACHE_FILE):
+        # Monotonic start time of the latest request reserved per domain.
         self.last_request: Dict[str, float] = {}
+        self._reserve_lock = threading.Lock()
         self.crawl_delays: Dict[str, float] = {}
         self.session = get_session()
+        self.cache_file = cache_file
+        self._delay_cache: Optional[Dict[str, dict]] = None
+        self._delay_cache_dirty = False
+
+    def _load_delay_cache(self) -> Dict[str, dict]:
+        if self._delay_cache is None:
+            self._delay_cache = {}
+            if self.cache_file is not None and self.cache_file.exists():
+                try:
+                    raw = json_utils.loads(self.cache_file.read_bytes())
+                    if isinstance(raw, dict):
+                        self._delay_cache = raw
+                except Exception as exc:
+                    logger.warning(f"Error loading {self.cache_file}: {exc}")
+        return self._delay_cache
+
+    def _cached_crawl_delay(self, domain: str) -> Optional[float]:
+        entry = self._load_delay_cache().get(domain)
+        if not isinstance(entry, dict):
+            return None
+        delay = entry.get("delay")
+        timestamp = entry.get("timestamp")
+        if not isinstance(delay, (int, float)) or not isinstance(timestamp, (int, float)):
+            return None
+        if time.time() - timestamp > CRAWL_DELAY_TTL_SECONDS:
+            return None
+        return float(delay)
+
+    def save(self):
+        if not self._delay_cache_dirty or self.cache_file is None or self._delay_cache is None:
+            return
+        try:
+            json_utils.write_atomic(self.cache_file, json_utils.dumps(self._delay_cache, indent=True))
+            self._delay_cache_dirty = False
+        except Exception as exc:
+            logger.warning(f"Error saving {self.cache_file}: {exc}")
+
+    def _parse_crawl_delay(self, body: bytes) -> Optional[float]:
+        for match in CRAWL_DELAY_RE.finditer(body):
+            try:
+                return float(match.group(1))
+            except ValueError:
+                continue
+        return None
 
     def get_domain(self, url: str) -> str:
         return urlparse(url).netloc
@@ -56,18 +110,22 @@ class RateLimiter:
 
         delay = DEFAULT_CRAWL_DELAY
         if RESPECT_ROBOTS_TXT:
-            try:
-                response = self.session.get(f"https://{domain}/robots.txt", timeout=5)
-                if response.status_code == 200:
-                    for line in response.text.splitlines():
-                        if line.lower().startswith("crawl-delay:"):
-                            try:
-                                delay = float(line.split(":", 1)[1].strip())
-                                break
-                            except ValueError:
-                                pass
-            except Exception:
-                pass
+            cached = self._cached_crawl_delay(domain)
+            if cached is not None:
+                delay = cached
+            else:
+                try:
+                    response = self.session.get(f"https://{domain}/robots.txt", timeout=5)
+                    if response.status_code == 200:
+                        parsed = self._parse_crawl_delay(response.content)
+                        if parsed is not None:
+                            delay = parsed
+                    # Only answers from the server are cached; network errors
+                    # are retried on the next run.
+                    self._load_delay_cache()[domain] = {"delay": delay, "timestamp": time.time()}
+                    self._delay_cache_dirty = True
+                except Exception:
+                    pass
 
         self.crawl_delays[domain] = delay
         return delay
@@ -76,11 +134,18 @@ class RateLimiter:
         domain = self.get_domain(url)
         delay = self.get_crawl_delay(domain)
 
-        if domain in self.last_request:
-            elapsed = time.time() - self.last_request[domain]
-            if elapsed < delay:
-                jitter = random.uniform(0.5, 1.5)
-                sleep_time = (delay - elapsed) * jitter
-                time.sleep(sleep_time)
-
-        self.last_request[domain] = time.time()
+        # The slot is reserved under the lock and slept on outside it, so
+        # concurrent callers only queue behind requests to the same domain.
+        with self._reserve_lock:
+            now = time.monotonic()
+            sleep_time = 0.0
+            last = self.last_request.get(domain)
+            if last is not None:
+                elapsed = now - last
+                if elapsed < delay:
+                    jitter = random.uniform(0.5, 1.5)
+                    sleep_time = (delay - elapsed) * jitter
+            self.last_request[domain] = now + sleep_time
+
+        if sleep_time > 0:
+            time.sleep(sleep_time)
@@ -1,35 +1,53 @@
 from __future__ import annotations
 
 import argparse
-import json
+import concurrent.futures
+import contextlib
+import functools
 import logging
 import os
 import sys
 from datetime import datetime, timezone
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
-from urllib.parse import urlparse
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-try:
-    from dotenv import load_dotenv
+from . import json_utils
+from .models import DATACLASS_SLOTS
+from .paging_utils import iter_prefetched
 
-    load_dotenv()
-except Exception:
-    # Still works with explicit CLI args or exported env vars.
-    pass
+if os.getenv("LOAD_DOTENV", "true").lower() == "true":
+    try:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+    except Exception:
+        # Still works with explicit CLI args or exported env vars.
+        pass
 
 DEFAULT_SITES_FILE = "data/sites.json"
 DEFAULT_TIMEOUT = 300
 PER_PAGE = 1000
+PAGE_FETCH_WORKERS = 4
+DELETE_WORKERS = 8
+# The only recipe fields alignment reads (see source_url, recipe_id,
+# recipe_slug and build_candidates); listing pages are trimmed to these.
+RECIPE_FIELDS = ("name", "id", "recipeId", "slug", "orgURL", "originalURL", "source")
 
 LOGGER = logging.getLogger("dredger.site_alignment")
 
 
+# Hosts repeat heavily across a recipe library, so both helpers are memoized.
+@functools.lru_cache(maxsize=1024)
 def normalize_host(value: str) -> str:
-    host = (value or "").strip().lower()
+    # A fully qualified "example.com." would otherwise never match the
+    # suffix probes in host_allowed.
+    host = (value or "").strip().lower().rstrip(".")
     if host.startswith("www."):
         host = host[4:]
     return host
@@ -38,8 +56,15 @@ def normalize_host(value: str) -> str:
 def host_from_url(url: Optional[str]) -> Optional[str]:
     if not isinstance(url, str):
         return None
+    return _host_from_url_string(url)
+
+
+@functools.lru_cache(maxsize=8192)
+def _host_from_url_string(url: str) -> Optional[str]:
     try:
-        parsed = urlparse(url.strip())
+        # urlsplit: only the netloc is read, so urlparse's extra ";params"
+        # split of the path is wasted work.
+        parsed = urlsplit(url.strip())
     except Exception:
         return None
     host = normalize_host(parsed.netloc)
@@ -47,10 +72,15 @@ def host_from_url(url: Optional[str]) -> Optional[str]:
 
 
 def source_url(recipe: Dict[str, Any]) -> Optional[str]:
+    # Called for every scanned recipe; each value is stripped once and the
+    # first non-empty source wins (orgURL in the common case).
+    get = recipe.get
     for key in ("orgURL", "originalURL", "source"):
-        value = recipe.get(key)
-        if isinstance(value, str) and value.strip():
-            return value.strip()
+        value = get(key)
+        if type(value) is str:
+            value = value.strip()
+            if value:
+                return value
     return None
 
 
@@ -58,15 +88,15 @@ def recipe_id(recipe: Dict[str, Any]) -> Optional[str]:
     value = recipe.get("id") or recipe.get("recipeId")
     if isinstance(value, int):
         return str(value)
-    if isinstance(value, str) and value.strip():
-        return value.strip()
+    if isinstance(value, str):
+        return value.strip() or None
     return None
 
 
 def recipe_slug(recipe: Dict[str, Any]) -> Optional[str]:
     value = recipe.get("slug")
-    if isinstance(value, str) and value.strip():
-        return value.strip()
+    if isinstance(value, str):
+        return value.strip() or None
     return None
 
 
@@ -89,17 +119,31 @@ def hosts_from_sites(sites: Iterable[str]) -> Set[str]:
     return hosts
 
 
+# Parsed sites files keyed by path; reused while mtime and size are unchanged
+# so scheduled alignment runs do not re-decode an untouched file.
+_allowed_hosts_cache: Dict[str, Tuple[Tuple[int, int], FrozenSet[str]]] = {}
+
+
 def load_allowed_hosts(path: Path) -> Set[str]:
-    payload = json.loads(path.read_text(encoding="utf-8"))
+    stat = path.stat()
+    key = str(path.resolve())
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _allowed_hosts_cache.get(key)
+    if cached is not None and cached[0] == signature:
+        return set(cached[1])
+
+    payload = json_utils.loads(path.read_bytes())
     sites = parse_sites_payload(payload)
-    return hosts_from_sites(sites)
+    hosts = hosts_from_sites(sites)
+    _allowed_hosts_cache[key] = (signature, frozenset(hosts))
+    return hosts
 
 
 def load_host_snapshot(path: Path) -> Optional[Set[str]]:
     if not path.exists():
         return None
 
-    payload = json.loads(path.read_text(encoding="utf-8"))
+    payload = json_utils.loads(path.read_bytes())
     values: List[str]
     if isinstance(payload, list):
         values = [entry for entry in payload if isinstance(entry, str)]
@@ -129,56 +173,200 @@ def save_host_snapshot(path: Path, hosts: Set[str]) -> None:
     payload = {
         "hosts": sorted(hosts),
     }
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    json_utils.write_atomic(path, json_utils.dumps(payload, indent=True))
 
 
 def host_allowed(host: str, allowed_hosts: Set[str]) -> bool:
     if host in allowed_hosts:
         return True
-    return any(host.endswith(f".{allowed}") for allowed in allowed_hosts)
+    # Same as any(host.endswith(f".{allowed}")), but probes the set with each
+    # suffix after a dot: O(labels) per host instead of O(len(allowed_hosts)).
+    index = host.find(".")
+    while index != -1:
+        if host[index + 1 :] in allowed_hosts:
+            return True
+        index = host.find(".", index + 1)
+    return False
 
 
 def removed_hosts_for_diff(baseline_hosts: Set[str], current_hosts: Set[str]) -> Set[str]:
-    return {host for host in baseline_hosts if not host_allowed(host, current_hosts)}
+    # Hosts still listed verbatim drop out in one C-level set difference;
+    # only the remainder needs the per-host suffix walk.
+    return {host for host in baseline_hosts - current_hosts if not host_allowed(host, current_hosts)}
 
 
-def get_recipes(
+def _auth_headers(client: requests.Session, token: str) -> Optional[Dict[str, str]]:
+    # The pooled alignment session already carries the token; only build a
+    # per-request header for caller-supplied sessions that do not.
+    authorization = f"Bearer {token}"
+    session_headers = getattr(client, "headers", None)
+    if session_headers is not None and session_headers.get("Authorization") == authorization:
+        return None
+    return {"Authorization": authorization}
+
+
+def _get_recipe_page(
+    client: requests.Session,
+    endpoint: str,
+    headers: Optional[Dict[str, str]],
+    page: int,
+    timeout: int,
+    query_filter: Optional[str] = None,
+) -> Tuple[List[Any], Optional[int]]:
+    params: Dict[str, Any] = {"page": page, "perPage": PER_PAGE}
+    if query_filter:
+        params["queryFilter"] = query_filter
+    response = client.get(
+        endpoint,
+        headers=headers,
+        params=params,
+        timeout=timeout,
+    )
+    if response.status_code == 401:
+        raise RuntimeError(
+            "401 Unauthorized. Check MEALIE_API_TOKEN (API token required; password won't work)."
+        )
+    if response.status_code == 403:
+        raise RuntimeError(
+            "403 Forbidden. Token is valid but lacks permission for recipe listing."
+        )
+    response.raise_for_status()
+    payload = json_utils.loads(response.content)
+    if not isinstance(payload, dict):
+        return [], None
+    items = payload.get("items")
+    if not isinstance(items, list):
+        return [], None
+    total_pages = payload.get("total_pages")
+    return items, total_pages if isinstance(total_pages, int) else None
+
+
+def _project_recipes(items: List[Any]) -> List[Dict[str, Any]]:
+    # Drops ingredients, instructions, tags, ... as each page arrives, so a
+    # large library is not held in memory as full recipe payloads.
+    return [{key: item[key] for key in RECIPE_FIELDS if key in item} for item in items if isinstance(item, dict)]
+
+
+def iter_recipes(
     mealie_url: str,
     token: str,
     timeout: int,
     session: Optional[requests.Session] = None,
-) -> List[Dict[str, Any]]:
-    client = session or requests.Session()
-    headers = {"Authorization": f"Bearer {token}"}
-    page = 1
-    recipes: List[Dict[str, Any]] = []
-
+    query_filter: Optional[str] = None,
+) -> Iterator[Dict[str, Any]]:
+    # Yields projected recipes page by page, so candidates are built while
+    # later pages are still in flight instead of after the full listing.
+    if session is None:
+        with _pooled_session(token) as owned:
+            yield from iter_recipes(mealie_url, token, timeout, owned, query_filter)
+        return
+    client = session
+    headers = _auth_headers(client, token)
+    endpoint = f"{mealie_url}/api/recipes"
+
+    def fetch(page: int) -> Tuple[List[Any], Optional[int]]:
+        return _get_recipe_page(client, endpoint, headers, page, timeout, query_filter)
+
+    items, total_pages = fetch(1)
+    if not items:
+        return
+    yield from _project_recipes(items)
+    page = 2
+
+    # When Mealie reports total_pages, the remaining pages are fetched in a
+    # small concurrent window (results are consumed in page order). An empty
+    # page, an error or the caller closing this generator cancels the
+    # fetches still queued.
+    if total_pages is not None and total_pages >= page:
+        with contextlib.closing(iter_prefetched(fetch, range(page, total_pages + 1), PAGE_FETCH_WORKERS)) as pages:
+            for items, _ in pages:
+                if not items:
+                    return
+                yield from _project_recipes(items)
+        page = total_pages + 1
+
+    # Serial tail: covers servers without total_pages and recipes added while
+    # the listing was running.
     while True:
-        response = client.get(
-            f"{mealie_url}/api/recipes",
-            headers=headers,
-            params={"page": page, "perPage": PER_PAGE},
-            timeout=timeout,
-        )
-        if response.status_code == 401:
-            raise RuntimeError(
-                "401 Unauthorized. Check MEALIE_API_TOKEN (API token required; password won't work)."
-            )
-        if response.status_code == 403:
-            raise RuntimeError(
-                "403 Forbidden. Token is valid but lacks permission for recipe listing."
-            )
-        response.raise_for_status()
-        payload = response.json()
-        if not isinstance(payload, dict):
-            break
-        items = payload.get("items")
-        if not isinstance(items, list) or not items:
+        items, _ = fetch(page)
+        if not items:
             break
-        recipes.extend(item for item in items if isinstance(item, dict))
+        yield from _project_recipes(items)
         page += 1
 
-    return recipes
+
+class _QueryFilterIgnored(Exception):
+    pass
+
+
+def iter_recipes_for_hosts(
+    mealie_url: str,
+    token: str,
+    timeout: int,
+    hosts: Iterable[str],
+    session: Optional[requests.Session] = None,
+    on_fallback: Optional[Callable[[], None]] = None,
+) -> Iterator[Dict[str, Any]]:
+    # Diff mode only needs recipes from the removed hosts: ask Mealie for
+    # each one with a queryFilter on orgURL. Older servers reject (400/422)
+    # or ignore the filter; either way the rest comes from a full listing,
+    # skipping recipes already yielded (on_fallback is called first).
+    # build_candidates still applies the exact host check, so a loose filter
+    # match is harmless.
+    # orgURL is the only source column Mealie can filter on; recipes whose
+    # source is only in originalURL or source are not fetched in this mode.
+    if session is None:
+        with _pooled_session(token) as owned:
+            yield from iter_recipes_for_hosts(mealie_url, token, timeout, hosts, owned, on_fallback)
+        return
+    seen: Set[str] = set()
+
+    def unseen(recipes: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        for recipe in recipes:
+            key = recipe_id(recipe) or recipe_slug(recipe)
+            if key is not None:
+                if key in seen:
+                    continue
+                seen.add(key)
+            yield recipe
+
+    def matching(host: str) -> Iterator[Dict[str, Any]]:
+        if '"' in host:
+            raise _QueryFilterIgnored()
+        for recipe in iter_recipes(
+            mealie_url=mealie_url,
+            token=token,
+            timeout=timeout,
+            session=session,
+            query_filter=f'orgURL LIKE "%{host}%"',
+        ):
+            if host not in str(recipe.get("orgURL") or "").lower():
+                raise _QueryFilterIgnored()
+            yield recipe
+
+    try:
+        for host in sorted(hosts):
+            yield from unseen(matching(host))
+        return
+    except requests.HTTPError as exc:
+        if exc.response is None or exc.response.status_code not in (400, 422):
+            raise
+        LOGGER.info("[align][info] Mealie rejected queryFilter; listing all recipes instead.")
+    except _QueryFilterIgnored:
+        LOGGER.info("[align][info] Mealie ignored queryFilter; listing all recipes instead.")
+
+    if on_fallback is not None:
+        on_fallback()
+    yield from unseen(iter_recipes(mealie_url=mealie_url, token=token, timeout=timeout, session=session))
+
+
+def get_recipes(
+    mealie_url: str,
+    token: str,
+    timeout: int,
+    session: Optional[requests.Session] = None,
+) -> List[Dict[str, Any]]:
+    return list(iter_recipes(mealie_url=mealie_url, token=token, timeout=timeout, session=session))
 
 
 def delete_recipe(
@@ -189,8 +377,11 @@ def delete_recipe(
     timeout: int,
     session: Optional[requests.Session] = None,
 ) -> Tuple[bool, str]:
-    client = session or requests.Session()
-    headers = {"Authorization": f"Bearer {token}"}
+    if session is None:
+        with _pooled_session(token) as owned:
+            return delete_recipe(mealie_url, token, recipe_identifier, slug, timeout, owned)
+    client = session
+    headers = _auth_headers(client, token)
     candidates = []
     for identifier in (recipe_identifier, slug):
         if identifier and identifier not in candidates:
@@ -199,8 +390,9 @@ def delete_recipe(
     if not candidates:
         return False, "missing id/slug"
 
+    recipes_endpoint = f"{mealie_url}/api/recipes/"
     for identifier in candidates:
-        endpoint = f"{mealie_url}/api/recipes/{identifier}"
+        endpoint = recipes_endpoint + identifier
         try:
             response = client.delete(endpoint, headers=headers, timeout=timeout)
         except Exception as exc:
@@ -225,8 +417,11 @@ def create_mealie_backup(
     timeout: int,
     session: Optional[requests.Session] = None,
 ) -> Tuple[bool, str]:
-    client = session or requests.Session()
-    headers = {"Authorization": f"Bearer {token}"}
+    if session is None:
+        with _pooled_session(token) as owned:
+            return create_mealie_backup(mealie_url, token, timeout, owned)
+    client = session
+    headers = _auth_headers(client, token)
     endpoint = f"{mealie_url}/api/admin/backups"
     try:
         response = client.post(endpoint, headers=headers, timeout=timeout)
@@ -236,7 +431,7 @@ def create_mealie_backup(
     if response.status_code in (200, 201, 202):
         message = ""
         try:
-            payload = response.json()
+            payload = json_utils.loads(response.content)
             if isinstance(payload, dict):
                 message = str(payload.get("message") or "").strip()
         except Exception:
@@ -249,12 +444,26 @@ def create_mealie_backup(
     return False, f"HTTP {response.status_code}" + (f" - {body}" if body else "")
 
 
-@dataclass
+def _pooled_session(token: str) -> requests.Session:
+    # One keep-alive pool shared by listing, backup and the concurrent deletes.
+    # Gateway errors are retried at the transport level; 500 is not, since a
+    # DELETE that failed late may already have removed the recipe.
+    session = requests.Session()
+    session.headers["Authorization"] = f"Bearer {token}"
+    retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504], raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=DELETE_WORKERS * 2, max_retries=retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Field names match the audit file schema, so candidates serialize as-is.
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Candidate:
     name: str
     host: Optional[str]
-    source_value: Optional[str]
-    recipe_identifier: Optional[str]
+    source: Optional[str]
+    recipe_id: Optional[str]
     slug: Optional[str]
 
 
@@ -274,13 +483,11 @@ def build_candidates(
 ) -> Tuple[List[Candidate], int]:
     to_prune: List[Candidate] = []
     missing_source_count = 0
+    seen: Set[str] = set()
 
     for recipe in recipes:
-        name = str(recipe.get("name") or "Unknown")
         source_value = source_url(recipe)
         host = host_from_url(source_value)
-        recipe_identifier = recipe_id(recipe)
-        slug = recipe_slug(recipe)
 
         if not host:
             missing_source_count += 1
@@ -290,19 +497,103 @@ def build_candidates(
         if host and not should_prune_host(host):
             continue
 
-        to_prune.append(
-            Candidate(
-                name=name,
-                host=host,
-                source_value=source_value,
-                recipe_identifier=recipe_identifier,
-                slug=slug,
-            )
-        )
+        # Most recipes are kept, so name/id/slug are only extracted for the
+        # ones that become candidates.
+        identifier = recipe_id(recipe)
+        slug = recipe_slug(recipe)
+        # Pages can overlap when recipes are added mid-listing; a repeat
+        # would only cost an extra DELETE that 404s.
+        key = identifier or slug
+        if key:
+            if key in seen:
+                continue
+            seen.add(key)
+
+        to_prune.append(Candidate(str(recipe.get("name") or "Unknown"), host, source_value, identifier, slug))
 
     return to_prune, missing_source_count
 
 
+def _answered_yes(prompt: str) -> bool:
+    return input(prompt).strip().lower() in {"y", "yes"}
+
+
+def _confirm_delete(count: int) -> bool:
+    if not sys.stdin.isatty():
+        raise RuntimeError("Refusing apply in non-interactive mode without --yes.")
+    return _answered_yes(f"[align][confirm] Delete {count} recipe(s)? [y/N]: ")
+
+
+def _prompt_backup(logger: logging.Logger) -> bool:
+    if not sys.stdin.isatty():
+        logger.warning("[align][warn] Skipping backup prompt in non-interactive mode.")
+        return False
+    return _answered_yes("[align][confirm] Create a Mealie backup before deletions? [y/N]: ")
+
+
+def _backup_or_confirm(
+    mealie_url: str,
+    token: str,
+    timeout: int,
+    session: requests.Session,
+    assume_yes: bool,
+    logger: logging.Logger,
+) -> bool:
+    # True when deletions may proceed: the backup succeeded, or it failed and
+    # an interactive user chose to continue anyway.
+    backup_ok, backup_detail = create_mealie_backup(
+        mealie_url=mealie_url,
+        token=token,
+        timeout=timeout,
+        session=session,
+    )
+    if backup_ok:
+        logger.info(f"[align][backup] Backup created successfully{f': {backup_detail}' if backup_detail else ''}")
+        return True
+    logger.error(f"[align][backup] Backup failed: {backup_detail}")
+    if assume_yes or not sys.stdin.isatty():
+        return False
+    return _answered_yes("[align][confirm] Continue without backup? [y/N]: ")
+
+
+def _delete_candidates(
+    mealie_url: str,
+    token: str,
+    timeout: int,
+    session: requests.Session,
+    candidates: List[Candidate],
+    logger: logging.Logger,
+) -> Tuple[int, int]:
+    def delete(item: Candidate) -> Tuple[bool, str]:
+        return delete_recipe(
+            mealie_url=mealie_url,
+            token=token,
+            recipe_identifier=item.recipe_id,
+            slug=item.slug,
+            timeout=timeout,
+            session=session,
+        )
+
+    deleted = 0
+    failed = 0
+    # Deletes are pipelined over a bounded pool (never wider than the
+    # session's connection pool) and logged as each one completes, so
+    # one slow request does not hold back progress output.
+    workers = max(1, min(DELETE_WORKERS, len(candidates)))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(delete, item): item for item in candidates}
+        for future in concurrent.futures.as_completed(futures):
+            item = futures[future]
+            ok, detail = future.result()
+            if ok:
+                deleted += 1
+                logger.info(f"[align][delete] {item.name} ({detail})")
+            else:
+                failed += 1
+                logger.warning(f"[align][warn] Failed to delete '{item.name}': {detail}")
+    return deleted, failed
+
+
 def align_mealie_recipes(
     mealie_url: str,
     token: str,
@@ -319,6 +610,7 @@ def align_mealie_recipes(
     assume_yes: bool = False,
     session: Optional[requests.Session] = None,
     logger: Optional[logging.Logger] = None,
+    use_query_filter: bool = False,
 ) -> AlignmentReport:
     active_logger = logger or LOGGER
     if not mealie_url:
@@ -327,146 +619,109 @@ def align_mealie_recipes(
         raise ValueError("Missing API token.")
     if not allowed_hosts:
         raise ValueError("No valid hosts parsed from active sites list.")
+    owned_session: Optional[requests.Session] = None
+    if session is None:
+        owned_session = session = _pooled_session(token)
 
-    current_hosts = {normalize_host(host) for host in allowed_hosts if normalize_host(host)}
-    scope_hosts: Optional[Set[str]] = None
-    if prune_hosts is not None:
-        scope_hosts = {normalize_host(host) for host in prune_hosts if normalize_host(host)}
-        should_prune_host = lambda host: host_allowed(host, scope_hosts)
-        active_logger.info(f"[align] Prune scope hosts (diff): {len(scope_hosts)}")
-    else:
-        should_prune_host = lambda host: not host_allowed(host, current_hosts)
-        active_logger.info(f"[align] Active hosts: {len(current_hosts)}")
-
-    recipes = get_recipes(mealie_url=mealie_url, token=token, timeout=timeout, session=session)
-    candidates, missing_source_count = build_candidates(
-        recipes=recipes,
-        should_prune_host=should_prune_host,
-        keep_missing_source=not include_missing_source,
-    )
-
-    active_logger.info(f"[align] Total recipes scanned: {len(recipes)}")
-    active_logger.info(f"[align] Recipes with missing source URL: {missing_source_count}")
-    active_logger.info(f"[align] Recipes to prune: {len(candidates)}")
-
-    limit = max(0, int(preview_limit))
-    for item in candidates[:limit]:
-        source_display = item.source_value or "(missing)"
-        host_display = item.host or "(missing)"
-        active_logger.info(f"[align][plan] {item.name} | host={host_display} | source={source_display}")
-    if len(candidates) > limit:
-        active_logger.info(f"[align][plan] ... and {len(candidates) - limit} more")
-
-    if audit_file:
-        try:
-            audit_file.parent.mkdir(parents=True, exist_ok=True)
-            audit_payload = {
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "mode": "apply" if apply else "dry_run",
-                "candidate_count": len(candidates),
-                "missing_source_count": missing_source_count,
-                "candidates": [
-                    {
-                        "name": item.name,
-                        "host": item.host,
-                        "source": item.source_value,
-                        "recipe_id": item.recipe_identifier,
-                        "slug": item.slug,
-                    }
-                    for item in candidates
-                ],
-            }
-            audit_file.write_text(json.dumps(audit_payload, indent=2), encoding="utf-8")
-            active_logger.info(f"[align][info] Candidate audit written: {audit_file}")
-        except Exception as exc:
-            active_logger.warning(f"[align][warn] Failed to write audit file '{audit_file}': {exc}")
-
-    deleted = 0
-    failed = 0
-    if apply:
-        if candidates and require_confirmation:
-            if not assume_yes:
-                if not sys.stdin.isatty():
-                    raise RuntimeError("Refusing apply in non-interactive mode without --yes.")
-                answer = input(f"[align][confirm] Delete {len(candidates)} recipe(s)? [y/N]: ").strip().lower()
-                if answer not in {"y", "yes"}:
-                    active_logger.info("[align] Apply cancelled by user.")
-                    return AlignmentReport(
-                        total_recipes=len(recipes),
-                        missing_source_count=missing_source_count,
-                        candidate_count=len(candidates),
-                        deleted_count=0,
-                        failed_count=0,
-                    )
-
-        should_backup = bool(backup_before_apply)
-        if candidates and prompt_backup_before_apply and not should_backup:
-            if not sys.stdin.isatty():
-                active_logger.warning("[align][warn] Skipping backup prompt in non-interactive mode.")
-            else:
-                answer = input("[align][confirm] Create a Mealie backup before deletions? [y/N]: ").strip().lower()
-                if answer in {"y", "yes"}:
-                    should_backup = True
-
-        if candidates and should_backup:
-            backup_ok, backup_detail = create_mealie_backup(
+    try:
+        current_hosts = frozenset(filter(None, map(normalize_host, allowed_hosts)))
+        scope_hosts: Optional[FrozenSet[str]] = None
+        if prune_hosts is not None:
+            scope_hosts = frozenset(filter(None, map(normalize_host, prune_hosts)))
+            decide = lambda host: host_allowed(host, scope_hosts)
+            active_logger.info(f"[align] Prune scope hosts (diff): {len(scope_hosts)}")
+        else:
+            decide = lambda host: not host_allowed(host, current_hosts)
+            active_logger.info(f"[align] Active hosts: {len(current_hosts)}")
+        # Host sets are fixed for the run and most recipes share a handful of
+        # source hosts, so each distinct host is decided once.
+        should_prune_host = functools.lru_cache(maxsize=None)(decide)
+
+        total_recipes = 0
+        listed_all: List[bool] = []
+
+        def scanned(recipes: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+            nonlocal total_recipes
+            for recipe in recipes:
+                total_recipes += 1
+                yield recipe
+
+        query_filtered = use_query_filter and scope_hosts is not None and not include_missing_source
+        if query_filtered:
+            recipes = iter_recipes_for_hosts(
                 mealie_url=mealie_url,
                 token=token,
                 timeout=timeout,
+                hosts=scope_hosts,
                 session=session,
+                on_fallback=lambda: listed_all.append(True),
             )
-            if backup_ok:
-                active_logger.info(
-                    f"[align][backup] Backup created successfully{f': {backup_detail}' if backup_detail else ''}"
-                )
-            else:
-                active_logger.error(f"[align][backup] Backup failed: {backup_detail}")
-                if not assume_yes and sys.stdin.isatty():
-                    proceed = input("[align][confirm] Continue without backup? [y/N]: ").strip().lower()
-                    if proceed not in {"y", "yes"}:
-                        active_logger.info("[align] Apply cancelled due to backup failure.")
-                        return AlignmentReport(
-                            total_recipes=len(recipes),
-                            missing_source_count=missing_source_count,
-                            candidate_count=len(candidates),
-                            deleted_count=0,
-                            failed_count=0,
-                        )
-                else:
-                    active_logger.info("[align] Apply cancelled due to backup failure.")
-                    return AlignmentReport(
-                        total_recipes=len(recipes),
-                        missing_source_count=missing_source_count,
-                        candidate_count=len(candidates),
-                        deleted_count=0,
-                        failed_count=0,
-                    )
-
-        for item in candidates:
-            ok, detail = delete_recipe(
-                mealie_url=mealie_url,
-                token=token,
-                recipe_identifier=item.recipe_identifier,
-                slug=item.slug,
-                timeout=timeout,
-                session=session,
+        else:
+            recipes = iter_recipes(mealie_url=mealie_url, token=token, timeout=timeout, session=session)
+        candidates, missing_source_count = build_candidates(
+            recipes=scanned(recipes),
+            should_prune_host=should_prune_host,
+            keep_missing_source=not include_missing_source,
+        )
+
+        scanned_label = " (orgURL queryFilter on pruned hosts)" if query_filtered and not listed_all else ""
+        active_logger.info(f"[align] Total recipes scanned{scanned_label}: {total_recipes}")
+        active_logger.info(f"[align] Recipes with missing source URL: {missing_source_count}")
+        active_logger.info(f"[align] Recipes to prune: {len(candidates)}")
+
+        limit = max(0, int(preview_limit))
+        for item in candidates[:limit]:
+            source_display = item.source or "(missing)"
+            host_display = item.host or "(missing)"
+            active_logger.info(f"[align][plan] {item.name} | host={host_display} | source={source_display}")
+        if len(candidates) > limit:
+            active_logger.info(f"[align][plan] ... and {len(candidates) - limit} more")
+
+        if audit_file:
+            try:
+                audit_file.parent.mkdir(parents=True, exist_ok=True)
+                audit_payload = {
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "mode": "apply" if apply else "dry_run",
+                    "candidate_count": len(candidates),
+                    "missing_source_count": missing_source_count,
+                    "candidates": candidates,
+                }
+                json_utils.write_atomic(audit_file, json_utils.dumps(audit_payload, indent=True))
+                active_logger.info(f"[align][info] Candidate audit written: {audit_file}")
+            except Exception as exc:
+                active_logger.warning(f"[align][warn] Failed to write audit file '{audit_file}': {exc}")
+
+        def report(deleted: int = 0, failed: int = 0) -> AlignmentReport:
+            return AlignmentReport(
+                total_recipes=total_recipes,
+                missing_source_count=missing_source_count,
+                candidate_count=len(candidates),
+                deleted_count=deleted,
+                failed_count=failed,
             )
-            if ok:
-                deleted += 1
-                active_logger.info(f"[align][delete] {item.name} ({detail})")
-            else:
-                failed += 1
-                active_logger.warning(f"[align][warn] Failed to delete '{item.name}': {detail}")
-    else:
-        active_logger.info("[align] Dry run complete. Re-run with apply mode to delete.")
-
-    return AlignmentReport(
-        total_recipes=len(recipes),
-        missing_source_count=missing_source_count,
-        candidate_count=len(candidates),
-        deleted_count=deleted,
-        failed_count=failed,
-    )
+
+        if not apply:
+            active_logger.info("[align] Dry run complete. Re-run with apply mode to delete.")
+            return report()
+        if not candidates:
+            return report()
+
+        if require_confirmation and not assume_yes and not _confirm_delete(len(candidates)):
+            active_logger.info("[align] Apply cancelled by user.")
+            return report()
+
+        should_backup = bool(backup_before_apply)
+        if prompt_backup_before_apply and not should_backup:
+            should_backup = _prompt_backup(active_logger)
+        if should_backup and not _backup_or_confirm(mealie_url, token, timeout, session, assume_yes, active_logger):
+            active_logger.info("[align] Apply cancelled due to backup failure.")
+            return report()
+
+        return report(*_delete_candidates(mealie_url, token, timeout, session, candidates, active_logger))
+    finally:
+        if owned_session is not None:
+            owned_session.close()
 
 
 def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
@@ -536,6 +791,15 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         default=os.getenv("ALIGN_SITES_AUDIT_FILE", ""),
         help="Optional JSON file path to write full candidate list before apply/dry-run.",
     )
+    parser.add_argument(
+        "--query-filter",
+        action="store_true",
+        help=(
+            "Diff mode: ask Mealie only for recipes whose orgURL matches a removed host (queryFilter) "
+            "instead of listing the whole library. Recipes whose source is only in originalURL or source "
+            "are not checked in this mode. Falls back to a full listing if unsupported."
+        ),
+    )
     return parser.parse_args(argv)
 
 
@@ -609,6 +873,7 @@ def run_from_args(args: argparse.Namespace, logger: Optional[logging.Logger] = N
             prompt_backup_before_apply=args.apply and not args.yes and not args.backup_before_apply,
             require_confirmation=args.apply and not args.yes,
             assume_yes=args.yes,
+            use_query_filter=bool(getattr(args, "query_filter", False)),
         )
     except Exception as exc:
         active_logger.error(f"[align][error] Failed to align recipes: {exc}")
@@ -1,38 +1,66 @@
-import json
 import logging
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Set
 
+from . import json_utils
 from .config import (
     CACHE_EXPIRY_DAYS,
     IMPORTED_FILE,
+    MEALIE_ENDPOINT_CACHE_FILE,
     REJECT_FILE,
     RETRY_FILE,
     SITEMAP_CACHE_FILE,
     STATS_FILE,
 )
-from .models import SiteStats
+from .models import RetryEntry, SiteStats
 from .url_utils import canonicalize_url
 
 logger = logging.getLogger("dredger")
 
+# imported/rejects only ever grow, so flushes append new keys to a .jsonl
+# journal next to the snapshot; the snapshot is rewritten (compacted) once
+# the journal passes this size, or when flush_all(compact=True) is called.
+JOURNAL_COMPACT_BYTES = 1024 * 1024
+
+# The change-count flush threshold adapts to the write rate: it doubles
+# while count-triggered flushes come faster than FAST_FLUSH_SECONDS apart
+# and halves back when they are slower than SLOW_FLUSH_SECONDS.
+MIN_FLUSH_THRESHOLD = 50
+MAX_FLUSH_THRESHOLD = 800
+FAST_FLUSH_SECONDS = 5.0
+SLOW_FLUSH_SECONDS = 20.0
+
 
 class StorageManager:
     def __init__(self):
-        self.rejects: Set[str] = self._load_json_set(REJECT_FILE)
-        self.imported: Set[str] = self._load_json_set(IMPORTED_FILE)
-        self.retry_queue: Dict[str, dict] = self._canonicalize_retry_queue(self._load_json_dict(RETRY_FILE))
+        self.rejects: Set[str] = self._load_journaled_set(REJECT_FILE)
+        self.imported: Set[str] = self._load_journaled_set(IMPORTED_FILE)
+        self.retry_queue: Dict[str, RetryEntry] = self._canonicalize_retry_queue(self._load_json_dict(RETRY_FILE))
         self.stats: Dict[str, dict] = self._load_json_dict(STATS_FILE)
         self.sitemap_cache: Dict[str, dict] = self._load_json_dict(SITEMAP_CACHE_FILE)
+        self.import_paths: Dict[str, str] = self._load_json_dict(MEALIE_ENDPOINT_CACHE_FILE)
 
         self._changes_since_flush = 0
-        self._flush_threshold = 50
+        self._flush_threshold = MIN_FLUSH_THRESHOLD
+        # Flush on whichever comes first: _flush_threshold changes or this many
+        # seconds since the last flush, so a slow site cannot hold a handful
+        # of changes in memory indefinitely.
+        self._flush_interval_seconds = 30.0
+        self._last_flush = time.monotonic()
+        # Dict-backed files with unsaved changes; flush_all rewrites only these.
+        self._dirty: Set[Path] = set()
+        # import_paths is written from worker threads without marking dirty,
+        # so flush compares against the last persisted copy instead.
+        self._saved_import_paths: Dict[str, str] = dict(self.import_paths)
+        # Keys added to imported/rejects since the last journal append.
+        self._journal_pending: Dict[Path, List[str]] = {REJECT_FILE: [], IMPORTED_FILE: []}
 
     def _load_json_set(self, filename: Path) -> Set[str]:
         if filename.exists():
             try:
-                raw = json.loads(filename.read_text(encoding="utf-8"))
+                raw = json_utils.loads(filename.read_bytes())
                 if isinstance(raw, list):
                     normalized = set()
                     for entry in raw:
@@ -46,82 +74,127 @@ class StorageManager:
                 logger.warning(f"Error loading {filename}: {exc}")
         return set()
 
+    def _journal_path(self, filename: Path) -> Path:
+        return filename.with_suffix(".jsonl")
+
+    def _load_journaled_set(self, filename: Path) -> Set[str]:
+        data_set = self._load_json_set(filename)
+        journal = self._journal_path(filename)
+        if journal.exists():
+            try:
+                for line in journal.read_bytes().splitlines():
+                    try:
+                        entry = json_utils.loads(line)
+                    except json_utils.JSONDecodeError:
+                        # A torn final line from an interrupted append.
+                        continue
+                    if isinstance(entry, str):
+                        normalized_entry = self._normalize_url_key(entry)
+                        if normalized_entry:
+                            data_set.add(normalized_entry)
+            except Exception as exc:
+                logger.warning(f"Error loading {journal}: {exc}")
+        return data_set
+
+    def _flush_journaled_set(self, filename: Path, data_set: Set[str], compact: bool):
+        pending = self._journal_pending[filename]
+        self._journal_pending[filename] = []
+        journal = self._journal_path(filename)
+        if pending:
+            with journal.open("ab") as handle:
+                handle.write(b"".join(json_utils.dumps(key) + b"\n" for key in pending))
+        if journal.exists() and (compact or journal.stat().st_size >= JOURNAL_COMPACT_BYTES):
+            # Snapshot first: a crash before the unlink only replays keys
+            # the snapshot already holds.
+            self._save_json_set(filename, data_set)
+            journal.unlink()
+
     def _load_json_dict(self, filename: Path) -> dict:
         if filename.exists():
             try:
-                return json.loads(filename.read_text(encoding="utf-8"))
+                return json_utils.loads(filename.read_bytes())
             except Exception as exc:
                 logger.warning(f"Error loading {filename}: {exc}")
         return {}
 
     def _save_json_set(self, filename: Path, data_set: Set[str]):
-        filename.write_text(json.dumps(list(data_set), indent=2), encoding="utf-8")
+        json_utils.write_atomic(filename, json_utils.dumps(list(data_set), indent=True))
 
-    def _save_json_dict(self, filename: Path, data_dict: dict):
-        filename.write_text(json.dumps(data_dict, indent=2), encoding="utf-8")
+    def _save_json_dict(self, filename: Path, data_dict: dict, indent: bool = True):
+        json_utils.write_atomic(filename, json_utils.dumps(data_dict, indent=indent))
 
     def _normalize_url_key(self, url: str) -> str:
         normalized = canonicalize_url(url)
         return normalized or url.strip().lower()
 
-    def _canonicalize_retry_queue(self, queue: dict) -> Dict[str, dict]:
+    def _canonicalize_retry_queue(self, queue: dict) -> Dict[str, RetryEntry]:
         if not isinstance(queue, dict):
             return {}
 
-        normalized: Dict[str, dict] = {}
+        normalized: Dict[str, RetryEntry] = {}
         for key, value in queue.items():
             if not isinstance(key, str) or not isinstance(value, dict):
                 continue
             normalized_key = self._normalize_url_key(key)
-            if normalized_key in normalized:
-                existing_attempts = int(normalized[normalized_key].get("attempts", 0))
-                incoming_attempts = int(value.get("attempts", 0))
-                if incoming_attempts > existing_attempts:
-                    normalized[normalized_key] = value
-                continue
-            normalized[normalized_key] = value
+            entry = RetryEntry.from_dict(value)
+            existing = normalized.get(normalized_key)
+            if existing is None or entry.attempts > existing.attempts:
+                normalized[normalized_key] = entry
         return normalized
 
     def add_imported(self, url: str):
         url_key = self._normalize_url_key(url)
-        self.imported.add(url_key)
+        if url_key not in self.imported:
+            self.imported.add(url_key)
+            self._journal_pending[IMPORTED_FILE].append(url_key)
         if url_key in self.retry_queue:
             self.retry_queue.pop(url_key, None)
+            self._dirty.add(RETRY_FILE)
         self._changes_since_flush += 1
         self._auto_flush()
 
     def add_reject(self, url: str):
         url_key = self._normalize_url_key(url)
-        self.rejects.add(url_key)
+        if url_key not in self.rejects:
+            self.rejects.add(url_key)
+            self._journal_pending[REJECT_FILE].append(url_key)
         if url_key in self.retry_queue:
             self.retry_queue.pop(url_key, None)
+            self._dirty.add(RETRY_FILE)
         self._changes_since_flush += 1
         self._auto_flush()
 
     def add_retry(self, url: str, reason: str, increment: bool = False):
         url_key = self._normalize_url_key(url)
-        existing = self.retry_queue.get(url_key, {})
-        attempts = int(existing.get("attempts", 0))
+        existing = self.retry_queue.get(url_key)
+        attempts = existing.attempts if existing is not None else 0
         if increment:
             attempts += 1
 
-        self.retry_queue[url_key] = {
-            "reason": reason,
-            "attempts": attempts,
-            "last_attempt": datetime.now().isoformat(),
-        }
+        self.retry_queue[url_key] = RetryEntry(
+            reason=reason,
+            attempts=attempts,
+            last_attempt=datetime.now().isoformat(),
+        )
+        self._dirty.add(RETRY_FILE)
         self._changes_since_flush += 1
         self._auto_flush()
 
+    def retry_attempts(self, url: str) -> int:
+        entry = self.retry_queue.get(self._normalize_url_key(url))
+        return entry.attempts if entry is not None else 0
+
     def remove_retry(self, url: str):
         url_key = self._normalize_url_key(url)
         if url_key in self.retry_queue:
             self.retry_queue.pop(url_key, None)
+            self._dirty.add(RETRY_FILE)
             self._changes_since_flush += 1
             self._auto_flush()
 
     def update_stats(self, site_url: str, stats: SiteStats):
         self.stats[site_url] = stats.to_dict()
+        self._dirty.add(STATS_FILE)
         self._changes_since_flush += 1
         self._auto_flush()
 
@@ -130,9 +203,21 @@ class StorageManager:
             return None
 
         cache_entry = self.sitemap_cache[site_url]
-        cached_time = datetime.fromisoformat(cache_entry["timestamp"])
+        cached_time = cache_entry.get("timestamp")
+        # Entries store epoch seconds; caches written by older versions hold
+        # ISO strings and are still honoured until they expire. A legacy
+        # value is converted in place on first use, so it is parsed once and
+        # saved as epoch seconds whenever the cache is next written.
+        if isinstance(cached_time, str):
+            try:
+                cached_time = datetime.fromisoformat(cached_time).timestamp()
+            except ValueError:
+                return None
+            cache_entry["timestamp"] = cached_time
+        if not isinstance(cached_time, (int, float)):
+            return None
 
-        if datetime.now() - cached_time > timedelta(days=CACHE_EXPIRY_DAYS):
+        if time.time() - cached_time > CACHE_EXPIRY_DAYS * 86400:
             return None
 
         return cache_entry
@@ -141,19 +226,49 @@ class StorageManager:
         self.sitemap_cache[site_url] = {
             "sitemap_url": sitemap_url,
             "urls": urls,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": time.time(),
         }
+        self._dirty.add(SITEMAP_CACHE_FILE)
         self._changes_since_flush += 1
         self._auto_flush()
 
+    def get_cached_import_path(self, mealie_url: str) -> Optional[str]:
+        path = self.import_paths.get(mealie_url)
+        return path if isinstance(path, str) and path else None
+
+    def cache_import_path(self, mealie_url: str, path: str):
+        # Called from import worker threads: only a single dict assignment
+        # here, persisted by the next flush on the main thread.
+        if self.import_paths.get(mealie_url) != path:
+            self.import_paths[mealie_url] = path
+
     def _auto_flush(self):
         if self._changes_since_flush >= self._flush_threshold:
+            elapsed = time.monotonic() - self._last_flush
+            if elapsed < FAST_FLUSH_SECONDS:
+                self._flush_threshold = min(self._flush_threshold * 2, MAX_FLUSH_THRESHOLD)
+            elif elapsed > SLOW_FLUSH_SECONDS:
+                self._flush_threshold = max(self._flush_threshold // 2, MIN_FLUSH_THRESHOLD)
+            self.flush_all()
+        elif time.monotonic() - self._last_flush >= self._flush_interval_seconds:
             self.flush_all()
 
-    def flush_all(self):
-        self._save_json_set(REJECT_FILE, self.rejects)
-        self._save_json_set(IMPORTED_FILE, self.imported)
-        self._save_json_dict(RETRY_FILE, self.retry_queue)
-        self._save_json_dict(STATS_FILE, self.stats)
-        self._save_json_dict(SITEMAP_CACHE_FILE, self.sitemap_cache)
+    def flush_all(self, compact: bool = False):
+        dirty = self._dirty
+        self._dirty = set()
+        self._flush_journaled_set(REJECT_FILE, self.rejects, compact)
+        self._flush_journaled_set(IMPORTED_FILE, self.imported, compact)
+        if RETRY_FILE in dirty:
+            self._save_json_dict(RETRY_FILE, self.retry_queue)
+        if STATS_FILE in dirty:
+            self._save_json_dict(STATS_FILE, self.stats)
+        if SITEMAP_CACHE_FILE in dirty:
+            # By far the largest state file and never edited by hand, so it
+            # is written compact rather than indented.
+            self._save_json_dict(SITEMAP_CACHE_FILE, self.sitemap_cache, indent=False)
+        import_paths = dict(self.import_paths)
+        if import_paths != self._saved_import_paths:
+            self._save_json_dict(MEALIE_ENDPOINT_CACHE_FILE, import_paths)
+            self._saved_import_paths = import_paths
         self._changes_since_flush = 0
+        self._last_flush = time.monotonic()
@@ -1,29 +1,92 @@
 from __future__ import annotations
 
+import functools
 import re
-from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
-
-TRACKING_QUERY_KEYS = {
-    "fbclid",
-    "gclid",
-    "igshid",
-    "mc_cid",
-    "mc_eid",
-    "ref",
-    "ref_src",
-    "ref_url",
-    "s",
-    "spm",
-}
+from urllib.parse import parse_qsl, urlencode, urlparse, urlsplit, urlunsplit
+
+TRACKING_QUERY_KEYS = frozenset(
+    {
+        "fbclid",
+        "gclid",
+        "igshid",
+        "mc_cid",
+        "mc_eid",
+        "ref",
+        "ref_src",
+        "ref_url",
+        "s",
+        "spm",
+    }
+)
 
 NUMERIC_SUFFIX_RE = re.compile(r"\s*\((\d+)\)\s*$")
-WHITESPACE_RE = re.compile(r"\s+")
-
-
+REPEATED_SLASH_RE = re.compile(r"/+")
+
+
+# Characters that make urlsplit rewrite or reject the input.
+UNSAFE_URL_CHARS = frozenset("\t\r\n[]")
+
+
+def _is_canonical(raw: str) -> bool:
+    # True when canonicalize_url would return raw unchanged: lowercase
+    # http(s) URL with a path, no www., query, fragment, doubled or trailing
+    # slash. Most stored and sitemap URLs already look like this.
+    if raw.startswith("https://"):
+        rest = raw[8:]
+    elif raw.startswith("http://"):
+        rest = raw[7:]
+    else:
+        return False
+    slash = rest.find("/")
+    if slash <= 0 or rest.startswith("www."):
+        return False
+    path = rest[slash:]
+    if "?" in rest or "#" in rest or "//" in path or (path != "/" and path.endswith("/")):
+        return False
+    return raw == raw.lower() and UNSAFE_URL_CHARS.isdisjoint(raw)
+
+
+def url_path(url: str) -> str:
+    # Equivalent to urlparse(url).path. Plain http(s) URLs are sliced with
+    # str.find; anything urlparse would rewrite (";params", stripped or
+    # rejected characters, other schemes) goes through urlparse itself.
+    if url.startswith("https://"):
+        start = 8
+    elif url.startswith("http://"):
+        start = 7
+    else:
+        return urlparse(url).path
+    if ";" in url or not UNSAFE_URL_CHARS.isdisjoint(url):
+        return urlparse(url).path
+    end = len(url)
+    for delimiter in "?#":
+        index = url.find(delimiter, start, end)
+        if index >= 0:
+            end = index
+    slash = url.find("/", start, end)
+    return url[slash:end] if slash >= 0 else ""
+
+
+def path_slug(path: str) -> str:
+    # Last non-empty segment of an already-extracted path.
+    return path.strip("/").rpartition("/")[2]
+
+
+def url_slug(url: str) -> str:
+    # Last non-empty path segment, lowercased; shared by the verifier's
+    # paranoid skip and the cleaner's junk classification.
+    return path_slug(url_path(url)).lower()
+
+
+# The same URL is canonicalized several times per dredge (pre-filter,
+# imported/reject/retry checks, storage keys), so results are memoized.
+@functools.lru_cache(maxsize=65536)
 def canonicalize_url(url: str | None) -> str:
     raw = (url or "").strip()
     if not raw:
         return ""
+    if _is_canonical(raw):
+        return raw
 
     try:
         parts = urlsplit(raw)
@@ -39,24 +102,30 @@ def canonicalize_url(url: str | None) -> str:
         netloc = netloc[4:]
 
     path = parts.path or "/"
-    path = re.sub(r"/+", "/", path)
+    if "//" in path:
+        path = REPEATED_SLASH_RE.sub("/", path)
     if path != "/" and path.endswith("/"):
         path = path[:-1]
 
-    filtered_query = []
-    for key, value in parse_qsl(parts.query, keep_blank_values=True):
-        lowered = key.lower()
-        if lowered.startswith("utm_") or lowered in TRACKING_QUERY_KEYS:
-            continue
-        filtered_query.append((key, value))
-    filtered_query.sort()
-    query = urlencode(filtered_query, doseq=True)
+    # Most sitemap URLs carry no query string; skip the parse/filter/encode
+    # round trip for them.
+    query = ""
+    if parts.query:
+        filtered_query = []
+        for key, value in parse_qsl(parts.query, keep_blank_values=True):
+            lowered = key.lower()
+            if lowered.startswith("utm_") or lowered in TRACKING_QUERY_KEYS:
+                continue
+            filtered_query.append((key, value))
+        filtered_query.sort()
+        query = urlencode(filtered_query, doseq=True)
 
     return urlunsplit((scheme, netloc, path, query, ""))
 
 
 def strip_numeric_suffix(name: str | None) -> str:
-    normalized = WHITESPACE_RE.sub(" ", (name or "").strip())
+    # str.split() uses the same Unicode whitespace set as \s, without the regex engine.
+    normalized = " ".join((name or "").split())
     normalized = NUMERIC_SUFFIX_RE.sub("", normalized)
     return normalized.strip()
 
@@ -1,11 +1,14 @@
-import json
+import concurrent.futures
+import functools
 import re
-from typing import Any, Optional, Tuple
-from urllib.parse import urlparse
+from collections import deque
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
 
+import lxml.html
 import requests
 from bs4 import BeautifulSoup
 
+from . import json_utils
 from .config import (
     BAD_KEYWORDS,
     HOW_TO_COOK_REGEX,
@@ -20,20 +23,167 @@ from .config import (
     NON_RECIPE_PATH_HINTS,
     TARGET_LANGUAGE,
     TRANSIENT_HTTP_CODES,
+    VERIFY_MAX_BYTES,
+    VERIFY_WORKERS,
 )
 from .language import detect_language_from_html
+from .regex_utils import compile_gate
+from .url_utils import path_slug, url_path, url_slug
+
+RECIPE_CLASS_NAMES = ("wp-recipe-maker", "tasty-recipes", "mv-create-card", "recipe-card")
+RECIPE_CLASS_PATTERN = re.compile("(" + "|".join(RECIPE_CLASS_NAMES) + ")")
+# XPath equivalents of the soup queries, evaluated in C on a bare lxml tree.
+LD_JSON_XPATH = "//script[@type='application/ld+json']"
+TITLE_XPATH = "//title"
+RECIPE_CLASS_MARKERS = tuple(name.encode("ascii") for name in RECIPE_CLASS_NAMES)
+RECIPE_CARD_XPATH = "//*[" + " or ".join(f"contains(@class, '{name}')" for name in RECIPE_CLASS_NAMES) + "]"
+# Every positive signal needs one of these bytes in the raw page: a JSON-LD
+# @type of "Recipe" (matched case-insensitively) or a RECIPE_CLASS_PATTERN
+# class. Pages without them are rejected before building a soup.
+RECIPE_MARKER_RE = re.compile(rb"recipe|mv-create-card", re.IGNORECASE)
+VERIFY_CHUNK_BYTES = 65536
+# Early-stop markers, checked against the downloaded prefix of a page: a
+# complete JSON-LD block naming recipe ingredients or instructions, a closed
+# <title> (the paranoid skip reads the first one) and, when the language
+# filter runs, a declared <html lang> (taken before any body text).
+LD_JSON_BLOCK_RE = re.compile(rb"<script[^>]+application/ld\+json[^>]*>(.*?)</script", re.IGNORECASE | re.DOTALL)
+RECIPE_PAYLOAD_KEY_RE = re.compile(rb"recipeingredient|recipeinstructions", re.IGNORECASE)
+TITLE_END_RE = re.compile(rb"</title\b", re.IGNORECASE)
+HTML_LANG_RE = re.compile(rb"<html\b[^>]*?\blang\s*=\s*[\"']?[a-z]{2,}", re.IGNORECASE)
+# Past this many bytes the early-stop markers are no longer searched for.
+EARLY_STOP_SCAN_BYTES = 512 * 1024
+CHARSET_RE = re.compile(r"charset\s*=\s*[\"']?([\w.:-]+)", re.IGNORECASE)
+SLUG_SEPARATOR_RE = re.compile(r"[-_]+")
+RECIPE_WORD_RE = re.compile("recipe", re.IGNORECASE)
+# One scan over the slug for any bad keyword; the reported keyword still
+# follows BAD_KEYWORDS order, so it is resolved only after a hit.
+BAD_KEYWORD_RE = re.compile("|".join(map(re.escape, BAD_KEYWORDS)))
+
+
+# Union of every slug/title skip rule. Most slugs and titles match none, so
+# one scan rules them all out; on a hit the individual rules run in their
+# usual order, since the union's leftmost match need not be the rule that
+# takes precedence.
+SLUG_SKIP_RE = compile_gate(
+    "|".join(
+        f"(?:{pattern})"
+        for pattern in (
+            HOW_TO_COOK_REGEX.pattern,
+            NON_RECIPE_DIGEST_REGEX.pattern,
+            LISTICLE_REGEX.pattern,
+            NUMBERED_COLLECTION_REGEX.pattern,
+            BAD_KEYWORD_RE.pattern,
+        )
+    ),
+)
+TITLE_SKIP_RE = compile_gate(
+    "|".join(
+        f"(?:{pattern})"
+        for pattern in (
+            HOW_TO_COOK_REGEX.pattern,
+            NON_RECIPE_DIGEST_REGEX.pattern,
+            LISTICLE_TITLE_REGEX.pattern,
+            NUMBERED_COLLECTION_REGEX.pattern,
+            re.escape("best recipes"),
+            re.escape("top 10"),
+        )
+    ),
+)
+
+
+def _is_wide_encoding(content: bytes) -> bool:
+    # UTF-16/32 pages do not expose ASCII markers as plain bytes; parse those.
+    return content[:2] in (b"\xff\xfe", b"\xfe\xff") or b"\x00" in content[:1024]
+
+
+def may_contain_recipe(content: bytes) -> bool:
+    if _is_wide_encoding(content):
+        return True
+    return RECIPE_MARKER_RE.search(content) is not None
+
+
+def may_contain_recipe_card(content: bytes) -> bool:
+    # A recipe-card class needs its name in the raw bytes, so a few memmem
+    # scans rule out the tree walk on most pages. The bytes alone are not
+    # proof: plugin stylesheet and script URLs carry the same names.
+    if _is_wide_encoding(content):
+        return True
+    return any(marker in content for marker in RECIPE_CLASS_MARKERS)
+
+
+def fill_body(
+    buffer: bytearray,
+    chunks: Iterator[bytes],
+    max_bytes: int = VERIFY_MAX_BYTES,
+    stop: Optional[Callable[[bytearray], bool]] = None,
+) -> bool:
+    """Extend buffer from chunks; return False if stop() ended the read early."""
+    # Pages past the cap are truncated; lxml parses the partial document and
+    # the rest of an oversized page is never downloaded.
+    for chunk in chunks:
+        buffer.extend(chunk)
+        if len(buffer) >= max_bytes:
+            del buffer[max_bytes:]
+            return True
+        if stop is not None and len(buffer) <= EARLY_STOP_SCAN_BYTES and stop(buffer):
+            return False
+    return True
+
+
+def has_recipe_head(content: bytearray, need_language: bool) -> bool:
+    # True once the prefix holds everything an accepting verdict reads from
+    # the page, so the rest of it need not be downloaded.
+    if _is_wide_encoding(content) or TITLE_END_RE.search(content) is None:
+        return False
+    if need_language and HTML_LANG_RE.search(content) is None:
+        return False
+    return any(RECIPE_PAYLOAD_KEY_RE.search(block) is not None for block in LD_JSON_BLOCK_RE.findall(content))
+
+
+def decode_body(content: bytes, encoding: Optional[str]) -> str:
+    try:
+        return content.decode(encoding or "utf-8", errors="replace")
+    except LookupError:
+        return content.decode("utf-8", errors="replace")
+
+
+def make_soup(content: bytes, content_type: str = "") -> BeautifulSoup:
+    # Always the lxml tree builder (C parser; language detection expects it).
+    # A charset declared in the Content-Type header takes precedence, as it
+    # does in browsers, and lets bs4 skip its encoding sniffing pass.
+    match = CHARSET_RE.search(content_type or "")
+    return BeautifulSoup(content, "lxml", from_encoding=match.group(1) if match else None)
+
+
+# Retries and repeated runs re-verify the same URLs, and the verdict depends
+# only on the slug, so it is memoized.
+@functools.lru_cache(maxsize=16384)
+def _slug_skip_reason(slug: str) -> Optional[str]:
+    normalized_slug = SLUG_SEPARATOR_RE.sub(" ", slug)
+    if not SLUG_SKIP_RE.search(normalized_slug):
+        return None
 
-RECIPE_CLASS_PATTERN = re.compile(r"(wp-recipe-maker|tasty-recipes|mv-create-card|recipe-card)")
+    if HOW_TO_COOK_REGEX.search(normalized_slug):
+        return "How-to article"
+
+    if NON_RECIPE_DIGEST_REGEX.search(normalized_slug):
+        return "Digest/non-recipe post"
+
+    if LISTICLE_REGEX.search(normalized_slug) or NUMBERED_COLLECTION_REGEX.search(normalized_slug):
+        return f"Listicle detected: {slug}"
+
+    # The gate may over-match (its RE2 form drops \b), so no rule need apply.
+    keyword = next((keyword for keyword in BAD_KEYWORDS if keyword in normalized_slug), None)
+    return f"Bad keyword: {keyword}" if keyword else None
 
 
 class RecipeVerifier:
     def __init__(self, session: requests.Session):
         self.session = session
 
-    def pre_filter_candidate(self, url: str) -> Optional[str]:
+    def pre_filter_candidate(self, url: str, path_lower: Optional[str] = None) -> Optional[str]:
         try:
-            parsed = urlparse(url)
-            path = parsed.path.lower()
+            path = path_lower if path_lower is not None else url_path(url).lower()
 
             if path.endswith(NON_RECIPE_EXTENSIONS):
                 return "Non-HTML media URL"
@@ -48,27 +198,27 @@ class RecipeVerifier:
 
         return None
 
-    def is_paranoid_skip(self, url: str, soup: Optional[BeautifulSoup] = None) -> Optional[str]:
+    def is_paranoid_skip(
+        self,
+        url: str,
+        soup: Optional[BeautifulSoup] = None,
+        path_lower: Optional[str] = None,
+        title: Optional[str] = None,
+    ) -> Optional[str]:
         try:
-            path = urlparse(url).path
-            slug = path.strip("/").split("/")[-1].lower()
-            normalized_slug = re.sub(r"[-_]+", " ", slug)
-
-            if HOW_TO_COOK_REGEX.search(normalized_slug):
-                return "How-to article"
-
-            if NON_RECIPE_DIGEST_REGEX.search(normalized_slug):
-                return "Digest/non-recipe post"
-
-            if LISTICLE_REGEX.search(normalized_slug) or NUMBERED_COLLECTION_REGEX.search(normalized_slug):
-                return f"Listicle detected: {slug}"
-
-            for keyword in BAD_KEYWORDS:
-                if keyword in normalized_slug:
-                    return f"Bad keyword: {keyword}"
+            slug = path_slug(path_lower) if path_lower is not None else url_slug(url)
+            slug_reason = _slug_skip_reason(slug)
+            if slug_reason:
+                return slug_reason
 
+            # The title comes from the soup when one was built, otherwise from
+            # the caller (read off the lxml tree).
             if soup:
-                title = soup.title.string.lower() if soup.title and soup.title.string else ""
+                title = soup.title.string if soup.title and soup.title.string else ""
+            if title is not None:
+                title = title.lower()
+                if not TITLE_SKIP_RE.search(title):
+                    return None
                 if HOW_TO_COOK_REGEX.search(title):
                     return "How-to title"
                 if NON_RECIPE_DIGEST_REGEX.search(title):
@@ -139,17 +289,27 @@ class RecipeVerifier:
 
     def _recipe_schema_signal(self, soup: BeautifulSoup) -> Tuple[bool, bool]:
         """Return (has_recipe_type, has_strong_recipe_payload)."""
+        return self._schema_signal_from_scripts(
+            script.string or script.get_text() or ""
+            for script in soup.find_all("script", attrs={"type": "application/ld+json"})
+        )
+
+    def _schema_signal_from_scripts(self, scripts: Iterable[str]) -> Tuple[bool, bool]:
         has_recipe_type = False
         strong_payload = False
 
-        for script in soup.find_all("script", attrs={"type": "application/ld+json"}):
-            raw = script.string or script.get_text() or ""
+        for raw in scripts:
             raw = raw.strip()
             if not raw:
                 continue
+            # Organization/BreadcrumbList/WebSite blocks never mention a
+            # Recipe type, so they are not decoded at all (unless the JSON
+            # uses \u escapes, which could spell it).
+            if not RECIPE_WORD_RE.search(raw) and "\\u" not in raw:
+                continue
             try:
-                payload = json.loads(raw)
-            except json.JSONDecodeError:
+                payload = json_utils.loads(raw)
+            except json_utils.JSONDecodeError:
                 continue
 
             for item in self._iter_json_ld_items(payload):
@@ -165,30 +325,107 @@ class RecipeVerifier:
 
         return has_recipe_type, strong_payload
 
+    def _parse_lxml(self, content: bytes, content_type: str) -> Any:
+        match = CHARSET_RE.search(content_type or "")
+        try:
+            parser = lxml.html.HTMLParser(encoding=match.group(1)) if match else None
+            return lxml.html.document_fromstring(content, parser=parser)
+        except Exception:
+            return None
+
+    def _tree_recipe_signal(self, tree: Any, content: bytes) -> Tuple[bool, bool, bool]:
+        has_recipe_type, strong_payload = self._schema_signal_from_scripts(
+            script.text or "" for script in tree.xpath(LD_JSON_XPATH)
+        )
+        has_recipe_card = may_contain_recipe_card(content) and bool(tree.xpath(RECIPE_CARD_XPATH))
+        return has_recipe_type, strong_payload, has_recipe_card
+
     def verify_recipe(self, url: str) -> Tuple[bool, Optional[BeautifulSoup], Optional[str], bool]:
-        pre_filtered_reason = self.pre_filter_candidate(url)
+        # Parsed and lowercased once for both the pre-filter and the skip
+        # rules; on a parse error each falls back to its own handling.
+        try:
+            path_lower: Optional[str] = url_path(url).lower()
+        except ValueError:
+            path_lower = None
+        pre_filtered_reason = self.pre_filter_candidate(url, path_lower)
         if pre_filtered_reason:
             return False, None, pre_filtered_reason, False
+        # The slug rules reject a page whatever it contains, so they run
+        # before the download; title rules still need the page.
+        slug_reason = self.is_paranoid_skip(url, path_lower=path_lower)
+        if slug_reason:
+            return False, None, slug_reason, False
 
         try:
-            response = self.session.get(url, timeout=10)
-            if response.status_code != 200:
-                is_transient = response.status_code in TRANSIENT_HTTP_CODES
-                return False, None, f"HTTP {response.status_code}", is_transient
+            # Streamed so error bodies are never read and oversized pages
+            # stop at VERIFY_MAX_BYTES. Once the prefix holds a recipe
+            # JSON-LD block (and whatever else an accepting verdict reads),
+            # it is judged on its own; only a rejection reads the rest of the
+            # page and judges it again, so early stops never turn a full-page
+            # acceptance into a rejection.
+            response = self.session.get(url, timeout=10, stream=True)
+            try:
+                if response.status_code != 200:
+                    is_transient = response.status_code in TRANSIENT_HTTP_CODES
+                    return False, None, f"HTTP {response.status_code}", is_transient
+                need_language = bool(LANGUAGE_FILTER_ENABLED and TARGET_LANGUAGE)
+                chunks = response.iter_content(VERIFY_CHUNK_BYTES)
+                buffer = bytearray()
+                complete = fill_body(buffer, chunks, stop=lambda prefix: has_recipe_head(prefix, need_language))
+                result = self._verify_page(url, bytes(buffer), response, path_lower)
+                if not complete and not result[0]:
+                    fill_body(buffer, chunks)
+                    result = self._verify_page(url, bytes(buffer), response, path_lower)
+                return result
+            finally:
+                response.close()
 
-            soup = BeautifulSoup(response.content, "lxml")
-            has_recipe_type, strong_recipe_payload = self._recipe_schema_signal(soup)
-            has_recipe_card = bool(soup.find(class_=RECIPE_CLASS_PATTERN))
+        except requests.exceptions.Timeout as exc:
+            return False, None, f"Timeout: {exc}", True
+        except requests.exceptions.ConnectionError as exc:
+            return False, None, f"Connection error: {exc}", True
+        except requests.exceptions.RequestException as exc:
+            return False, None, f"Request error: {exc}", True
+        except Exception as exc:
+            return False, None, f"Exception: {exc}", False
+
+    def _verify_page(
+        self,
+        url: str,
+        content: bytes,
+        response: Any,
+        path_lower: Optional[str],
+    ) -> Tuple[bool, Optional[BeautifulSoup], Optional[str], bool]:
+        try:
+            if not may_contain_recipe(content):
+                return False, None, "No recipe detected", False
+
+            content_type = response.headers.get("Content-Type", "")
+            # The schema/card checks run on a bare lxml tree first; most
+            # rejected pages never pay for building the BeautifulSoup tree,
+            # which is only needed for language detection.
+            tree = self._parse_lxml(content, content_type)
+            soup = None
+            if tree is None:
+                soup = make_soup(content, content_type)
+                has_recipe_type, strong_recipe_payload = self._recipe_schema_signal(soup)
+                has_recipe_card = may_contain_recipe_card(content) and bool(soup.find(class_=RECIPE_CLASS_PATTERN))
+            else:
+                has_recipe_type, strong_recipe_payload, has_recipe_card = self._tree_recipe_signal(tree, content)
 
             if not strong_recipe_payload and not has_recipe_card:
                 if has_recipe_type:
                     return False, soup, "Weak recipe schema", False
                 return False, soup, "No recipe detected", False
 
-            if LANGUAGE_FILTER_ENABLED and TARGET_LANGUAGE:
+            language_filter = LANGUAGE_FILTER_ENABLED and TARGET_LANGUAGE
+            if soup is None and language_filter:
+                soup = make_soup(content, content_type)
+
+            if language_filter:
                 detected_language, _source, _confidence = detect_language_from_html(
                     soup,
-                    response_text=response.text,
+                    response_text=decode_body(content, response.encoding),
                     min_confidence=LANGUAGE_MIN_CONFIDENCE,
                 )
                 if detected_language and detected_language != TARGET_LANGUAGE:
@@ -196,17 +433,50 @@ class RecipeVerifier:
                 if LANGUAGE_DETECTION_STRICT and not detected_language:
                     return False, soup, "Language unknown", False
 
-            skip_reason = self.is_paranoid_skip(url, soup)
+            title = None
+            if soup is None:
+                titles = tree.xpath(TITLE_XPATH)
+                title = (titles[0].text or "") if titles else ""
+            skip_reason = self.is_paranoid_skip(url, soup, path_lower=path_lower, title=title)
             if skip_reason:
                 return False, soup, skip_reason, False
 
             return True, soup, None, False
 
-        except requests.exceptions.Timeout as exc:
-            return False, None, f"Timeout: {exc}", True
-        except requests.exceptions.ConnectionError as exc:
-            return False, None, f"Connection error: {exc}", True
-        except requests.exceptions.RequestException as exc:
-            return False, None, f"Request error: {exc}", True
         except Exception as exc:
             return False, None, f"Exception: {exc}", False
+
+    def verify_recipes_batch(
+        self,
+        urls: Iterable[str],
+        max_workers: int = VERIFY_WORKERS,
+        before_fetch: Optional[Callable[[str], None]] = None,
+    ) -> Iterator[Tuple[str, Tuple[bool, Optional[BeautifulSoup], Optional[str], bool]]]:
+        """Yield (url, verify_recipe result) in input order, fetching pages concurrently."""
+
+        def verify(url: str) -> Tuple[bool, Optional[BeautifulSoup], Optional[str], bool]:
+            if before_fetch is not None:
+                before_fetch(url)
+            return self.verify_recipe(url)
+
+        if max_workers <= 1:
+            for url in urls:
+                yield url, verify(url)
+            return
+
+        # Keep a bounded window of queued checks so results (and their soups)
+        # are consumed as they complete rather than accumulated for the batch.
+        max_in_flight = max_workers * 2
+        pending: deque = deque()
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            for url in urls:
+                pending.append((url, executor.submit(verify, url)))
+                if len(pending) >= max_in_flight:
+                    done_url, future = pending.popleft()
+                    yield done_url, future.result()
+            while pending:
+                done_url, future = pending.popleft()
+                yield done_url, future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -1,11 +1,21 @@
-from pathlib import Path
+import os
+from importlib import metadata
 
 
 def read_version() -> str:
-    version_file = Path(__file__).resolve().parents[2] / "VERSION"
+    # Plain path arithmetic on __file__ (already absolute) avoids the
+    # readlink syscalls of Path.resolve() at import time.
+    version_file = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "VERSION")
     try:
-        return version_file.read_text(encoding="utf-8").strip()
+        with open(version_file, encoding="utf-8") as handle:
+            return handle.read().strip()
     except OSError:
+        pass
+    # Non-editable installs have no VERSION file next to the sources; the
+    # installed metadata carries the (PEP 440 normalized) version instead.
+    try:
+        return metadata.version("mealie-recipe-dredger")
+    except metadata.PackageNotFoundError:
         return "0.0.0"
 
 
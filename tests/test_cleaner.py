@@ -1,13 +1,23 @@
+import json
+import re
+
 import mealie_recipe_dredger.cleaner as cleaner_module
 from mealie_recipe_dredger.cleaner import (
+    _integrity_and_act,
     _build_recipe_resource_urls,
     _is_no_result_error,
     _should_skip_verified,
+    apply_surgical_filter,
     check_integrity,
     classify_recipe_action,
+    clear_classification_caches,
     dedupe_duplicate_source_recipes,
+    delete_mealie_recipes,
+    get_mealie_recipes,
     is_junk_content,
     language_issue_for_payload,
+    plan_surgical_filter,
+    run_integrity_scan,
     suggest_salvage_name,
     validate_instructions,
 )
@@ -45,6 +55,31 @@ def test_is_junk_content_blocks_high_risk_keyword_in_name():
     )
 
 
+def test_high_risk_keyword_sees_overlapping_keywords():
+    assert cleaner_module._high_risk_keyword("storeview") == "review"
+    for text in ["storeview", "menu review", "diy beauty store", "weekly planner"]:
+        expected = next((keyword for keyword in cleaner_module.HIGH_RISK_KEYWORDS if keyword in text), None)
+        assert cleaner_module._high_risk_keyword(text) == expected
+
+
+def test_high_risk_keyword_is_gated_by_automaton_when_available(monkeypatch):
+    class FakeAutomaton:
+        def __init__(self):
+            self.scanned = []
+
+        def iter(self, text):
+            self.scanned.append(text)
+            return iter([(len(text) - 1, "shop")] if "shop" in text else [])
+
+    automaton = FakeAutomaton()
+    monkeypatch.setattr(cleaner_module, "HIGH_RISK_AUTOMATON", automaton)
+
+    assert cleaner_module._high_risk_keyword("garlic lemon chicken") is None
+    # The regex still picks the reported keyword (earliest in list order).
+    assert cleaner_module._high_risk_keyword("shop review") == "review"
+    assert automaton.scanned == ["garlic lemon chicken", "shop review"]
+
+
 def test_classify_recipe_action_prefers_rename_for_how_to_slug():
     action, reason, new_name = classify_recipe_action(
         name="How to Cook T Bone Steak",
@@ -95,6 +130,11 @@ def test_suggest_salvage_name_removes_how_to_prefix():
     )
 
 
+def test_suggest_salvage_name_strips_stacked_prefixes_in_order():
+    assert suggest_salvage_name("Recipe for How to Cook Rice Recipe", None) == "Rice"
+    assert suggest_salvage_name("Make How to Rice", None) == "How To Rice"
+
+
 def test_classify_recipe_action_blocks_numbered_roundup():
     action, reason, _ = classify_recipe_action(
         name="20 Scrumptious Keto Holiday Desserts",
@@ -120,6 +160,14 @@ def test_validate_instructions_rejects_placeholder_text_in_step_list():
     assert not validate_instructions(instructions)
 
 
+def test_validate_instructions_placeholder_prefilter_matches_markers():
+    # _has_valid_instruction_text skips normalization for text without
+    # "instruction", which is only sound while every marker contains it.
+    assert all("instruction" in marker for marker in cleaner_module.INSTRUCTION_PLACEHOLDERS)
+    assert not validate_instructions([{"text": "  \n "}, {"text": "NO\n\tInstructions"}])
+    assert validate_instructions([{"text": "Could not detect instructions"}, {"text": "Stir well."}])
+
+
 def test_validate_instructions_accepts_nested_step_list_with_real_text():
     instructions = [{"itemListElement": [{"text": "Whisk eggs with salt."}]}]
     assert validate_instructions(instructions)
@@ -171,6 +219,58 @@ def test_language_issue_for_payload_allows_english(monkeypatch):
     assert language_issue_for_payload(payload) is None
 
 
+def test_language_issue_for_payload_skips_detection_for_obvious_english(monkeypatch):
+    monkeypatch.setattr(cleaner_module, "LANGUAGE_FILTER_ENABLED", True)
+    monkeypatch.setattr(cleaner_module, "CLEANER_REMOVE_NON_TARGET_LANGUAGE", True)
+    monkeypatch.setattr(cleaner_module, "LANGUAGE_DETECTION_STRICT", True)
+    monkeypatch.setattr(cleaner_module, "TARGET_LANGUAGE", "en")
+
+    def fail_detect(payload, min_confidence=0.70):
+        raise AssertionError("detector should not run for obvious English")
+
+    monkeypatch.setattr(cleaner_module, "detect_language_from_recipe_payload", fail_detect)
+
+    payload = {
+        "name": "Lemon Chicken",
+        "description": "Toss the chicken with lemon and bake until golden.",
+    }
+    assert language_issue_for_payload(payload) is None
+
+
+def test_language_issue_for_payload_checks_steps_behind_english_head(monkeypatch):
+    monkeypatch.setattr(cleaner_module, "LANGUAGE_FILTER_ENABLED", True)
+    monkeypatch.setattr(cleaner_module, "CLEANER_REMOVE_NON_TARGET_LANGUAGE", True)
+    monkeypatch.setattr(cleaner_module, "TARGET_LANGUAGE", "en")
+    monkeypatch.setattr(
+        cleaner_module,
+        "detect_language_from_recipe_payload",
+        lambda payload, min_confidence=0.70: ("es", "detector", 0.95),
+    )
+
+    payload = {
+        "name": "Lemon Chicken",
+        "description": "Toss the chicken with lemon and bake until golden, then serve with your rice. " * 10,
+        "recipeInstructions": [
+            "Mezclar el pollo con el limon y la sal.",
+            "Hornear hasta que este dorado y servir con arroz.",
+        ],
+    }
+    assert language_issue_for_payload(payload) == "Language mismatch: es"
+
+
+def test_language_issue_for_payload_declared_language_beats_english_fast_path(monkeypatch):
+    monkeypatch.setattr(cleaner_module, "LANGUAGE_FILTER_ENABLED", True)
+    monkeypatch.setattr(cleaner_module, "CLEANER_REMOVE_NON_TARGET_LANGUAGE", True)
+    monkeypatch.setattr(cleaner_module, "TARGET_LANGUAGE", "en")
+
+    payload = {
+        "name": "Lemon Chicken",
+        "description": "Toss the chicken with lemon and bake until golden.",
+        "language": "fr",
+    }
+    assert language_issue_for_payload(payload) == "Language mismatch: fr"
+
+
 def test_language_issue_for_payload_strict_unknown(monkeypatch):
     monkeypatch.setattr(cleaner_module, "LANGUAGE_FILTER_ENABLED", True)
     monkeypatch.setattr(cleaner_module, "CLEANER_REMOVE_NON_TARGET_LANGUAGE", True)
@@ -198,9 +298,19 @@ def test_build_recipe_resource_urls_prefers_id_before_slug():
     assert urls[1].endswith("/api/recipes/my-slug")
 
 
+def test_build_recipe_resource_urls_collapses_missing_or_equal_identifiers():
+    assert len(_build_recipe_resource_urls("same", "same")) == 1
+    assert _build_recipe_resource_urls("my-slug", None)[0].endswith("/api/recipes/my-slug")
+    assert _build_recipe_resource_urls(None, None) == ()
+
+
 def test_is_no_result_error_detects_mealie_noresultfound_payload():
     body = '{"detail":{"message":"Unknown Error","error":true,"exception":"NoResultFound"}}'
     assert _is_no_result_error(500, body)
+    assert _is_no_result_error(404, "No result found for slug")
+    assert not _is_no_result_error(500, '{"detail":"Internal Server Error"}')
+    assert not _is_no_result_error(502, body)
+    assert not _is_no_result_error(500, "")
 
 
 def test_language_issue_for_payload_flags_hindi_script(monkeypatch):
@@ -240,15 +350,12 @@ def test_check_integrity_rechecks_verified_when_language_cleanup_enabled(monkeyp
     class DummyResponse:
         status_code = 200
         text = "{}"
-
-        @staticmethod
-        def json():
-            return {"recipeInstructions": ["Step 1"], "name": "Lemon Chicken"}
+        content = b'{"recipeInstructions": ["Step 1"], "name": "Lemon Chicken"}'
 
     def fake_get(_url, headers=None, timeout=10):
         return DummyResponse()
 
-    monkeypatch.setattr(cleaner_module.requests, "get", fake_get)
+    monkeypatch.setattr(cleaner_module.SESSION, "get", fake_get)
 
     result = check_integrity({"slug": "slug-a", "id": "id-a", "name": "Lemon Chicken"}, {"slug-a"})
     assert result is not None
@@ -258,10 +365,10 @@ def test_check_integrity_rechecks_verified_when_language_cleanup_enabled(monkeyp
 def test_dedupe_duplicate_source_recipes_deletes_same_source_duplicates(monkeypatch):
     deleted_slugs = []
 
-    def fake_delete(slug, name, reason, rejects, verified, url=None, recipe_id=None):
-        deleted_slugs.append(slug)
+    def fake_delete(pending, rejects, verified):
+        deleted_slugs.extend(slug for slug, *_ in pending)
 
-    monkeypatch.setattr(cleaner_module, "delete_mealie_recipe", fake_delete)
+    monkeypatch.setattr(cleaner_module, "delete_mealie_recipes", fake_delete)
 
     recipes = [
         {
@@ -289,3 +396,337 @@ def test_dedupe_duplicate_source_recipes_deletes_same_source_duplicates(monkeypa
     assert deleted == 1
     assert deleted_slugs == ["zobo-drink-hibiscus-drink-1"]
     assert len(filtered) == 2
+
+
+def test_clear_classification_caches_picks_up_setting_changes(monkeypatch):
+    clear_classification_caches()
+    monkeypatch.setattr(cleaner_module, "CLEANER_RENAME_SALVAGE", True)
+    action, _, _ = classify_recipe_action("How to Cook Rice", None, "how-to-cook-rice")
+    assert action == "rename"
+
+    monkeypatch.setattr(cleaner_module, "CLEANER_RENAME_SALVAGE", False)
+    clear_classification_caches()
+    action, _, _ = classify_recipe_action("How to Cook Rice", None, "how-to-cook-rice")
+    assert action == "delete"
+    clear_classification_caches()
+
+
+def test_get_mealie_recipes_passes_query_filter(monkeypatch):
+    monkeypatch.setattr(cleaner_module, "MEALIE_ENABLED", True)
+    monkeypatch.setattr(cleaner_module, "CLEANER_QUERY_FILTER", 'dateAdded >= "2026-01-01"')
+    seen_params = []
+
+    class DummyResponse:
+        status_code = 200
+
+        def __init__(self, items):
+            self.content = json.dumps({"items": items}).encode("utf-8")
+
+    def fake_get(_url, headers=None, params=None, timeout=10):
+        seen_params.append(dict(params))
+        items = [{"slug": "a", "image": "big-blob", "tags": ["x"]}] if params["page"] == 1 else []
+        return DummyResponse(items)
+
+    monkeypatch.setattr(cleaner_module.SESSION, "get", fake_get)
+
+    recipes = get_mealie_recipes()
+    assert recipes == [{"slug": "a"}]
+    assert all(params["queryFilter"] == 'dateAdded >= "2026-01-01"' for params in seen_params)
+
+
+def test_check_integrity_skips_fetch_when_list_payload_is_complete(monkeypatch):
+    monkeypatch.setattr(cleaner_module, "LANGUAGE_FILTER_ENABLED", False)
+
+    def fail_get(*args, **kwargs):
+        raise AssertionError("GET should not be called when list payload already verifies")
+
+    monkeypatch.setattr(cleaner_module.SESSION, "get", fail_get)
+
+    recipe = {"slug": "slug-a", "name": "Lemon Chicken", "recipeInstructions": [{"text": "Bake the chicken."}]}
+    assert check_integrity(recipe, set()) == ("slug-a", "VERIFIED", "", None)
+
+
+def test_integrity_and_act_deletes_broken_recipe_in_worker(monkeypatch):
+    deleted = []
+
+    def fake_check(recipe, verified):
+        return recipe["slug"], recipe["name"], "Empty/Broken Instructions", None
+
+    def fake_delete(slug, name, reason, rejects, verified, url=None, recipe_id=None):
+        deleted.append((slug, recipe_id))
+
+    monkeypatch.setattr(cleaner_module, "check_integrity", fake_check)
+    monkeypatch.setattr(cleaner_module, "delete_mealie_recipe", fake_delete)
+
+    verified = set()
+    result = _integrity_and_act({"slug": "slug-a", "id": "id-a", "name": "Broken"}, set(), verified)
+    assert result is not None and result[2] == "Empty/Broken Instructions"
+    assert deleted == [("slug-a", "id-a")]
+    assert verified == set()
+
+
+def test_get_mealie_recipes_prefetches_known_pages_in_order(monkeypatch):
+    monkeypatch.setattr(cleaner_module, "MEALIE_ENABLED", True)
+    monkeypatch.setattr(cleaner_module, "CLEANER_QUERY_FILTER", "")
+    monkeypatch.setattr(cleaner_module, "CLEANER_PAGE_PREFETCH", 3)
+    requested_pages = []
+
+    class DummyResponse:
+        status_code = 200
+
+        def __init__(self, page):
+            self.content = json.dumps({"items": [{"slug": f"page-{page}"}], "total_pages": 4}).encode("utf-8")
+
+    def fake_get(_url, headers=None, params=None, timeout=10):
+        requested_pages.append(params["page"])
+        return DummyResponse(params["page"])
+
+    monkeypatch.setattr(cleaner_module.SESSION, "get", fake_get)
+
+    recipes = get_mealie_recipes()
+    assert [recipe["slug"] for recipe in recipes] == ["page-1", "page-2", "page-3", "page-4"]
+    assert sorted(requested_pages) == [1, 2, 3, 4]
+
+
+def test_get_mealie_recipes_stops_prefetching_after_failed_page(monkeypatch):
+    monkeypatch.setattr(cleaner_module, "MEALIE_ENABLED", True)
+    monkeypatch.setattr(cleaner_module, "CLEANER_QUERY_FILTER", "")
+    monkeypatch.setattr(cleaner_module, "CLEANER_PAGE_PREFETCH", 3)
+    monkeypatch.setattr(cleaner_module, "CLEANER_API_RETRIES", 1)
+    requested_pages = []
+
+    class DummyResponse:
+        def __init__(self, page):
+            self.status_code = 404 if page == 2 else 200
+            self.content = json.dumps({"items": [{"slug": f"page-{page}"}], "total_pages": 200}).encode("utf-8")
+
+    def fake_get(_url, headers=None, params=None, timeout=10):
+        requested_pages.append(params["page"])
+        return DummyResponse(params["page"])
+
+    monkeypatch.setattr(cleaner_module.SESSION, "get", fake_get)
+
+    recipes = get_mealie_recipes()
+    assert [recipe["slug"] for recipe in recipes] == ["page-1"]
+    assert len(requested_pages) <= 1 + 2 * 3
+
+
+def test_run_integrity_scan_counts_results_with_bounded_window(monkeypatch):
+    monkeypatch.setattr(cleaner_module, "MAX_WORKERS", 2)
+
+    def fake_act(recipe, rejects, verified):
+        if recipe["slug"].startswith("bad"):
+            return recipe["slug"], recipe["slug"], "Empty/Broken Instructions", None
+        return recipe["slug"], "VERIFIED", "", None
+
+    monkeypatch.setattr(cleaner_module, "_integrity_and_act", fake_act)
+
+    tasks = [{"slug": f"good-{index}"} for index in range(15)] + [{"slug": f"bad-{index}"} for index in range(5)]
+    assert run_integrity_scan(tasks, set(), set()) == (15, 5)
+
+
+def test_delete_mealie_recipes_uses_bulk_endpoint(monkeypatch):
+    monkeypatch.setattr(cleaner_module, "DRY_RUN", False)
+    posted = []
+
+    class DummyResponse:
+        status_code = 200
+        text = ""
+
+    def fake_post(url, data=None, headers=None, timeout=10):
+        posted.append((url, json.loads(data), headers))
+        return DummyResponse()
+
+    def fail_delete(*args, **kwargs):
+        raise AssertionError("Per-recipe delete should not run when bulk delete succeeds")
+
+    monkeypatch.setattr(cleaner_module.SESSION, "post", fake_post)
+    monkeypatch.setattr(cleaner_module, "delete_mealie_recipe", fail_delete)
+
+    rejects, verified = set(), {"slug-a"}
+    pending = [("slug-a", "A", "Listicle/roundup", "https://example.com/a", "id-a")]
+    delete_mealie_recipes(pending, rejects, verified)
+
+    assert posted[0][0].endswith("/api/recipes/bulk-actions/delete")
+    assert posted[0][1] == {"recipes": ["slug-a"]}
+    assert posted[0][2] == {"Content-Type": "application/json"}
+    assert rejects == {"https://example.com/a"}
+    assert verified == set()
+
+
+def test_delete_mealie_recipes_falls_back_when_bulk_unsupported(monkeypatch):
+    monkeypatch.setattr(cleaner_module, "DRY_RUN", False)
+    deleted = []
+
+    class DummyResponse:
+        status_code = 404
+        text = ""
+
+    monkeypatch.setattr(cleaner_module.SESSION, "post", lambda url, data=None, headers=None, timeout=10: DummyResponse())
+    monkeypatch.setattr(
+        cleaner_module,
+        "delete_mealie_recipe",
+        lambda slug, name, reason, rejects, verified, url=None, recipe_id=None: deleted.append(slug),
+    )
+
+    pending = [("slug-a", "A", "r", None, None), ("slug-b", "B", "r", None, None)]
+    delete_mealie_recipes(pending, set(), set())
+    assert deleted == ["slug-a", "slug-b"]
+
+
+def test_check_integrity_flags_broken_list_payload_without_fetch(monkeypatch):
+    monkeypatch.setattr(cleaner_module, "LANGUAGE_FILTER_ENABLED", False)
+
+    def fail_get(*args, **kwargs):
+        raise AssertionError("GET should not be called when list payload carries instructions")
+
+    monkeypatch.setattr(cleaner_module.SESSION, "get", fail_get)
+
+    recipe = {"slug": "slug-b", "name": "Placeholder", "recipeInstructions": [{"text": "Could not detect instructions"}]}
+    assert check_integrity(recipe, set()) == ("slug-b", "Placeholder", "Empty/Broken Instructions", None)
+
+
+def test_plan_surgical_filter_triages_without_network(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("Phase 1 planning must not call Mealie")
+
+    monkeypatch.setattr(cleaner_module.SESSION, "delete", fail)
+    monkeypatch.setattr(cleaner_module.SESSION, "patch", fail)
+    monkeypatch.setattr(cleaner_module, "CLEANER_RENAME_SALVAGE", True)
+    clear_classification_caches()
+
+    keep = {"id": "1", "slug": "beef-stew", "name": "Beef Stew"}
+    junk = {"id": "2", "slug": "25-best-soup-recipes", "name": "25 Best Soup Recipes"}
+    rename = {"id": "3", "slug": "how-to-make-pancakes", "name": "How to Make Pancakes"}
+    no_slug = {"id": "4", "name": "Orphan"}
+
+    clean_tasks, pending_deletes, pending_renames = plan_surgical_filter([keep, junk, rename, no_slug])
+
+    assert clean_tasks == [keep, rename]
+    assert pending_deletes == [("25-best-soup-recipes", "25 Best Soup Recipes", "Listicle/roundup", None, "2")]
+    assert pending_renames == [("how-to-make-pancakes", "How to Make Pancakes", "Pancakes", "3")]
+
+
+def test_listicle_noun_gate_covers_listicle_title_regex():
+    pattern = cleaner_module.LISTICLE_TITLE_REGEX.pattern
+    nouns = pattern.rsplit(r"\b(", 1)[1].split(r")\b", 1)[0].split("|")
+
+    assert set(nouns) == set(cleaner_module.LISTICLE_NOUNS)
+
+
+def test_classify_recipe_action_deletes_listicle_with_non_ascii_digits():
+    action, reason, _ = classify_recipe_action("\u0661\u0660 soups for winter", None, "winter-soup-roundup")
+
+    assert (action, reason) == ("delete", "Listicle/roundup")
+
+
+def test_separators_to_spaces_matches_regex_normalization():
+    for text in ["", "-", "a--b", "_a_-b_", "a- -b", " how-to_make "]:
+        assert cleaner_module._separators_to_spaces(text) == re.sub(r"[-_]+", " ", text).strip()
+
+
+def test_apply_surgical_filter_deletes_then_counts_renames(monkeypatch):
+    calls = []
+
+    def fake_delete_many(pending, rejects, verified):
+        calls.append(("delete", [entry[0] for entry in pending]))
+
+    def fake_rename(slug, old_name, new_name, recipe_id=None):
+        calls.append(("rename", slug))
+        return slug != "bad-rename"
+
+    monkeypatch.setattr(cleaner_module, "delete_mealie_recipes", fake_delete_many)
+    monkeypatch.setattr(cleaner_module, "rename_mealie_recipe", fake_rename)
+
+    renamed, failed = apply_surgical_filter(
+        [("junk", "Junk", "Listicle/roundup", None, "1")],
+        [("good-rename", "How To Make Soup", "Soup", "2"), ("bad-rename", "How To Make Tea", "Tea", "3")],
+        set(),
+        set(),
+    )
+
+    assert (renamed, failed) == (1, 1)
+    assert calls == [("delete", ["junk"]), ("rename", "good-rename"), ("rename", "bad-rename")]
+
+
+def test_cleaner_session_negotiates_compressed_responses():
+    assert "gzip" in cleaner_module.SESSION.headers["Accept-Encoding"]
+
+
+def test_recipe_fields_strips_once_and_prefers_org_url():
+    recipe = {
+        "slug": " beef-stew ",
+        "name": "  ",
+        "orgURL": "",
+        "originalURL": " https://example.com/beef-stew ",
+        "source": "https://ignored.example.com",
+        "recipeId": 42,
+    }
+
+    assert cleaner_module._recipe_fields(recipe) == ("beef-stew", None, "https://example.com/beef-stew", "42")
+
+
+def test_run_integrity_scan_skips_verified_before_submitting(monkeypatch):
+    monkeypatch.setattr(cleaner_module, "CLEANER_REMOVE_NON_TARGET_LANGUAGE", False)
+    checked = []
+
+    def fake_act(recipe, rejects, verified):
+        checked.append(recipe["slug"])
+        return recipe["slug"], "VERIFIED", "", None
+
+    monkeypatch.setattr(cleaner_module, "_integrity_and_act", fake_act)
+
+    tasks = [{"slug": "known"}, {"slug": "new"}, {"name": "No Slug"}]
+    assert run_integrity_scan(tasks, set(), {"known"}) == (1, 0)
+    assert checked == ["new"]
+
+
+def test_run_cleaner_scans_renamed_recipes_after_phase1(monkeypatch, tmp_path):
+    monkeypatch.setattr(cleaner_module, "DRY_RUN", True)
+    monkeypatch.setattr(cleaner_module, "CLEANER_DEDUPE_BY_SOURCE", False)
+    monkeypatch.setattr(cleaner_module, "REJECT_FILE", tmp_path / "rejects.json")
+    monkeypatch.setattr(cleaner_module, "VERIFIED_FILE", tmp_path / "verified.json")
+    events = []
+
+    monkeypatch.setattr(
+        cleaner_module,
+        "get_mealie_recipes",
+        lambda: [{"slug": "plain-soup", "name": "Plain Soup"}, {"slug": "renamed", "name": "Renamed"}],
+    )
+    monkeypatch.setattr(
+        cleaner_module,
+        "plan_surgical_filter",
+        lambda tasks: (tasks, [], [("renamed", "Renamed", "Better Name", None)]),
+    )
+
+    def fake_apply(pending_deletes, pending_renames, rejects, verified):
+        events.append("phase1")
+        return len(pending_renames), 0
+
+    def fake_scan(tasks, rejects, verified):
+        events.append([task["slug"] for task in tasks])
+        return len(tasks), 0
+
+    monkeypatch.setattr(cleaner_module, "apply_surgical_filter", fake_apply)
+    monkeypatch.setattr(cleaner_module, "run_integrity_scan", fake_scan)
+
+    cleaner_module.run_cleaner()
+
+    assert events[-1] == ["renamed"]
+    assert events.index("phase1") < events.index(["renamed"])
+    assert ["plain-soup"] in events
+
+
+def test_save_json_set_replaces_file_without_leaving_temp_files(monkeypatch, tmp_path):
+    replaced = []
+    real_replace = cleaner_module.json_utils.os.replace
+    monkeypatch.setattr(
+        cleaner_module.json_utils.os, "replace", lambda src, dst: replaced.append(dst) or real_replace(src, dst)
+    )
+    target = tmp_path / "verified.json"
+
+    cleaner_module.save_json_set(target, {"https://example.com/a"})
+
+    assert replaced == [target]
+    assert json.loads(target.read_text()) == ["https://example.com/a"]
+    assert [path.name for path in tmp_path.iterdir()] == ["verified.json"]
@@ -1,3 +1,6 @@
+import io
+import threading
+
 from mealie_recipe_dredger.crawler import SitemapCrawler
 
 
@@ -7,8 +10,11 @@ class DummyResponse:
         self.content = content
         self.text = text
         self.url = url
+        self.raw = io.BytesIO(content)
+        self.closed = False
 
     def close(self):
+        self.closed = True
         return None
 
 
@@ -43,5 +49,89 @@ def test_fetch_sitemap_urls_ignores_image_loc_entries():
 </urlset>
 """
     crawler = SitemapCrawler(DummySession(xml), DummyStorage())
-    urls = crawler.fetch_sitemap_urls("https://example.com/sitemap.xml")
+    urls = list(crawler.fetch_sitemap_urls("https://example.com/sitemap.xml"))
     assert urls == ["https://example.com/recipe-1/"]
+
+
+class MappingSession(DummySession):
+    def __init__(self, documents):
+        self.documents = documents
+        self.requested = []
+
+    def get(self, url: str, timeout: int = 10, **kwargs):
+        self.requested.append(url)
+        content = self.documents.get(url, b"")
+        return DummyResponse(status_code=200, content=content, text=content.decode("utf-8"))
+
+
+def test_fetch_sitemap_urls_follows_recipe_sub_sitemaps_from_index():
+    index = b"""<?xml version='1.0' encoding='UTF-8'?>
+<sitemapindex xmlns='http://www.sitemaps.org/schemas/sitemap/0.9'>
+  <sitemap><loc>https://example.com/page-sitemap.xml</loc></sitemap>
+  <sitemap><loc> https://example.com/recipe-sitemap.xml </loc></sitemap>
+</sitemapindex>
+"""
+    recipes = b"""<urlset xmlns='http://www.sitemaps.org/schemas/sitemap/0.9'>
+  <url><loc>https://example.com/soup/</loc></url>
+  <url><loc>mailto:someone@example.com</loc></url>
+  <url><loc>https://example.com/stew/</loc></url>
+"""
+    session = MappingSession(
+        {
+            "https://example.com/sitemap_index.xml": index,
+            "https://example.com/recipe-sitemap.xml": recipes,
+        }
+    )
+    crawler = SitemapCrawler(session, DummyStorage())
+
+    urls = list(crawler.fetch_sitemap_urls("https://example.com/sitemap_index.xml"))
+
+    assert urls == ["https://example.com/soup/", "https://example.com/stew/"]
+    assert session.requested == [
+        "https://example.com/sitemap_index.xml",
+        "https://example.com/recipe-sitemap.xml",
+    ]
+
+
+def test_fetch_sitemap_urls_returns_empty_for_empty_body():
+    crawler = SitemapCrawler(DummySession(b""), DummyStorage())
+    assert list(crawler.fetch_sitemap_urls("https://example.com/sitemap.xml")) == []
+
+
+def test_fetch_sitemap_urls_streams_and_closes_response():
+    xml = b"<urlset><url><loc>https://example.com/soup/</loc></url></urlset>"
+    response = DummyResponse(status_code=200, content=xml)
+    calls = []
+
+    class StreamingSession(DummySession):
+        def get(self, url: str, timeout: int = 10, **kwargs):
+            calls.append(kwargs)
+            return response
+
+    crawler = SitemapCrawler(StreamingSession(xml), DummyStorage())
+
+    assert list(crawler.fetch_sitemap_urls("https://example.com/sitemap.xml")) == ["https://example.com/soup/"]
+    assert calls == [{"stream": True}]
+    assert response.closed
+
+
+def test_find_sitemap_prefers_candidate_order_when_probing_concurrently():
+    later_hit_done = threading.Event()
+
+    class ProbeSession(DummySession):
+        def get(self, url: str, timeout: int = 10, **kwargs):
+            return DummyResponse(status_code=404)
+
+        def head(self, url: str, timeout: int = 5, allow_redirects: bool = True, **kwargs):
+            if url.endswith("/sitemap.xml"):
+                # Finishes last, but outranks the recipe sitemap.
+                later_hit_done.wait(timeout=2)
+                return DummyResponse(status_code=200, url=url)
+            if url.endswith("/recipe-sitemap.xml"):
+                later_hit_done.set()
+                return DummyResponse(status_code=200, url=url)
+            return DummyResponse(status_code=404, url=url)
+
+    crawler = SitemapCrawler(ProbeSession(b""), DummyStorage())
+
+    assert crawler.find_sitemap("https://example.com") == "https://example.com/sitemap.xml"
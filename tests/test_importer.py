@@ -1,3 +1,7 @@
+import ast
+import json
+from pathlib import Path
+
 import requests
 
 import mealie_recipe_dredger.importer as importer_module
@@ -6,7 +10,15 @@ from mealie_recipe_dredger.url_utils import canonicalize_url
 
 
 class DummyStorage:
-    pass
+    def __init__(self, import_path=None):
+        self.import_path = import_path
+        self.cached = []
+
+    def get_cached_import_path(self, _mealie_url):
+        return self.import_path
+
+    def cache_import_path(self, mealie_url, path):
+        self.cached.append((mealie_url, path))
 
 
 class DummyRateLimiter:
@@ -21,7 +33,7 @@ def test_import_to_mealie_skips_when_source_precheck_hits_duplicate(monkeypatch)
     manager = ImportManager(session, DummyStorage(), DummyRateLimiter(), dry_run=False)
 
     target_url = "https://www.myactivekitchen.com/refreshing-zobo-drink-zobo-tutu/?utm_source=abc"
-    manager._known_source_urls = {canonicalize_url(target_url)}
+    manager._known_source_hashes = {hash(canonicalize_url(target_url))}
     manager._source_index_loaded = True
 
     def fail_post(*args, **kwargs):
@@ -33,3 +45,183 @@ def test_import_to_mealie_skips_when_source_precheck_hits_duplicate(monkeypatch)
     assert imported is True
     assert error is None
     assert transient is False
+
+
+def test_import_session_carries_auth_header_once(monkeypatch):
+    monkeypatch.setattr(importer_module, "IMPORT_PRECHECK_DUPLICATES", False)
+    manager = ImportManager(requests.Session(), DummyStorage(), DummyRateLimiter(), dry_run=False)
+    calls = []
+
+    class Response:
+        status_code = 201
+        text = ""
+
+    def fake_post(url, **kwargs):
+        calls.append((url, kwargs))
+        return Response()
+
+    monkeypatch.setattr(manager.import_session, "post", fake_post)
+
+    assert manager.import_session.headers["Authorization"].startswith("Bearer ")
+    assert manager.import_to_mealie("https://example.com/soup/") == (True, None, False)
+    assert "headers" not in calls[0][1]
+
+
+def test_import_to_mealie_starts_with_cached_endpoint_and_remembers_new_one(monkeypatch):
+    monkeypatch.setattr(importer_module, "IMPORT_PRECHECK_DUPLICATES", False)
+    storage = DummyStorage(import_path="/api/recipes/create-url")
+    manager = ImportManager(requests.Session(), storage, DummyRateLimiter(), dry_run=False)
+    posted = []
+
+    class Response:
+        def __init__(self, status_code):
+            self.status_code = status_code
+            self.text = ""
+
+    def fake_post(url, **kwargs):
+        posted.append(url)
+        return Response(201 if url.endswith("/create/url") else 404)
+
+    monkeypatch.setattr(manager.import_session, "post", fake_post)
+
+    assert manager.import_to_mealie("https://example.com/soup/") == (True, None, False)
+    assert posted[0].endswith("/api/recipes/create-url")
+    assert storage.cached == [(importer_module.MEALIE_URL, "/api/recipes/create/url")]
+
+    posted.clear()
+    manager.import_to_mealie("https://example.com/stew/")
+    assert len(posted) == 1
+    assert storage.cached == [(importer_module.MEALIE_URL, "/api/recipes/create/url")]
+
+
+def test_import_to_mealie_records_source_on_conflict(monkeypatch):
+    monkeypatch.setattr(importer_module, "IMPORT_PRECHECK_DUPLICATES", False)
+    manager = ImportManager(requests.Session(), DummyStorage(), DummyRateLimiter(), dry_run=False)
+
+    class Response:
+        status_code = 409
+        text = ""
+
+    monkeypatch.setattr(manager.import_session, "post", lambda url, **kwargs: Response())
+
+    url = "https://example.com/stew/?utm_source=feed"
+    assert manager.import_to_mealie(url) == (True, None, False)
+    assert manager._known_source_hashes == {hash(canonicalize_url(url))}
+
+
+def test_load_existing_sources_stops_at_reported_total_pages(monkeypatch):
+    manager = ImportManager(requests.Session(), DummyStorage(), DummyRateLimiter(), dry_run=False)
+    requested_pages = []
+
+    class Response:
+        status_code = 200
+
+        def __init__(self, page):
+            self.content = json.dumps(
+                {
+                    "items": [{"orgURL": f"https://example.com/recipe-{page}/"}],
+                    "total_pages": 2,
+                }
+            ).encode("utf-8")
+
+    def fake_get(url, params=None, **kwargs):
+        requested_pages.append(params["page"])
+        return Response(params["page"])
+
+    monkeypatch.setattr(manager.import_session, "get", fake_get)
+
+    manager._load_existing_sources()
+
+    assert requested_pages == [1, 2]
+    assert manager._known_source_hashes == {
+        hash(canonicalize_url("https://example.com/recipe-1/")),
+        hash(canonicalize_url("https://example.com/recipe-2/")),
+    }
+
+
+def test_load_existing_sources_fetches_remaining_pages_concurrently(monkeypatch):
+    manager = ImportManager(requests.Session(), DummyStorage(), DummyRateLimiter(), dry_run=False)
+    requested_pages = []
+
+    class Response:
+        def __init__(self, page):
+            self.status_code = 503 if page == failing_page else 200
+            self.content = json.dumps(
+                {"items": [{"orgURL": f"https://example.com/recipe-{page}/"}], "total_pages": 5}
+            ).encode("utf-8")
+
+    def fake_get(url, params=None, **kwargs):
+        requested_pages.append(params["page"])
+        return Response(params["page"])
+
+    monkeypatch.setattr(manager.import_session, "get", fake_get)
+
+    failing_page = None
+    manager._load_existing_sources()
+    assert sorted(requested_pages) == [1, 2, 3, 4, 5]
+    assert len(manager._known_source_hashes) == 5
+
+    failing_page = 4
+    manager = ImportManager(requests.Session(), DummyStorage(), DummyRateLimiter(), dry_run=False)
+    monkeypatch.setattr(manager.import_session, "get", fake_get)
+    manager._load_existing_sources()
+    assert manager._source_index_failed
+    assert not manager._source_index_loaded
+
+
+def test_load_existing_sources_stops_fetching_after_failed_page(monkeypatch, caplog):
+    manager = ImportManager(requests.Session(), DummyStorage(), DummyRateLimiter(), dry_run=False)
+    requested_pages = []
+
+    class Response:
+        def __init__(self, page):
+            self.status_code = 500 if page == 2 else 200
+            self.content = json.dumps(
+                {"items": [{"orgURL": f"https://example.com/recipe-{page}/"}], "total_pages": 200}
+            ).encode("utf-8")
+
+    def fake_get(url, params=None, **kwargs):
+        requested_pages.append(params["page"])
+        return Response(params["page"])
+
+    monkeypatch.setattr(manager.import_session, "get", fake_get)
+
+    manager._load_existing_sources()
+
+    assert manager._source_index_failed
+    assert len(requested_pages) <= 1 + 2 * importer_module.SOURCE_INDEX_PAGE_WORKERS
+    assert [record.getMessage() for record in caplog.records].count(
+        "   [Mealie] Duplicate precheck disabled: recipe list HTTP 500"
+    ) == 1
+
+
+def test_importer_module_defines_each_top_level_name_once():
+    tree = ast.parse(Path(importer_module.__file__).read_text(encoding="utf-8"))
+    names = [node.name for node in tree.body if isinstance(node, (ast.ClassDef, ast.FunctionDef))]
+
+    assert names.count("ImportManager") == 1
+    assert len(names) == len(set(names))
+
+
+def test_warm_up_loads_source_index_in_background(monkeypatch):
+    monkeypatch.setattr(importer_module, "IMPORT_PRECHECK_DUPLICATES", True)
+    monkeypatch.setattr(importer_module, "MEALIE_ENABLED", True)
+    manager = ImportManager(requests.Session(), DummyStorage(), DummyRateLimiter(), dry_run=False)
+
+    class Response:
+        status_code = 200
+        content = json.dumps({"items": [{"orgURL": "https://example.com/soup/"}], "total_pages": 1}).encode("utf-8")
+
+    monkeypatch.setattr(manager.import_session, "get", lambda url, **kwargs: Response())
+
+    manager.warm_up()
+    manager._warm_up_thread.join(timeout=5)
+
+    assert manager._source_index_loaded
+    assert manager._known_source_hashes == {hash(canonicalize_url("https://example.com/soup/"))}
+
+
+def test_warm_up_is_skipped_in_dry_run():
+    manager = ImportManager(requests.Session(), DummyStorage(), DummyRateLimiter(), dry_run=True)
+    manager.warm_up()
+    assert manager._warm_up_thread is None
@@ -0,0 +1,42 @@
+import json
+
+import pytest
+
+import mealie_recipe_dredger.json_utils as json_utils_module
+from mealie_recipe_dredger.json_utils import dumps, loads
+from mealie_recipe_dredger.site_alignment import Candidate
+
+
+def test_json_utils_round_trip_with_indent():
+    payload = {"hosts": ["example.com", "café.example"]}
+    encoded = dumps(payload, indent=True)
+    assert isinstance(encoded, bytes)
+    assert loads(encoded) == payload
+    assert b"\n" in encoded
+
+
+def test_json_utils_stdlib_fallback(monkeypatch):
+    monkeypatch.setattr(json_utils_module, "ORJSON_AVAILABLE", False)
+    encoded = dumps(["a", "b"])
+    assert json.loads(encoded.decode("utf-8")) == ["a", "b"]
+    assert loads(encoded) == ["a", "b"]
+
+
+def test_json_utils_loads_accepts_str_subclasses():
+    class ScriptText(str):
+        pass
+
+    assert loads(ScriptText('{"inLanguage": "de-DE"}')) == {"inLanguage": "de-DE"}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_utils_serializes_dataclasses(monkeypatch, use_orjson):
+    if use_orjson and not json_utils_module.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(json_utils_module, "ORJSON_AVAILABLE", use_orjson)
+    candidate = Candidate("Soup", "example.com", "https://example.com/soup", "1", "soup")
+    assert loads(dumps({"candidates": [candidate]})) == {
+        "candidates": [
+            {"name": "Soup", "host": "example.com", "source": "https://example.com/soup", "recipe_id": "1", "slug": "soup"}
+        ]
+    }
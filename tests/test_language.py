@@ -1,4 +1,27 @@
-from mealie_recipe_dredger.language import detect_language_from_text
+import re
+from types import SimpleNamespace
+
+from bs4 import BeautifulSoup
+
+import mealie_recipe_dredger.language as language_module
+from mealie_recipe_dredger.language import (
+    _collapse_whitespace,
+    _collapse_whitespace_prefix,
+    _append_detector_text,
+    _detect_top_language,
+    _get_detector,
+    _get_detector_factory,
+    _find_in_language,
+    _may_declare_language,
+    _scan_soup,
+    _script_language,
+    build_soup,
+    detect_language_from_html,
+    detect_language_from_recipe_payload,
+    detect_language_from_text,
+    detect_languages_from_payloads,
+    normalize_language_code,
+)
 
 
 def test_detect_language_from_text_identifies_hindi_script():
@@ -8,6 +31,31 @@ def test_detect_language_from_text_identifies_hindi_script():
     assert confidence > 0
 
 
+def test_detect_language_from_text_uses_single_language_scripts(monkeypatch):
+    def fail_detector():
+        raise AssertionError("detector should not run for single-language scripts")
+
+    monkeypatch.setattr(language_module, "_get_detector", fail_detector)
+    _detect_top_language.cache_clear()
+    assert detect_language_from_text("ผัดไทย กุ้งสด 200 กรัม") == ("th", 1.0)
+    assert detect_language_from_text("Η μουσακάς είναι νόστιμη") == ("el", 1.0)
+    assert detect_language_from_text("鶏肉の照り焼き") == ("ja", 1.0)
+
+
+def test_script_language_leaves_shared_and_mixed_scripts_to_detector():
+    assert _script_language("यह एक स्वादिष्ट रेसिपी है") is None
+    assert _script_language("红烧肉") is None
+    assert _script_language("Pad Thai ผัดไทย") is None
+    assert _script_language("ผัดไทย Pad Thai") is None
+
+
+def test_default_profiles_identify_languages_outside_compact_set():
+    assert not language_module.LANGUAGE_COMPACT_PROFILES
+    text = "Rozgrzej piekarnik do 180 stopni. Wymieszaj mąkę z cukrem i dodaj jajka, a następnie piecz przez 40 minut."
+    language, _confidence = detect_language_from_text(text)
+    assert language == "pl"
+
+
 def test_detect_language_from_text_identifies_english():
     text = "This recipe is easy to make and includes ingredients with clear instructions."
     language, confidence = detect_language_from_text(text)
@@ -20,3 +68,253 @@ def test_detect_language_from_text_identifies_french():
     language, confidence = detect_language_from_text(text)
     assert language == "fr"
     assert confidence > 0
+
+
+def test_collapse_whitespace_matches_regex_normalization():
+    for text in ["", "  ", " a\t\nb  c ", "x  y", "　z"]:
+        assert _collapse_whitespace(text) == re.sub(r"\s+", " ", text).strip()
+
+
+def test_find_in_language_returns_first_match_in_document_order():
+    payload = {
+        "@graph": [
+            {"@type": "WebPage", "inLanguage": ["", "es-MX"]},
+            {"@type": "Recipe", "inLanguage": "en-US"},
+        ],
+        "inLanguage": None,
+    }
+
+    assert _find_in_language(payload) == "es"
+    assert _find_in_language([{"nested": {"inLanguage": "fr"}}, {"inLanguage": "de"}]) == "fr"
+    assert _find_in_language({"name": "No language"}) is None
+    assert _find_in_language("inLanguage") is None
+    assert _find_in_language(5) is None
+
+
+def test_recipe_payload_detection_stops_reading_once_text_budget_is_filled():
+    class UnreadStep(dict):
+        def get(self, *args, **kwargs):
+            raise AssertionError("steps past the detection budget should not be read")
+
+    sentence = "Stir the sauce gently and let it simmer until the vegetables are tender. "
+    steps = [{"text": sentence * 50} for _ in range(5)] + [UnreadStep()]
+
+    language, source, _confidence = detect_language_from_recipe_payload(
+        {"name": "Vegetable Stew", "recipeInstructions": steps}
+    )
+
+    assert (language, source) == ("en", "text")
+
+
+def test_normalize_language_code_handles_tags_and_non_strings():
+    assert normalize_language_code(" en_US ") == "en"
+    assert normalize_language_code("pt-BR") == "pt"
+    assert normalize_language_code("x-default") is None
+    assert normalize_language_code({"@value": "en"}) is None
+    assert normalize_language_code(["en"]) is None
+
+
+def test_declared_language_read_from_ld_json_script():
+    html = (
+        "<html><head>"
+        '<script type="text/javascript">var x = 1;</script>'
+        '<script type="application/ld+json">{"@graph": [{"inLanguage": "de-DE"}]}</script>'
+        "</head><body><p>Short text</p></body></html>"
+    )
+
+    assert detect_language_from_html(BeautifulSoup(html, "lxml")) == ("de", "declared", 1.0)
+
+
+def test_detect_language_from_text_reuses_results_for_repeated_text():
+    text = "Print recipe and save it to your favorite collection for later cooking."
+    first = detect_language_from_text(text)
+    hits_before = _detect_top_language.cache_info().hits
+
+    assert detect_language_from_text(f"  {text}\n") == first
+    assert _detect_top_language.cache_info().hits == hits_before + 1
+    assert detect_language_from_text(text, min_confidence=1.01) == (None, first[1])
+
+
+def test_scan_soup_collects_text_in_find_all_order_and_limit():
+    html = "<html><head><title>Menu</title><meta name='description' content='Weekly dishes'></head><body>" + "".join(
+        f"<div><h1>h{i}</h1><span>skip</span><p>p{i}</p><h2>s{i}</h2></div>" for i in range(20)
+    ) + "</body></html>"
+    soup = BeautifulSoup(html, "lxml")
+
+    expected = " ".join(["Menu", "Weekly dishes"] + [tag.get_text() for tag in soup.find_all(["h1", "h2", "p"], limit=35)])
+    assert _scan_soup(soup) == (None, expected)
+
+
+def test_scan_soup_prefers_meta_declarations_in_priority_order():
+    html = (
+        "<html><head><meta property='og:locale' content='fr_FR'>"
+        "<meta name='language' content=''>"
+        "<meta http-equiv='Content-Language' content='es'></head>"
+        "<body><script type='application/ld+json'>{\"inLanguage\": \"it\"}</script></body></html>"
+    )
+
+    assert _scan_soup(BeautifulSoup(html, "lxml")) == ("es", "")
+
+
+def test_detect_language_from_html_accepts_raw_markup():
+    html = "<html lang='fr-FR'><head><title>Soupe</title></head><body><p>Bonjour</p></body></html>"
+
+    assert detect_language_from_html(html) == ("fr", "declared", 1.0)
+    assert detect_language_from_html(html.encode("utf-8")) == ("fr", "declared", 1.0)
+    assert build_soup(html).builder.NAME == "lxml"
+
+
+def test_detect_language_from_text_uses_lingua_backend_when_available(monkeypatch):
+    class FakeLingua:
+        def compute_language_confidence_values(self, text):
+            language = SimpleNamespace(iso_code_639_1=SimpleNamespace(name="PT"))
+            return [SimpleNamespace(language=language, value=0.91)]
+
+    monkeypatch.setattr(language_module, "LINGUA_AVAILABLE", True)
+    monkeypatch.setattr(language_module, "LANGUAGE_DETECTOR", "auto")
+    monkeypatch.setattr(language_module, "_get_lingua_detector", lambda: FakeLingua())
+    _detect_top_language.cache_clear()
+    try:
+        assert detect_language_from_text("Receita de sopa de legumes") == ("pt", 0.91)
+        assert detect_language_from_text("Receita de sopa de legumes", min_confidence=0.95) == (None, 0.91)
+
+        monkeypatch.setattr(language_module, "LANGUAGE_DETECTOR", "langdetect")
+        _detect_top_language.cache_clear()
+        assert detect_language_from_text("This chicken soup recipe is quick and easy to cook.")[0] == "en"
+    finally:
+        _detect_top_language.cache_clear()
+
+
+def test_detect_language_from_text_uses_fasttext_model_when_configured(monkeypatch):
+    class FakeFastText:
+        def predict(self, text, k=1):
+            assert "\n" not in text
+            return ("__label__de",), (1.00002,)
+
+    monkeypatch.setattr(language_module, "FASTTEXT_AVAILABLE", True)
+    monkeypatch.setattr(language_module, "LANGUAGE_FASTTEXT_MODEL", "/models/lid.176.ftz")
+    monkeypatch.setattr(language_module, "LANGUAGE_DETECTOR", "auto")
+    monkeypatch.setattr(language_module, "_get_fasttext_model", lambda: FakeFastText())
+    _detect_top_language.cache_clear()
+    try:
+        assert detect_language_from_text("Gemüsesuppe mit\nKartoffeln") == ("de", 1.0)
+    finally:
+        _detect_top_language.cache_clear()
+
+
+def test_unloadable_fasttext_model_falls_back_to_langdetect(monkeypatch):
+    monkeypatch.setattr(language_module, "FASTTEXT_AVAILABLE", True)
+    monkeypatch.setattr(language_module, "LANGUAGE_FASTTEXT_MODEL", "/missing/lid.176.ftz")
+    monkeypatch.setattr(language_module, "LANGUAGE_DETECTOR", "fasttext")
+    monkeypatch.setattr(language_module, "_fasttext_failed", False)
+    monkeypatch.setattr(language_module, "fasttext", SimpleNamespace(load_model=lambda path: open(path)), raising=False)
+    _detect_top_language.cache_clear()
+    try:
+        assert detect_language_from_text("This chicken soup recipe is quick and easy to cook.")[0] == "en"
+        assert language_module._fasttext_failed
+        assert not language_module._use_fasttext()
+    finally:
+        _detect_top_language.cache_clear()
+
+
+def test_append_detector_text_matches_langdetect_append():
+    text = "Soup  recipe   by me@example.com at https://example.com/soup  Tiếng Việt " * 400
+
+    reference = _get_detector_factory().create()
+    reference.append(text)
+    detector = _get_detector()
+    _append_detector_text(detector, text)
+
+    assert detector.text == reference.text
+
+
+def test_reused_detector_is_reset_between_calls():
+    text = "Une soupe de légumes maison, simple et rapide à préparer pour le dîner."
+    first = _detect_top_language.__wrapped__(text)
+    _detect_top_language.__wrapped__("This chicken soup recipe is quick and easy to cook.")
+
+    assert _get_detector() is _get_detector()
+    assert _detect_top_language.__wrapped__(text) == first
+
+
+def test_collapse_whitespace_prefix_matches_full_collapse():
+    samples = [
+        "word " * 5000,
+        " \n\t " * 9000 + "tail words here",
+        "a" * 30000,
+        "short  text ",
+        "",
+        ("x " + " " * 40) * 2000,
+    ]
+    for text in samples:
+        for limit in (1, 7, 100, 12000):
+            assert _collapse_whitespace_prefix(text, limit) == _collapse_whitespace(text)[:limit]
+
+
+def test_jsonld_blocks_without_page_level_types_are_skipped():
+    html = (
+        "<html><head>"
+        '<script type="application/ld+json">{"@type": "BreadcrumbList", "inLanguage": "fr"}</script>'
+        '<script type="application/ld+json">{"@context": "https://schema.org", "@graph": ['
+        '{"@type": "Organization", "name": "Site"}, {"@type": ["WebPage"], "inLanguage": "de-DE"}]}</script>'
+        "</head><body></body></html>"
+    )
+
+    assert _scan_soup(BeautifulSoup(html, "lxml")) == ("de", "")
+    assert _may_declare_language([{"@type": "Offer"}, {"@type": {"bad": "type"}}]) is False
+    assert _may_declare_language({"name": "untyped"}) is True
+    assert _may_declare_language("not a node") is False
+
+
+def test_jsonld_language_types_are_matched_loosely():
+    for jsonld_type in ("ItemPage", "CollectionPage", "HowTo", "recipe", "http://schema.org/Recipe", "schema:Recipe"):
+        html = (
+            '<html><head><script type="application/ld+json">'
+            f'{{"@type": "{jsonld_type}", "inLanguage": "fr-FR"}}'
+            "</script></head><body><p>Short.</p></body></html>"
+        )
+
+        assert _scan_soup(BeautifulSoup(html, "lxml")) == ("fr", ""), jsonld_type
+    assert _may_declare_language({"@type": "http://schema.org/ImageObject"}) is False
+
+
+def test_batch_payload_detection_samples_homogeneous_batches(monkeypatch):
+    calls = []
+
+    def fake_detect(payload, min_confidence=0.70):
+        calls.append(payload["name"])
+        return payload["lang"], "text", 0.9
+
+    monkeypatch.setattr(language_module, "detect_language_from_recipe_payload", fake_detect)
+    payloads = [{"name": f"r{index}", "lang": "en"} for index in range(20)]
+    payloads[3] = {"name": "declared", "lang": "en", "inLanguage": "de"}
+
+    results = detect_languages_from_payloads(payloads, sample_size=4)
+
+    assert len(calls) == 4
+    assert results[3] == ("de", "field:inLanguage", 1.0)
+    assert {result for index, result in enumerate(results) if index != 3 and payloads[index]["name"] not in calls} == {
+        ("en", "batch", 0.9)
+    }
+
+
+def test_batch_payload_detection_falls_back_for_mixed_batches(monkeypatch):
+    monkeypatch.setattr(
+        language_module,
+        "detect_language_from_recipe_payload",
+        lambda payload, min_confidence=0.70: (payload["lang"], "text", 0.9),
+    )
+    payloads = [{"lang": "en" if index % 2 else "es"} for index in range(12)]
+
+    results = detect_languages_from_payloads(payloads, sample_size=4)
+
+    assert [result[0] for result in results] == [payload["lang"] for payload in payloads]
+
+
+def test_detect_language_from_text_skips_detector_for_letterless_ascii(monkeypatch):
+    def fail_detect(_text):
+        raise AssertionError("detector should not run")
+
+    monkeypatch.setattr(language_module, "_detect_top_language", fail_detect)
+
+    assert detect_language_from_text("1/2 - 250 (300) 12:30") == (None, 0.0)
@@ -0,0 +1,40 @@
+import threading
+
+import pytest
+
+from mealie_recipe_dredger.paging_utils import iter_prefetched
+
+
+def test_iter_prefetched_yields_pages_in_order():
+    assert list(iter_prefetched(lambda page: page * 10, range(1, 8), window=3)) == [10, 20, 30, 40, 50, 60, 70]
+
+
+def test_iter_prefetched_keeps_window_bounded_and_cancels_on_close():
+    fetched = []
+    lock = threading.Lock()
+
+    def fetch(page):
+        with lock:
+            fetched.append(page)
+        return page
+
+    pages = iter_prefetched(fetch, range(1, 201), window=4)
+    assert next(pages) == 1
+    pages.close()
+
+    assert len(fetched) <= 5
+
+
+def test_iter_prefetched_cancels_pending_fetches_on_error():
+    fetched = []
+
+    def fetch(page):
+        fetched.append(page)
+        if page == 2:
+            raise RuntimeError("boom")
+        return page
+
+    with pytest.raises(RuntimeError):
+        list(iter_prefetched(fetch, range(1, 201), window=4))
+
+    assert len(fetched) <= 6
@@ -0,0 +1,56 @@
+import re
+import sys
+
+import pytest
+
+import mealie_recipe_dredger.regex_utils as regex_utils
+
+
+def test_compile_gate_falls_back_to_re_when_re2_rejects_pattern(monkeypatch):
+    class FakeRe2:
+        class error(Exception):
+            pass
+
+        @staticmethod
+        def compile(pattern):
+            raise FakeRe2.error(pattern)
+
+    monkeypatch.setattr(regex_utils, "RE2_AVAILABLE", True)
+    monkeypatch.setattr(regex_utils, "re2", FakeRe2, raising=False)
+    gate = regex_utils.compile_gate(r"how\s+to")
+    assert gate.search("HOW to cook")
+
+
+def test_compile_gate_uses_re_without_re2(monkeypatch):
+    monkeypatch.setattr(regex_utils, "RE2_AVAILABLE", False)
+    gate = regex_utils.compile_gate(r"\bbest\b.*\brecipes\b")
+    assert gate.search("The BEST Soup Recipes")
+    assert not gate.search("bestest recipes")
+
+
+def test_to_re2_superset_rewrites_ascii_only_escapes():
+    rewritten = regex_utils._to_re2_superset(r"\bstep\s+\d+\b")
+    assert rewritten == f"step[{regex_utils.UNICODE_WHITESPACE_RE2}]+\\p{{Nd}}+"
+    assert "\\x{a0}" in regex_utils.UNICODE_WHITESPACE_RE2
+    assert regex_utils._to_re2_superset(r"\w+ recipes") is None
+
+
+def test_unicode_whitespace_set_matches_str_isspace():
+    listed = set()
+    for low, high in re.findall(r"\\x\{([0-9a-f]+)\}(?:-\\x\{([0-9a-f]+)\})?", regex_utils.UNICODE_WHITESPACE_RE2):
+        listed.update(range(int(low, 16), int(high or low, 16) + 1))
+
+    assert listed == {codepoint for codepoint in range(sys.maxunicode + 1) if chr(codepoint).isspace()}
+
+
+def test_compile_gate_matches_unicode_whitespace_and_digits_with_re2():
+    pytest.importorskip("re2")
+    assert regex_utils.compile_gate(r"\bhow\s+to\s+make\b").search("how\xa0to make soup")
+    assert regex_utils.compile_gate(r"\b\d+\s+best\b").search("１０ best soups")
+
+
+def test_compile_gate_keeps_unsupported_patterns_on_re(monkeypatch):
+    monkeypatch.setattr(regex_utils, "RE2_AVAILABLE", True)
+    monkeypatch.setattr(regex_utils, "re2", None, raising=False)
+    gate = regex_utils.compile_gate(r"\w+ recipes")
+    assert gate.search("Soup Recipes")
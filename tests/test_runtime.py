@@ -0,0 +1,70 @@
+import json
+import time
+
+import mealie_recipe_dredger.runtime as runtime_module
+from mealie_recipe_dredger.runtime import RateLimiter
+
+
+class RobotsResponse:
+    status_code = 200
+
+    def __init__(self, content: bytes):
+        self.content = content
+
+
+class RobotsSession:
+    def __init__(self, content: bytes):
+        self.content = content
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        self.calls.append(url)
+        return RobotsResponse(self.content)
+
+
+def test_crawl_delay_is_parsed_from_robots_body(monkeypatch, tmp_path):
+    monkeypatch.setattr(runtime_module, "RESPECT_ROBOTS_TXT", True)
+    limiter = RateLimiter(cache_file=tmp_path / "crawl_delays.json")
+    limiter.session = RobotsSession(b"User-agent: *\nCrawl-Delay: soon\n  crawl-delay : 2.5\nDisallow: /x\n")
+
+    assert limiter.get_crawl_delay("example.com") == 2.5
+
+
+def test_crawl_delay_cache_persists_and_expires(monkeypatch, tmp_path):
+    monkeypatch.setattr(runtime_module, "RESPECT_ROBOTS_TXT", True)
+    cache_file = tmp_path / "crawl_delays.json"
+
+    first = RateLimiter(cache_file=cache_file)
+    first.session = RobotsSession(b"crawl-delay: 4\n")
+    assert first.get_crawl_delay("example.com") == 4.0
+    first.save()
+
+    second = RateLimiter(cache_file=cache_file)
+    second.session = RobotsSession(b"crawl-delay: 9\n")
+    assert second.get_crawl_delay("example.com") == 4.0
+    assert second.session.calls == []
+
+    stale = time.time() - runtime_module.CRAWL_DELAY_TTL_SECONDS - 1
+    cache_file.write_text(json.dumps({"example.com": {"delay": 4.0, "timestamp": stale}}), encoding="utf-8")
+    third = RateLimiter(cache_file=cache_file)
+    third.session = RobotsSession(b"crawl-delay: 9\n")
+    assert third.get_crawl_delay("example.com") == 9.0
+    assert third.session.calls == ["https://example.com/robots.txt"]
+
+
+def test_wait_if_needed_spaces_same_domain_and_not_other_domains(monkeypatch):
+    monkeypatch.setattr(runtime_module, "RESPECT_ROBOTS_TXT", False)
+    monkeypatch.setattr(runtime_module, "DEFAULT_CRAWL_DELAY", 2.0)
+    monkeypatch.setattr(runtime_module.random, "uniform", lambda _low, _high: 1.0)
+    clock = [100.0]
+    sleeps = []
+    monkeypatch.setattr(runtime_module.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(runtime_module.time, "sleep", sleeps.append)
+    limiter = RateLimiter(cache_file=None)
+
+    limiter.wait_if_needed("https://a.example/1")
+    limiter.wait_if_needed("https://b.example/1")
+    limiter.wait_if_needed("https://a.example/2")
+    limiter.wait_if_needed("https://a.example/3")
+
+    assert sleeps == [2.0, 4.0]
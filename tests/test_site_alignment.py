@@ -1,18 +1,31 @@
 from __future__ import annotations
 
+import json
+import logging
+import os
 from argparse import Namespace
+from types import SimpleNamespace
 
 import pytest
+import requests
 
 from mealie_recipe_dredger.site_alignment import (
     build_candidates,
+    delete_recipe,
+    get_recipes,
     align_mealie_recipes,
     host_allowed,
+    host_from_url,
     hosts_from_sites,
+    PAGE_FETCH_WORKERS,
+    iter_recipes,
+    iter_recipes_for_hosts,
+    load_allowed_hosts,
     removed_hosts_for_diff,
     run_from_args,
     save_host_snapshot,
     load_host_snapshot,
+    normalize_host,
 )
 
 
@@ -37,6 +50,13 @@ def test_removed_hosts_for_diff_ignores_subdomains_still_covered() -> None:
     assert removed_hosts == {"legacy.test.com"}
 
 
+def test_host_allowed_matches_fully_qualified_source_hosts() -> None:
+    host = host_from_url("https://Recipes.Example.com./soup")
+    assert host == "recipes.example.com"
+    assert host_allowed(host, {"example.com"})
+    assert not host_allowed(host, {"ample.com"})
+
+
 def test_build_candidates_prunes_only_removed_hosts_in_diff_mode() -> None:
     recipes = [
         {"name": "Remove Me", "orgURL": "https://old.example.com/r1", "id": "1", "slug": "remove-me"},
@@ -55,6 +75,41 @@ def test_build_candidates_prunes_only_removed_hosts_in_diff_mode() -> None:
     assert [candidate.name for candidate in candidates] == ["Remove Me"]
 
 
+def test_load_allowed_hosts_reparses_only_after_file_changes(tmp_path, monkeypatch) -> None:
+    sites_file = tmp_path / "sites.json"
+    sites_file.write_text(json.dumps(["https://www.example.com/"]), encoding="utf-8")
+    calls = []
+    real_loads = json.loads
+    monkeypatch.setattr(
+        "mealie_recipe_dredger.site_alignment.json_utils.loads",
+        lambda data: calls.append(data) or real_loads(data),
+    )
+
+    first = load_allowed_hosts(sites_file)
+    first.add("mutated.example")
+    assert load_allowed_hosts(sites_file) == {"example.com"}
+    assert len(calls) == 1
+
+    sites_file.write_text(json.dumps(["https://example.com/", "https://other.test/"]), encoding="utf-8")
+    stat = sites_file.stat()
+    os.utime(sites_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_allowed_hosts(sites_file) == {"example.com", "other.test"}
+    assert len(calls) == 2
+
+
+def test_build_candidates_skips_recipes_repeated_across_pages() -> None:
+    recipe = {"name": "Remove Me", "orgURL": "https://old.example.com/r1", "id": "1", "slug": "remove-me"}
+    no_id = {"name": "No Id", "orgURL": "https://old.example.com/r2"}
+
+    candidates, _ = build_candidates(
+        recipes=[recipe, dict(recipe), no_id, dict(no_id)],
+        should_prune_host=lambda host: True,
+        keep_missing_source=True,
+    )
+
+    assert [candidate.name for candidate in candidates] == ["Remove Me", "No Id", "No Id"]
+
+
 def test_host_snapshot_round_trip(tmp_path) -> None:
     snapshot_file = tmp_path / "site_alignment_hosts.json"
     save_host_snapshot(snapshot_file, {"example.com", "legacy.test.com"})
@@ -64,7 +119,7 @@ def test_host_snapshot_round_trip(tmp_path) -> None:
 
 
 def test_apply_requires_interactive_without_yes(monkeypatch) -> None:
-    monkeypatch.setattr("mealie_recipe_dredger.site_alignment.get_recipes", lambda **kwargs: [
+    monkeypatch.setattr("mealie_recipe_dredger.site_alignment.iter_recipes", lambda **kwargs: [
         {"name": "Remove Me", "orgURL": "https://old.example.com/r1", "id": "1", "slug": "remove-me"}
     ])
 
@@ -139,7 +194,7 @@ def test_run_from_args_allows_unsafe_override(tmp_path, monkeypatch) -> None:
 
 
 def test_backup_failure_aborts_apply(monkeypatch) -> None:
-    monkeypatch.setattr("mealie_recipe_dredger.site_alignment.get_recipes", lambda **kwargs: [
+    monkeypatch.setattr("mealie_recipe_dredger.site_alignment.iter_recipes", lambda **kwargs: [
         {"name": "Remove Me", "orgURL": "https://old.example.com/r1", "id": "1", "slug": "remove-me"}
     ])
     monkeypatch.setattr(
@@ -168,3 +223,227 @@ def test_backup_failure_aborts_apply(monkeypatch) -> None:
     assert report.candidate_count == 1
     assert report.deleted_count == 0
     assert report.failed_count == 0
+
+
+def test_host_helpers_are_memoized_and_keep_non_string_guard() -> None:
+    assert host_from_url("https://WWW.Example.com/soup") == "example.com"
+    assert host_from_url(None) is None
+    assert host_from_url(["https://example.com"]) is None
+
+    hits_before = normalize_host.cache_info().hits
+    assert normalize_host(" www.Example.com ") == "example.com"
+    assert normalize_host(" www.Example.com ") == "example.com"
+    assert normalize_host.cache_info().hits == hits_before + 1
+
+
+class RecipePageSession:
+    def __init__(self, pages, report_total: bool = True) -> None:
+        self.pages = pages
+        self.report_total = report_total
+        self.requested = []
+        self.sent_headers = []
+
+    def get(self, url, headers=None, params=None, timeout=None):
+        page = params["page"]
+        self.requested.append(page)
+        self.sent_headers.append(headers)
+        payload = {"items": self.pages[page - 1] if page <= len(self.pages) else []}
+        if self.report_total:
+            payload["total_pages"] = len(self.pages)
+        content = json.dumps(payload).encode("utf-8")
+        return SimpleNamespace(status_code=200, raise_for_status=lambda: None, content=content)
+
+
+@pytest.mark.parametrize("report_total", [True, False])
+def test_get_recipes_returns_pages_in_order(report_total: bool) -> None:
+    pages = [[{"slug": f"r{page}-{index}"} for index in range(3)] for page in range(6)]
+    session = RecipePageSession(pages, report_total=report_total)
+
+    recipes = get_recipes("https://mealie.local", "token", 30, session=session)
+
+    assert [recipe["slug"] for recipe in recipes] == [item["slug"] for page in pages for item in page]
+    assert sorted(session.requested) == list(range(1, 8))
+
+
+def test_apply_deletes_candidates_concurrently_and_counts_results(monkeypatch) -> None:
+    recipes = [
+        {"name": f"Old {index}", "orgURL": f"https://old.example.com/r{index}", "id": str(index), "slug": f"old-{index}"}
+        for index in range(20)
+    ]
+    monkeypatch.setattr("mealie_recipe_dredger.site_alignment.iter_recipes", lambda **kwargs: iter(recipes))
+    sessions = set()
+
+    def fake_delete(**kwargs):
+        sessions.add(id(kwargs["session"]))
+        ok = int(kwargs["recipe_identifier"]) % 5 != 0
+        return ok, kwargs["recipe_identifier"] if ok else "HTTP 500"
+
+    monkeypatch.setattr("mealie_recipe_dredger.site_alignment.delete_recipe", fake_delete)
+
+    report = align_mealie_recipes(
+        mealie_url="http://mealie.local",
+        token="token",
+        timeout=10,
+        allowed_hosts={"active.example.com"},
+        prune_hosts={"old.example.com"},
+        apply=True,
+    )
+
+    assert report.total_recipes == 20
+    assert (report.candidate_count, report.deleted_count, report.failed_count) == (20, 16, 4)
+    assert len(sessions) == 1
+
+
+def test_get_recipes_keeps_only_alignment_fields() -> None:
+    page = [{"id": "1", "slug": "soup", "name": "Soup", "orgURL": "https://a.example/soup", "recipeIngredient": ["x"] * 50}]
+    session = RecipePageSession([page])
+
+    assert get_recipes("https://mealie.local", "token", 30, session=session) == [
+        {"name": "Soup", "id": "1", "slug": "soup", "orgURL": "https://a.example/soup"}
+    ]
+
+
+def test_get_recipes_sends_auth_header_only_when_session_lacks_it() -> None:
+    plain = RecipePageSession([[{"slug": "soup"}]])
+    get_recipes("https://mealie.local", "token", 30, session=plain)
+    assert plain.sent_headers[0] == {"Authorization": "Bearer token"}
+
+    authorized = RecipePageSession([[{"slug": "soup"}]])
+    authorized.headers = {"Authorization": "Bearer token"}
+    get_recipes("https://mealie.local", "token", 30, session=authorized)
+    assert authorized.sent_headers[0] is None
+
+
+def test_align_without_session_uses_one_authorized_session_and_closes_it(monkeypatch) -> None:
+    seen = []
+
+    def fake_iter_recipes(**kwargs):
+        seen.append(kwargs["session"])
+        return []
+
+    monkeypatch.setattr("mealie_recipe_dredger.site_alignment.iter_recipes", fake_iter_recipes)
+    closed = []
+    monkeypatch.setattr(requests.Session, "close", lambda self: closed.append(self))
+
+    align_mealie_recipes(
+        mealie_url="http://mealie.local",
+        token="token",
+        timeout=10,
+        allowed_hosts={"active.example.com"},
+        apply=False,
+    )
+
+    assert seen[0].headers["Authorization"] == "Bearer token"
+    assert closed == seen
+
+
+class FilteringSession:
+    def __init__(self, recipes, mode: str = "filter") -> None:
+        self.recipes = recipes
+        self.mode = mode
+        self.filters = []
+
+    def get(self, url, headers=None, params=None, timeout=None):
+        query_filter = params.get("queryFilter")
+        self.filters.append(query_filter)
+        if query_filter and self.mode == "reject":
+            response = SimpleNamespace(status_code=400)
+
+            def raise_for_status():
+                raise requests.HTTPError(response=response)
+
+            response.raise_for_status = raise_for_status
+            return response
+        items = self.recipes
+        if query_filter and self.mode == "filter":
+            needle = query_filter.split('"%')[1].split('%"')[0]
+            items = [recipe for recipe in items if needle in recipe["orgURL"]]
+        payload = {"items": items if params["page"] == 1 else [], "total_pages": 1}
+        return SimpleNamespace(status_code=200, raise_for_status=lambda: None, content=json.dumps(payload).encode())
+
+
+FILTER_RECIPES = [
+    {"id": "1", "slug": "a", "orgURL": "https://old.example.com/a"},
+    {"id": "2", "slug": "b", "orgURL": "https://keep.example.net/b"},
+    {"id": "3", "slug": "c", "orgURL": "https://gone.test/c"},
+]
+
+
+@pytest.mark.parametrize(
+    ("mode", "expected_ids"),
+    [("filter", ["1", "3"]), ("ignore", ["1", "2", "3"]), ("reject", ["1", "2", "3"])],
+)
+def test_iter_recipes_for_hosts_filters_or_falls_back(mode: str, expected_ids) -> None:
+    session = FilteringSession(FILTER_RECIPES, mode=mode)
+    recipes = iter_recipes_for_hosts("https://mealie.local", "token", 30, {"old.example.com", "gone.test"}, session=session)
+
+    assert sorted(recipe["id"] for recipe in recipes) == sorted(expected_ids)
+    assert session.filters[0] == 'orgURL LIKE "%gone.test%"'
+    if mode != "filter":
+        assert session.filters[-1] is None
+
+
+def test_delete_recipe_without_session_uses_and_closes_a_pooled_session(monkeypatch) -> None:
+    sent = []
+    closed = []
+
+    def fake_delete(self, url, headers=None, timeout=None):
+        sent.append((url, headers, self.headers["Authorization"]))
+        return SimpleNamespace(status_code=200)
+
+    monkeypatch.setattr(requests.Session, "delete", fake_delete)
+    monkeypatch.setattr(requests.Session, "close", lambda self: closed.append(self))
+
+    assert delete_recipe("http://mealie.local", "token", "1", "soup", 10) == (True, "1")
+    assert sent == [("http://mealie.local/api/recipes/1", None, "Bearer token")]
+    assert len(closed) == 1
+
+
+def test_iter_recipes_for_hosts_only_filters_on_org_url() -> None:
+    recipes = FILTER_RECIPES + [{"id": "4", "slug": "d", "orgURL": "", "originalURL": "https://old.example.com/d"}]
+    session = FilteringSession(recipes, mode="filter")
+    fallbacks = []
+
+    found = iter_recipes_for_hosts(
+        "https://mealie.local", "token", 30, {"old.example.com"}, session=session, on_fallback=lambda: fallbacks.append(1)
+    )
+
+    assert [recipe["id"] for recipe in found] == ["1"]
+    assert fallbacks == []
+
+
+@pytest.mark.parametrize(
+    ("mode", "label"),
+    [("filter", "Total recipes scanned (orgURL queryFilter on pruned hosts): 1"), ("reject", "Total recipes scanned: 3")],
+)
+def test_align_labels_query_filtered_scan_count(mode: str, label: str, caplog) -> None:
+    caplog.set_level(logging.INFO, logger="align-test")
+    align_mealie_recipes(
+        mealie_url="https://mealie.local",
+        token="token",
+        timeout=30,
+        allowed_hosts={"keep.example.net"},
+        prune_hosts={"old.example.com"},
+        apply=False,
+        session=FilteringSession(FILTER_RECIPES, mode=mode),
+        logger=logging.getLogger("align-test"),
+        use_query_filter=True,
+    )
+
+    assert any(label in message for message in caplog.messages)
+
+
+def test_iter_recipes_stops_fetching_when_a_page_fails() -> None:
+    requested = []
+
+    class FailingSession:
+        def get(self, url, headers=None, params=None, timeout=None):
+            requested.append(params["page"])
+            status = 403 if params["page"] == 2 else 200
+            payload = {"items": [{"id": str(params["page"]), "slug": "s"}], "total_pages": 200}
+            return SimpleNamespace(status_code=status, raise_for_status=lambda: None, content=json.dumps(payload).encode())
+
+    with pytest.raises(RuntimeError, match="403"):
+        list(iter_recipes("https://mealie.local", "token", 30, session=FailingSession()))
+
+    assert len(requested) <= 2 + 2 * PAGE_FETCH_WORKERS
@@ -0,0 +1,167 @@
+from datetime import datetime, timedelta
+
+import mealie_recipe_dredger.json_utils as json_utils_module
+import mealie_recipe_dredger.storage as storage_module
+from mealie_recipe_dredger.models import RetryEntry, SiteStats
+from mealie_recipe_dredger.storage import StorageManager
+
+
+STATE_FILES = (
+    "REJECT_FILE",
+    "IMPORTED_FILE",
+    "RETRY_FILE",
+    "STATS_FILE",
+    "SITEMAP_CACHE_FILE",
+    "MEALIE_ENDPOINT_CACHE_FILE",
+)
+
+
+def _use_tmp_state_files(monkeypatch, tmp_path):
+    for name in STATE_FILES:
+        monkeypatch.setattr(storage_module, name, tmp_path / f"{name.lower()}.json")
+
+
+def test_state_files_round_trip(monkeypatch, tmp_path):
+    _use_tmp_state_files(monkeypatch, tmp_path)
+
+    storage = StorageManager()
+    storage.add_imported("https://Example.com/Soup/?utm_source=x")
+    storage.cache_import_path("http://mealie.local", "/api/recipes/create/url")
+    storage.cache_sitemap("https://example.com", "https://example.com/sitemap.xml", ["https://example.com/crème"])
+    storage.flush_all()
+
+    reloaded = StorageManager()
+    assert reloaded.imported == storage.imported
+    assert reloaded.get_cached_import_path("http://mealie.local") == "/api/recipes/create/url"
+    assert reloaded.sitemap_cache["https://example.com"]["urls"] == ["https://example.com/crème"]
+
+
+def test_retry_queue_entries_round_trip_through_json(monkeypatch, tmp_path):
+    _use_tmp_state_files(monkeypatch, tmp_path)
+    tmp_path.joinpath("retry_file.json").write_text(
+        '{"https://example.com/a/": {"reason": "Timeout", "attempts": 1},'
+        ' "https://www.example.com/a": {"reason": "HTTP 503", "attempts": "2"}}',
+        encoding="utf-8",
+    )
+
+    storage = StorageManager()
+    assert storage.retry_queue == {"https://example.com/a": RetryEntry(reason="HTTP 503", attempts=2)}
+
+    storage.add_retry("https://example.com/a", "HTTP 429", increment=True)
+    assert storage.retry_attempts("https://example.com/a/") == 3
+    storage.flush_all()
+
+    saved = json_utils_module.loads(tmp_path.joinpath("retry_file.json").read_bytes())
+    assert saved["https://example.com/a"]["reason"] == "HTTP 429"
+    assert saved["https://example.com/a"]["attempts"] == 3
+    assert StorageManager().retry_queue == storage.retry_queue
+
+
+def test_flush_writes_only_changed_files(monkeypatch, tmp_path):
+    _use_tmp_state_files(monkeypatch, tmp_path)
+
+    storage = StorageManager()
+    storage.update_stats("https://example.com", SiteStats(site_url="https://example.com"))
+    storage.flush_all()
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["stats_file.json"]
+
+    storage.flush_all()
+    storage.cache_import_path("http://mealie.local", "/api/recipes/create/url")
+    storage.flush_all()
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "mealie_endpoint_cache_file.json",
+        "stats_file.json",
+    ]
+
+
+def test_flush_replaces_state_files_without_leaving_temp_files(monkeypatch, tmp_path):
+    _use_tmp_state_files(monkeypatch, tmp_path)
+    replaced = []
+    real_replace = json_utils_module.os.replace
+    monkeypatch.setattr(json_utils_module.os, "replace", lambda src, dst: replaced.append(dst) or real_replace(src, dst))
+
+    storage = StorageManager()
+    storage.update_stats("https://example.com", SiteStats(site_url="https://example.com"))
+    storage.flush_all()
+
+    assert replaced == [tmp_path / "stats_file.json"]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["stats_file.json"]
+
+
+def test_sitemap_cache_accepts_epoch_and_legacy_iso_timestamps(monkeypatch, tmp_path):
+    _use_tmp_state_files(monkeypatch, tmp_path)
+
+    storage = StorageManager()
+    storage.cache_sitemap("https://fresh.example", "https://fresh.example/sitemap.xml", ["https://fresh.example/a"])
+    assert isinstance(storage.sitemap_cache["https://fresh.example"]["timestamp"], float)
+    assert storage.get_cached_sitemap("https://fresh.example")["urls"] == ["https://fresh.example/a"]
+
+    storage.sitemap_cache["https://legacy.example"] = {
+        "sitemap_url": "https://legacy.example/sitemap.xml",
+        "urls": [],
+        "timestamp": (datetime.now() - timedelta(days=1)).isoformat(),
+    }
+    storage.sitemap_cache["https://stale.example"] = {
+        "sitemap_url": "https://stale.example/sitemap.xml",
+        "urls": [],
+        "timestamp": (datetime.now() - timedelta(days=storage_module.CACHE_EXPIRY_DAYS + 1)).isoformat(),
+    }
+    assert storage.get_cached_sitemap("https://legacy.example") is not None
+    assert isinstance(storage.sitemap_cache["https://legacy.example"]["timestamp"], float)
+    assert storage.get_cached_sitemap("https://stale.example") is None
+
+
+def test_imported_and_rejects_are_journaled_then_compacted(monkeypatch, tmp_path):
+    _use_tmp_state_files(monkeypatch, tmp_path)
+    snapshot = tmp_path / "imported_file.json"
+    journal = tmp_path / "imported_file.jsonl"
+    snapshot.write_text('["https://example.com/old"]', encoding="utf-8")
+
+    storage = StorageManager()
+    storage.add_imported("https://example.com/new")
+    storage.add_reject("https://example.com/bad")
+    storage.flush_all()
+    assert snapshot.read_text(encoding="utf-8") == '["https://example.com/old"]'
+    assert journal.read_bytes().splitlines() == [b'"https://example.com/new"']
+
+    # A torn trailing line from an interrupted append is ignored on load.
+    with journal.open("ab") as handle:
+        handle.write(b'"https://example.com/par')
+    reloaded = StorageManager()
+    assert reloaded.imported == {"https://example.com/old", "https://example.com/new"}
+    assert reloaded.rejects == {"https://example.com/bad"}
+
+    reloaded.flush_all(compact=True)
+    assert not journal.exists()
+    assert not (tmp_path / "reject_file.jsonl").exists()
+    assert StorageManager().imported == {"https://example.com/old", "https://example.com/new"}
+
+
+def test_auto_flush_triggers_on_elapsed_time(monkeypatch, tmp_path):
+    _use_tmp_state_files(monkeypatch, tmp_path)
+    clock = [100.0]
+    monkeypatch.setattr(storage_module.time, "monotonic", lambda: clock[0])
+
+    storage = StorageManager()
+    storage.add_imported("https://example.com/a")
+    assert not (tmp_path / "imported_file.jsonl").exists()
+
+    clock[0] += storage._flush_interval_seconds
+    storage.add_imported("https://example.com/b")
+    assert (tmp_path / "imported_file.jsonl").read_bytes().count(b"\n") == 2
+
+
+def test_flush_threshold_adapts_to_write_rate(monkeypatch, tmp_path):
+    _use_tmp_state_files(monkeypatch, tmp_path)
+    clock = [100.0]
+    monkeypatch.setattr(storage_module.time, "monotonic", lambda: clock[0])
+    storage = StorageManager()
+
+    for index in range(storage_module.MIN_FLUSH_THRESHOLD):
+        storage.add_imported(f"https://example.com/burst-{index}")
+    assert storage._flush_threshold == storage_module.MIN_FLUSH_THRESHOLD * 2
+
+    for index in range(storage._flush_threshold):
+        clock[0] += 0.25
+        storage.add_imported(f"https://example.com/slow-{index}")
+    assert storage._flush_threshold == storage_module.MIN_FLUSH_THRESHOLD
@@ -1,4 +1,15 @@
-from mealie_recipe_dredger.url_utils import canonicalize_url, has_numeric_suffix, numeric_suffix_value, strip_numeric_suffix
+from urllib.parse import urlparse
+
+import pytest
+
+from mealie_recipe_dredger.url_utils import (
+    canonicalize_url,
+    has_numeric_suffix,
+    numeric_suffix_value,
+    strip_numeric_suffix,
+    url_path,
+    url_slug,
+)
 
 
 def test_canonicalize_url_normalizes_tracking_and_slash():
@@ -11,6 +22,49 @@ def test_canonicalize_url_sorts_query_params():
     assert canonicalize_url(source) == "https://example.com/recipe?a=1&b=2"
 
 
+def test_canonicalize_url_fast_path_matches_full_normalization():
+    canonical = "https://example.com/recipe/chili"
+    assert canonicalize_url(canonical) is canonical
+    for source in (
+        "https://example.com",
+        "https://www.example.com/recipe",
+        "https://example.com/recipe/",
+        "https://example.com//recipe",
+        "https://Example.com/recipe",
+    ):
+        assert canonicalize_url(source) != source
+
+
+def test_canonicalize_url_is_memoized():
+    canonicalize_url.cache_clear()
+    source = "https://www.Example.com/recipe/?utm_source=x"
+    assert canonicalize_url(source) == canonicalize_url(source) == "https://example.com/recipe"
+    assert canonicalize_url.cache_info().hits == 1
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://example.com/recipes/pasta/?utm=1#top",
+        "http://example.com",
+        "https://example.com?q=/a",
+        "https://example.com#frag/x",
+        "https://example.com/photo.jpg;v=2",
+        "https://[::1]/a",
+        "HTTPS://Example.com/Path",
+        "ftp://example.com/file.pdf",
+        "/relative/path?x",
+    ],
+)
+def test_url_path_matches_urlparse(url):
+    assert url_path(url) == urlparse(url).path
+
+
+def test_url_slug_returns_last_path_segment():
+    assert url_slug("https://example.com/2024/05/Lemon-Chicken/?utm=1") == "lemon-chicken"
+    assert url_slug("https://example.com/") == ""
+
+
 def test_strip_numeric_suffix_helpers():
     name = "Zobo Drink (Hibiscus Drink) (12)"
     assert strip_numeric_suffix(name) == "Zobo Drink (Hibiscus Drink)"
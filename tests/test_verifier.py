@@ -1,10 +1,19 @@
+import re
+
 from bs4 import BeautifulSoup
 
-from mealie_recipe_dredger.verifier import RecipeVerifier
+import mealie_recipe_dredger.verifier as verifier_module
+from mealie_recipe_dredger.verifier import (
+    RecipeVerifier,
+    _slug_skip_reason,
+    make_soup,
+    may_contain_recipe,
+    may_contain_recipe_card,
+)
 
 
 class DummySession:
-    def get(self, url, timeout=10):  # pragma: no cover - should not be called in this test
+    def get(self, url, timeout=10, stream=False):  # pragma: no cover - should not be called in this test
         raise AssertionError("Network should not be called for media prefilter")
 
 
@@ -13,13 +22,23 @@ class DummyHttpResponse:
         self.status_code = status_code
         self.text = html
         self.content = html.encode("utf-8")
+        self.headers = {"Content-Type": "text/html; charset=utf-8"}
+        self.encoding = "utf-8"
+        self.closed = False
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start : start + chunk_size]
+
+    def close(self):
+        self.closed = True
 
 
 class DummyHttpSession:
     def __init__(self, html: str, status_code: int = 200):
         self.response = DummyHttpResponse(html=html, status_code=status_code)
 
-    def get(self, url, timeout=10):
+    def get(self, url, timeout=10, stream=False):
         return self.response
 
 
@@ -66,6 +85,181 @@ def test_paranoid_skip_blocks_digest_slug():
     assert reason == "Digest/non-recipe post"
 
 
+def test_paranoid_skip_reports_first_bad_keyword_in_list_order():
+    verifier = RecipeVerifier(DummySession())
+    # "shop" appears first in the slug, but "review" comes first in BAD_KEYWORDS.
+    reason = verifier.is_paranoid_skip("https://example.com/shop-talk-cast-iron-review/")
+    assert reason == "Bad keyword: review"
+
+
+def test_paranoid_skip_keeps_rule_precedence_over_match_position():
+    verifier = RecipeVerifier(DummySession())
+    # The bad keyword matches earlier in the slug, but the listicle rule wins.
+    reason = verifier.is_paranoid_skip("https://example.com/review-best-soups/")
+    assert reason == "Listicle detected: review-best-soups"
+
+
+def test_paranoid_skip_allows_plain_title():
+    verifier = RecipeVerifier(DummySession())
+    soup = BeautifulSoup("<html><head><title>Banana Bread</title></head></html>", "lxml")
+    assert verifier.is_paranoid_skip("https://example.com/banana-bread/", soup=soup) is None
+
+
+def test_verify_recipe_parses_url_path_once(monkeypatch):
+    calls = []
+    real_url_path = verifier_module.url_path
+    monkeypatch.setattr(verifier_module, "url_path", lambda url: calls.append(url) or real_url_path(url))
+    monkeypatch.setattr(verifier_module, "url_slug", None)
+    html = (
+        '<html lang="en"><head><title>Lemon Chicken</title></head><body>'
+        '<div class="wp-recipe-maker">Lemon chicken with garlic and thyme.</div></body></html>'
+    )
+    verifier = RecipeVerifier(DummyHttpSession(html))
+
+    is_recipe, _soup, reason, _transient = verifier.verify_recipe("https://example.com/How-To-Cook-Rice/")
+    assert (is_recipe, reason) == (False, "How-to article")
+    assert calls == ["https://example.com/How-To-Cook-Rice/"]
+
+
+def test_verify_recipe_skips_parsing_pages_without_recipe_markers(monkeypatch):
+    def fail_make_soup(*args, **kwargs):
+        raise AssertionError("pages without recipe markers should not be parsed")
+
+    monkeypatch.setattr(verifier_module, "make_soup", fail_make_soup)
+    verifier = RecipeVerifier(DummyHttpSession("<html><body><p>About us</p></body></html>"))
+
+    assert verifier.verify_recipe("https://example.com/about") == (False, None, "No recipe detected", False)
+
+
+def test_verify_recipe_rejects_from_lxml_signal_without_building_soup(monkeypatch):
+    def fail_make_soup(*args, **kwargs):
+        raise AssertionError("schema-only rejections should not build a soup")
+
+    monkeypatch.setattr(verifier_module, "make_soup", fail_make_soup)
+    html = '<html><body><a href="/recipes">All recipes</a><script type="application/ld+json">{"@type":"Recipe"}</script></body></html>'
+    verifier = RecipeVerifier(DummyHttpSession(html))
+
+    assert verifier.verify_recipe("https://example.com/about") == (False, None, "Weak recipe schema", False)
+
+
+def test_fill_body_stops_reading_at_byte_cap():
+    chunks = iter([b"x" * 100] * 10)
+    buffer = bytearray()
+
+    assert verifier_module.fill_body(buffer, chunks, max_bytes=300) is True
+    assert buffer == b"x" * 300
+    assert len(list(chunks)) == 7
+
+
+def test_verify_recipe_closes_error_response_without_reading_body(monkeypatch):
+    session = DummyHttpSession("<html>recipe</html>", status_code=503)
+    monkeypatch.setattr(session.response, "iter_content", None)
+    verifier = RecipeVerifier(session)
+
+    assert verifier.verify_recipe("https://example.com/soup") == (False, None, "HTTP 503", True)
+    assert session.response.closed
+
+
+def test_verify_recipe_without_language_filter_reads_title_from_lxml(monkeypatch):
+    def fail_make_soup(*args, **kwargs):
+        raise AssertionError("no soup is needed when language filtering is off")
+
+    monkeypatch.setattr(verifier_module, "make_soup", fail_make_soup)
+    monkeypatch.setattr(verifier_module, "LANGUAGE_FILTER_ENABLED", False)
+    card = '<div class="wprm-recipe wp-recipe-maker">Soup</div>'
+    listicle = f"<html><head><title>28 Best Soup Recipes</title></head><body>{card}</body></html>"
+    plain = f"<html><head><title>Tomato Soup</title></head><body>{card}</body></html>"
+
+    assert RecipeVerifier(DummyHttpSession(listicle)).verify_recipe("https://example.com/soup") == (
+        False,
+        None,
+        "Listicle title",
+        False,
+    )
+    assert RecipeVerifier(DummyHttpSession(plain)).verify_recipe("https://example.com/soup") == (True, None, None, False)
+
+
+class CountingHttpResponse(DummyHttpResponse):
+    def __init__(self, html: str):
+        super().__init__(html)
+        self.bytes_read = 0
+
+    def iter_content(self, chunk_size=1):
+        for chunk in super().iter_content(chunk_size):
+            self.bytes_read += len(chunk)
+            yield chunk
+
+
+def _recipe_head_page(ingredients: str, body: str) -> str:
+    schema = '{"@type": "Recipe", "name": "Tomato Soup", "recipeIngredient": %s}' % ingredients
+    return (
+        '<html lang="en"><head><title>Tomato Soup</title>'
+        f'<script type="application/ld+json">{schema}</script></head>'
+        f"<body>{body}</body></html>"
+    )
+
+
+def test_verify_recipe_stops_reading_once_recipe_head_is_complete(monkeypatch):
+    monkeypatch.setattr(verifier_module, "VERIFY_CHUNK_BYTES", 256)
+    session = DummyHttpSession("")
+    session.response = CountingHttpResponse(_recipe_head_page('["2 tomatoes"]', "<p>Filler text.</p>" * 2000))
+    verifier = RecipeVerifier(session)
+
+    is_recipe, _soup, reason, _transient = verifier.verify_recipe("https://example.com/tomato-soup")
+    assert (is_recipe, reason) == (True, None)
+    assert session.response.bytes_read < len(session.response.content) // 10
+
+
+def test_verify_recipe_reads_rest_of_page_when_prefix_is_rejected(monkeypatch):
+    monkeypatch.setattr(verifier_module, "VERIFY_CHUNK_BYTES", 256)
+    body = "<p>Filler text.</p>" * 200 + '<div class="wp-recipe-maker">Tomato soup card</div>'
+    session = DummyHttpSession("")
+    session.response = CountingHttpResponse(_recipe_head_page("[]", body))
+    verifier = RecipeVerifier(session)
+
+    is_recipe, _soup, reason, _transient = verifier.verify_recipe("https://example.com/tomato-soup")
+    assert (is_recipe, reason) == (True, None)
+    assert session.response.bytes_read == len(session.response.content)
+
+
+def test_schema_signal_skips_blocks_without_recipe_but_honours_escapes(monkeypatch):
+    decoded = []
+    real_loads = verifier_module.json_utils.loads
+    monkeypatch.setattr(verifier_module.json_utils, "loads", lambda raw: decoded.append(raw) or real_loads(raw))
+    verifier = RecipeVerifier(DummySession())
+
+    organization = '{"@type": "Organization", "name": "Example"}'
+    escaped = '{"@type": "\\u0052ECIPE", "name": "Egg"}'
+    assert verifier._schema_signal_from_scripts([organization, escaped]) == (True, False)
+    assert decoded == [escaped]
+
+
+def test_verify_recipes_batch_yields_results_in_input_order(monkeypatch):
+    verifier = RecipeVerifier(DummySession())
+    fetched = []
+    monkeypatch.setattr(verifier, "verify_recipe", lambda url: (url.endswith("/0"), None, None, False))
+
+    urls = [f"https://example.com/{index}" for index in range(20)]
+    results = list(verifier.verify_recipes_batch(urls, max_workers=4, before_fetch=fetched.append))
+
+    assert [url for url, _result in results] == urls
+    assert [result[0] for _url, result in results] == [index == 0 for index in range(20)]
+    assert sorted(fetched) == sorted(urls)
+
+
+def test_may_contain_recipe_markers():
+    assert may_contain_recipe(b'<script>{"@type": "RECIPE"}</script>')
+    assert may_contain_recipe(b'<div class="mv-create-card">')
+    assert may_contain_recipe("<p>x</p>".encode("utf-16"))
+    assert not may_contain_recipe(b"<p>About us</p>")
+
+
+def test_may_contain_recipe_card_markers():
+    assert may_contain_recipe_card(b'<div class="wprm wp-recipe-maker">')
+    assert not may_contain_recipe_card(b'<div class="post">Recipe</div>')
+    assert may_contain_recipe_card("<div>recipe</div>".encode("utf-16"))
+
+
 def test_verify_recipe_rejects_weak_recipe_schema():
     html = """
     <html lang="en">
@@ -139,3 +333,38 @@ def test_verify_recipe_rejects_spanish_text_without_lang_attribute():
     assert is_recipe is False
     assert reason == "Language mismatch: es"
     assert transient is False
+
+
+def test_make_soup_uses_lxml_and_header_charset():
+    html = "<html><head><title>Crème brûlée</title></head></html>"
+
+    soup = make_soup(html.encode("latin-1"), "text/html; charset=ISO-8859-1")
+
+    assert soup.builder.NAME == "lxml"
+    assert soup.title.string == "Crème brûlée"
+
+
+def test_is_paranoid_skip_memoizes_slug_verdicts():
+    verifier = RecipeVerifier(DummySession())
+    _slug_skip_reason.cache_clear()
+    url = "https://example.com/25-best-chicken-recipes/"
+    first = verifier.is_paranoid_skip(url)
+    assert first and first.startswith("Listicle detected")
+    assert verifier.is_paranoid_skip(url) == first
+    assert _slug_skip_reason.cache_info().hits == 1
+
+
+def test_verify_recipe_rejects_listicle_slug_before_fetch():
+    verifier = RecipeVerifier(DummySession())
+    is_recipe, soup, reason, transient = verifier.verify_recipe("https://example.com/25-best-chicken-recipes/")
+    assert not is_recipe and soup is None and not transient
+    assert reason.startswith("Listicle detected")
+
+
+def test_slug_skip_reason_tolerates_gate_over_match(monkeypatch):
+    monkeypatch.setattr(verifier_module, "SLUG_SKIP_RE", re.compile("soup"))
+    _slug_skip_reason.cache_clear()
+    try:
+        assert _slug_skip_reason("/chicken-soup/") is None
+    finally:
+        _slug_skip_reason.cache_clear()
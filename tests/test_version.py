@@ -0,0 +1,24 @@
+from importlib import metadata
+from pathlib import Path
+
+import mealie_recipe_dredger.version as version_module
+
+
+def test_read_version_uses_version_file():
+    expected = (Path(__file__).resolve().parents[1] / "VERSION").read_text(encoding="utf-8").strip()
+    assert version_module.read_version() == expected
+
+
+def test_read_version_falls_back_to_package_metadata(monkeypatch):
+    monkeypatch.setattr(version_module, "__file__", "/nonexistent/src/mealie_recipe_dredger/version.py")
+    monkeypatch.setattr(version_module.metadata, "version", lambda name: "9.9.9")
+    assert version_module.read_version() == "9.9.9"
+
+
+def test_read_version_defaults_when_not_installed(monkeypatch):
+    def missing(name):
+        raise metadata.PackageNotFoundError(name)
+
+    monkeypatch.setattr(version_module, "__file__", "/nonexistent/src/mealie_recipe_dredger/version.py")
+    monkeypatch.setattr(version_module.metadata, "version", missing)
+    assert version_module.read_version() == "0.0.0"